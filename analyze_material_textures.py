@@ -10,6 +10,20 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from art_resource_manager import ResourceDependencyAnalyzer
 
+# 更全面的贴图引用模式（模块加载时编译一次）
+_RAW_TEXTURE_PATTERNS = (
+    (r'texture:\s*{fileID:\s*\d+,\s*guid:\s*([a-f0-9]{32})', "标准贴图引用"),
+    (r'texture:\s*{fileID:\s*0,\s*guid:\s*([a-f0-9]{32})', "fileID为0的贴图引用"),
+    (r'texture:\s*{guid:\s*([a-f0-9]{32})', "只有guid的贴图引用"),
+    (r'texture:\s*{.*?guid:\s*([a-f0-9]{32})', "任意内容的贴图引用"),
+    (r'm_Texture:\s*{fileID:\s*\d+,\s*guid:\s*([a-f0-9]{32})', "m_Texture引用"),
+    (r'm_Texture:\s*{guid:\s*([a-f0-9]{32})', "m_Texture只有guid"),
+    (r'texture2D:\s*{fileID:\s*\d+,\s*guid:\s*([a-f0-9]{32})', "texture2D引用"),
+    (r'texture2D:\s*{guid:\s*([a-f0-9]{32})', "texture2D只有guid"),
+)
+TEXTURE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE | re.DOTALL), desc)
+                         for pattern, desc in _RAW_TEXTURE_PATTERNS)
+
 def analyze_material_textures():
     """专门分析材质文件中的贴图引用"""
     
@@ -58,21 +72,9 @@ def analyze_material_textures():
         # 2. 查找所有可能的贴图引用
         print(f"\n🔍 步骤2: 查找贴图引用...")
         
-        # 更全面的贴图引用模式
-        texture_patterns = [
-            (r'texture:\s*{fileID:\s*\d+,\s*guid:\s*([a-f0-9]{32})', "标准贴图引用"),
-            (r'texture:\s*{fileID:\s*0,\s*guid:\s*([a-f0-9]{32})', "fileID为0的贴图引用"),
-            (r'texture:\s*{guid:\s*([a-f0-9]{32})', "只有guid的贴图引用"),
-            (r'texture:\s*{.*?guid:\s*([a-f0-9]{32})', "任意内容的贴图引用"),
-            (r'm_Texture:\s*{fileID:\s*\d+,\s*guid:\s*([a-f0-9]{32})', "m_Texture引用"),
-            (r'm_Texture:\s*{guid:\s*([a-f0-9]{32})', "m_Texture只有guid"),
-            (r'texture2D:\s*{fileID:\s*\d+,\s*guid:\s*([a-f0-9]{32})', "texture2D引用"),
-            (r'texture2D:\s*{guid:\s*([a-f0-9]{32})', "texture2D只有guid"),
-        ]
-        
         found_textures = {}
-        for pattern, desc in texture_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
+        for pattern, desc in TEXTURE_PATTERNS:
+            matches = pattern.findall(content)
             for match in matches:
                 guid = match.lower()
                 if guid not in found_textures:
@@ -6,10 +6,14 @@ import os
 import json
 import yaml
 import re
+import mmap
 import subprocess
 import shutil
 import time
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Any
 
@@ -23,6 +27,222 @@ else:
 def debug_print(msg):
     print(f"DEBUG: {msg}")
 
+
+def iter_folder_files(folder_path: str, suffix: str = None):
+    """基于os.scandir递归遍历文件夹，逐个产出文件路径
+    
+    遍历顺序与os.walk一致（先当前目录文件，再依次进入子目录），但复用
+    scandir返回的DirEntry类型信息，避免对每个条目再次stat。
+    指定suffix时只产出文件名以该后缀结尾的文件（按文件名过滤，不额外stat）。
+    """
+    pending_dirs = [folder_path]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                sub_dirs = []
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # 与os.walk默认行为一致：不进入符号链接目录
+                        if not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                    elif suffix is None or entry.name.endswith(suffix):
+                        yield entry.path
+        except OSError:
+            continue
+        # 逆序入栈，保证子目录按scandir顺序被访问
+        pending_dirs.extend(reversed(sub_dirs))
+
+
+# GUID全量扫描的并发线程数（读取meta文件以I/O为主，网络盘上并发收益明显）
+GUID_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# 逐条输出路径映射过程（每个文件检查/推送都会调用映射，默认关闭；设置环境变量PATHMAP_DEBUG=1开启）
+PATH_MAPPING_VERBOSE = os.environ.get('PATHMAP_DEBUG') == '1'
+
+# meta文件GUID解析：按字节匹配，先只检查文件头META_GUID_HEAD_SIZE字节
+META_YAML_GUID_RE = re.compile(rb'guid:\s*([a-f0-9]{32})', re.IGNORECASE)
+META_JSON_GUID_RE = re.compile(rb'"m_GUID":\s*"([a-f0-9]{32})"', re.IGNORECASE)
+META_GUID_HEAD_SIZE = 256
+
+# 材质模板检查范围：路径中第一个entity目录（忽略大小写），但排除entity/Environment/Scenes
+ENTITY_DIR_RE = re.compile(r'(?:^|[\\/])entity[\\/]', re.IGNORECASE)
+ENTITY_EXCLUDED_RE = re.compile(r'environment[\\/]+scenes(?:[\\/]|$)', re.IGNORECASE)
+
+# 允许的材质模板列表（材质模板检查使用）
+ALLOWED_MATERIAL_TEMPLATES = frozenset({
+    # 角色和场景模板
+    'Character_NPR_Opaque.templatemat',
+    'Character_NPR_Masked.templatemat',
+    'Character_NPR_Tranclucent.templatemat',
+    'Character_AVATAR_Masked.templatemat',
+    'Character_AVATAR_Opaque.templatemat',
+    'Character_AVATAR_Tranclucent.templatemat',
+    'Character_PBR_Opaque.templatemat',
+    'Character_PBR_Translucent.templatemat',
+    'Scene_Prop_Opaque.templatemat',
+    'Scene_Prop_Tranclucent.templatemat',
+    'Scene_Prop_Masked.templatemat',
+    'Sight.templatemat',
+    
+    # 特效模板
+    'fx_basic_ADD.templatemat',
+    'fx_basic_fire.templatemat',
+    'fx_basic_TRANSLUCENT.templatemat',
+    'fx_dissolve_ADD.templatemat',
+    'fx_dissolve_fresnel_ADD.templatemat',
+    'fx_dissolve_fresnel_TRANSLUCENT.templatemat',
+    'fx_dissolve_fresneluvwarp_ADD.templatemat',
+    'fx_dissolve_fresneluvwarp_TRANSLUCENT.templatemat',
+    'fx_dissolve_TRANSLUCENT.templatemat',
+    'fx_dissolve_uvwarp_ADD.templatemat',
+    'fx_dissolve_uvwarp_Fire_ADD.templatemat',
+    'fx_dissolve_uvwarp_Fire_TRANSLUCENT.templatemat',
+    'fx_dissolve_uvwarp_TRANSLUCENT.templatemat',
+    'fx_dissolve_vertexesoffsetWithMask_ADD.templatemat',
+    'fx_dissolve_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
+    'fx_fresnel_ADD.templatemat',
+    'fx_fresnel_TRANSLUCENT.templatemat',
+    'fx_uvwarp_ADD.templatemat',
+    'fx_uvwarp_TRANSLUCENT.templatemat',
+    'fx_vertexesoffset_ADD.templatemat',
+    'fx_vertexesoffset_TRANSLUCENT.templatemat',
+    'fx_vertexesoffsetWithMask_ADD.templatemat',
+    'fx_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
+    'PolarDistortion.templatemat',
+    'standard_particle_additive.templatemat',
+    'standard_particle_translucent.templatemat'
+})
+
+# 材质模板引用模式（按字节匹配，材质文件可直接mmap后扫描，无需解码）
+TEMPLATE_REF_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # 直接的templatemat引用
+    rb'templatemat:\s*([^\s\n]+\.templatemat)',
+    # template引用
+    rb'template:\s*([^\s\n]+\.templatemat)',
+    # 任何.templatemat文件引用
+    rb'([A-Za-z_][A-Za-z0-9_]*\.templatemat)',
+    # JSON格式的templatemat引用
+    rb'"templatemat":\s*"([^"]+\.templatemat)"',
+    # 其他可能的格式
+    rb'templatemat["\']?\s*[:=]\s*["\']?([^"\'\s\n]+\.templatemat)',
+))
+TEMPLATE_GUID_RE = re.compile(rb'guid:\s*([a-f0-9]{32})', re.IGNORECASE)
+# 以上模板引用模式都要求出现.templatemat，先用一次字面量扫描判断，不包含时无需逐个模式扫描
+TEMPLATE_EXT_RE = re.compile(rb'\.templatemat', re.IGNORECASE)
+
+
+def find_template_references(content) -> List[str]:
+    """查找材质文件中的模板引用
+    
+    content可以是str，也可以是bytes/mmap等字节内容（按字节匹配，仅解码命中的名称）。
+    """
+    template_references = []
+    
+    try:
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        # 使用多种模式查找模板引用
+        found_templates = set()
+        patterns = TEMPLATE_REF_PATTERNS if TEMPLATE_EXT_RE.search(content) else ()
+        for pattern in patterns:
+            matches = pattern.findall(content)
+            for match in matches:
+                template_name = match.decode('utf-8', errors='ignore').strip().strip('"\'')
+                if template_name and template_name.endswith('.templatemat'):
+                    found_templates.add(template_name)
+        
+        # 转换为列表
+        template_references = list(found_templates)
+        
+        # 如果还没找到，查找可能的GUID引用（作为备选方案）
+        if not template_references:
+            guid_matches = TEMPLATE_GUID_RE.findall(content)
+            
+            for guid in guid_matches:
+                # 标记为GUID引用，以便后续处理
+                template_references.append(f"TEMPLATE_GUID:{guid.decode('ascii')}")
+        
+    except Exception as e:
+        debug_print(f"查找模板引用失败: {str(e)}")
+    
+    return template_references
+
+
+@lru_cache(maxsize=4096)
+def _read_template_references(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """读取材质文件中的模板引用，按(路径, 修改时间, 大小)缓存
+    
+    重复检查时未修改的材质文件直接复用上次结果，无需再次扫描。
+    """
+    if size == 0:
+        return ()  # 空文件无法mmap，也不含模板引用
+    with open(file_path, 'rb') as f:
+        # 以只读mmap方式交给字节正则扫描，避免整文件解码
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return tuple(find_template_references(content))
+
+
+def _meta_file_contains_guid(file_path: str, needle: bytes) -> bool:
+    """判断meta文件内容中是否包含指定GUID（needle为编码后的字节串，直接按字节匹配，无需解码）
+    
+    逐行读取，找到后立即返回；Unity的meta文件GUID通常在第二行，无需读完整个文件。
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            for line in f:
+                if needle in line:
+                    return True
+        return False
+    except Exception:
+        return False
+
+
+def _scan_meta_file(meta_path: str, needle: bytes):
+    """读取一次meta文件，返回 (文件自身的GUID, 内容中是否包含needle)"""
+    try:
+        with open(meta_path, 'rb') as f:
+            content = f.read()
+    except Exception:
+        return None, False
+    match = META_YAML_GUID_RE.search(content) or META_JSON_GUID_RE.search(content)
+    own_guid = match.group(1).decode('ascii').lower() if match else None
+    return own_guid, needle in content
+
+
+def build_meta_guid_index(root_path: str, guid: str) -> Tuple[Dict[str, List[str]], List[str]]:
+    """并发扫描root_path下所有.meta文件，每个文件只读取一次
+    
+    同时建立 {guid: [meta文件路径]} 索引，并收集内容中包含指定GUID的文件路径（保持遍历顺序）。
+    """
+    needle = guid.encode('utf-8')
+    meta_files = list(iter_folder_files(root_path, '.meta'))
+    guid_index = {}
+    found_files = []
+    with ThreadPoolExecutor(max_workers=GUID_SCAN_WORKERS) as executor:
+        results = executor.map(lambda path: _scan_meta_file(path, needle), meta_files)
+        for meta_path, (own_guid, matched) in zip(meta_files, results):
+            if own_guid:
+                guid_index.setdefault(own_guid, []).append(meta_path)
+            if matched:
+                found_files.append(meta_path)
+    return guid_index, found_files
+
+
+def search_guid_in_meta_files(root_path: str, guid: str) -> List[str]:
+    """并发扫描root_path下所有.meta文件，返回包含指定GUID的文件路径（保持遍历顺序）"""
+    needle = guid.encode('utf-8')
+    meta_files = list(iter_folder_files(root_path, '.meta'))
+    with ThreadPoolExecutor(max_workers=GUID_SCAN_WORKERS) as executor:
+        matches = executor.map(lambda path: _meta_file_contains_guid(path, needle), meta_files)
+        return [path for path, matched in zip(meta_files, matches) if matched]
+
+
 try:
     debug_print("开始导入PyQt5...")
     from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
@@ -65,6 +285,8 @@ class ResourceDependencyAnalyzer:
             '.prefab', '.mat', '.controller', '.anim', '.asset', 
             '.unity', '.fbx', '.png', '.jpg', '.jpeg', '.tga', '.psd'
         }
+        # 供str.endswith一次性匹配所有扩展名
+        self.editor_extension_suffixes = tuple(self.editor_extensions)
         
         # 着色器GUID映射
         self.common_shader_guids = {
@@ -83,18 +305,23 @@ class ResourceDependencyAnalyzer:
     def parse_meta_file(self, meta_path: str) -> str:
         """解析meta文件获取GUID"""
         try:
-            with open(meta_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            with open(meta_path, 'rb') as f:
+                # Unity的meta文件GUID通常在前几行，先只读文件头按字节匹配，不解码整个文件
+                content = f.read(META_GUID_HEAD_SIZE)
+                yaml_match = META_YAML_GUID_RE.search(content)
+                if yaml_match:
+                    return yaml_match.group(1).decode('ascii').lower()
+                content += f.read()
                 
                 # 支持YAML格式 - guid: xxxxx
-                yaml_match = re.search(r'guid:\s*([a-f0-9]{32})', content, re.IGNORECASE)
+                yaml_match = META_YAML_GUID_RE.search(content)
                 if yaml_match:
-                    return yaml_match.group(1).lower()
+                    return yaml_match.group(1).decode('ascii').lower()
                 
                 # 支持JSON格式 - "m_GUID": "xxxxx" (字符串形式)
-                json_match = re.search(r'"m_GUID":\s*"([a-f0-9]{32})"', content, re.IGNORECASE)
+                json_match = META_JSON_GUID_RE.search(content)
                 if json_match:
-                    return json_match.group(1).lower()
+                    return json_match.group(1).decode('ascii').lower()
                 
                 # 忽略对象形式的GUID (如 "m_GUID": { "data[0]": ... })
                 # 这种格式我们选择忽略，不进行处理
@@ -366,18 +593,28 @@ class ResourceDependencyAnalyzer:
         
         return ""
     
-    def _scan_directory_for_guids(self, directory: str, guid_map: Dict[str, str]):
-        """扫描目录中的所有meta文件，建立GUID映射"""
+    def _scan_directory_for_guids(self, directory: str, guid_map: Dict[str, str], wanted: Set[str] = None):
+        """扫描目录中的所有meta文件，建立GUID映射
+        
+        指定wanted时只记录其中的GUID，并在全部找到后立即停止扫描。
+        """
+        remaining = set(wanted) if wanted is not None else None
+        if remaining is not None and not remaining:
+            return
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if file.endswith('.meta'):
-                        meta_path = os.path.join(root, file)
-                        guid = self.parse_meta_file(meta_path)
-                        if guid:
-                            # 计算对应的资源文件路径
-                            resource_path = meta_path[:-5]  # 移除.meta后缀
-                            guid_map[guid] = resource_path
+            for meta_path in iter_folder_files(directory, '.meta'):
+                guid = self.parse_meta_file(meta_path)
+                if not guid:
+                    continue
+                if remaining is not None:
+                    if guid not in remaining:
+                        continue
+                    remaining.discard(guid)
+                # 计算对应的资源文件路径
+                resource_path = meta_path[:-5]  # 移除.meta后缀
+                guid_map[guid] = resource_path
+                if remaining is not None and not remaining:
+                    break
         except Exception as e:
             print(f"❌ 扫描目录失败 {directory}: {e}")
     
@@ -466,7 +703,7 @@ class ResourceDependencyAnalyzer:
                                     print(f"🔍 [DEBUG] 添加依赖meta文件: {os.path.basename(dep_meta)}")
                                 
                                 # 如果是材质文件，添加到递归分析列表
-                                if dep_file.lower().endswith('.mat'):
+                                if dep_file[-4:].lower() == '.mat':
                                     recursive_deps.append(dep_file)
                                     print(f"🔍 [DEBUG] 添加到递归分析: {os.path.basename(dep_file)}")
                             else:
@@ -530,7 +767,7 @@ class ResourceDependencyAnalyzer:
             for file_path in all_files:
                 if file_path.endswith('.meta'):
                     report['files']['meta_files'].append(file_path)
-                elif any(file_path.lower().endswith(ext) for ext in self.editor_extensions):
+                elif file_path.lower().endswith(self.editor_extension_suffixes):
                     report['files']['asset_files'].append(file_path)
                 else:
                     report['files']['other_files'].append(file_path)
@@ -619,7 +856,7 @@ class ResourceDependencyAnalyzer:
         """获取所有文件的依赖关系"""
         all_deps = {}
         for file_path in file_paths:
-            if any(file_path.lower().endswith(ext) for ext in self.editor_extensions):
+            if file_path.lower().endswith(self.editor_extension_suffixes):
                 deps = self.parse_editor_asset(file_path)
                 if deps:
                     all_deps[file_path] = deps
@@ -1472,6 +1709,7 @@ class GitSvnManager:
         # 🎯 路径映射配置系统
         self.path_mapping_enabled = True
         self.path_mapping_rules = self._load_default_mapping_rules()
+        self._compiled_mapping_rules = None  # 按优先级排序并预编译的启用规则，规则变化时置空
         self._load_path_mapping_config()
         
         # 🔧 CRLF自动修复器
@@ -1537,6 +1775,7 @@ class GitSvnManager:
             # 直接使用内置规则，不再依赖外部JSON文件
             self.path_mapping_enabled = True
             self.path_mapping_rules = self._load_default_mapping_rules()
+            self._compiled_mapping_rules = None
             
             print(f"📋 [CONFIG] 使用内置路径映射配置: {len(self.path_mapping_rules)} 条规则")
             
@@ -1550,6 +1789,7 @@ class GitSvnManager:
             print(f"❌ [CONFIG] 加载内置路径映射配置失败: {e}")
             print(f"📋 [CONFIG] 使用默认配置")
             self.path_mapping_rules = self._load_default_mapping_rules()
+            self._compiled_mapping_rules = None
     
     def _save_path_mapping_config(self):
         """保存路径映射配置（已弃用，现在使用内置配置）"""
@@ -1567,48 +1807,37 @@ class GitSvnManager:
             str: 映射后的路径，如 "Assets\\Resources\\minigame\\entity\\100060\\..."
         """
         if not self.path_mapping_enabled:
-            print(f"   ⏸️ 路径映射已禁用，使用原始路径")
+            if PATH_MAPPING_VERBOSE:
+                print(f"   ⏸️ 路径映射已禁用，使用原始路径")
             return assets_path
-            
-        print(f"🔄 [MAPPING] ========== 路径映射处理 ==========")
-        print(f"   原始路径: {assets_path}")
         
-        # 按优先级排序规则
-        sorted_rules = sorted(
-            [(rule_id, rule) for rule_id, rule in self.path_mapping_rules.items() if rule.get('enabled', True)],
-            key=lambda x: x[1].get('priority', 999)
-        )
+        if PATH_MAPPING_VERBOSE:
+            print(f"🔄 [MAPPING] ========== 路径映射处理 ==========")
+            print(f"   原始路径: {assets_path}")
         
-        for rule_id, rule in sorted_rules:
+        for rule_id, rule, compiled_pattern in self._get_compiled_mapping_rules():
             try:
-                import re
-                source_pattern = rule['source_pattern']
                 target_pattern = rule['target_pattern']
                 
-                if re.match(source_pattern, assets_path):
+                match = compiled_pattern.match(assets_path)
+                if match:
                     # 应用映射规则 - 使用更精确的替换
                     # 先匹配到entity部分，然后替换为目标路径 + 剩余路径
-                    match = re.match(source_pattern, assets_path)
-                    if match:
-                        # 获取匹配的部分长度
-                        matched_part = match.group(0)
-                        remaining_path = assets_path[len(matched_part):].lstrip('\\/')
-                        
-                        # 构建映射后的路径
-                        if remaining_path:
-                            mapped_path = target_pattern + remaining_path
-                        else:
-                            mapped_path = target_pattern.rstrip('\\')
+                    remaining_path = assets_path[match.end():].lstrip('\\/')
+                    
+                    # 构建映射后的路径
+                    if remaining_path:
+                        mapped_path = target_pattern + remaining_path
                     else:
-                        # 兜底：使用简单替换
-                        mapped_path = re.sub(source_pattern, target_pattern, assets_path)
+                        mapped_path = target_pattern.rstrip('\\')
                     
-                    print(f"   ✅ 匹配规则: {rule['name']}")
-                    print(f"   📝 规则描述: {rule['description']}")
-                    print(f"   🔍 匹配模式: {source_pattern}")
-                    print(f"   🎯 替换模式: {target_pattern}")
-                    print(f"   🔄 映射结果: {mapped_path}")
-                    print(f"   ==========================================")
+                    if PATH_MAPPING_VERBOSE:
+                        print(f"   ✅ 匹配规则: {rule['name']}")
+                        print(f"   📝 规则描述: {rule['description']}")
+                        print(f"   🔍 匹配模式: {rule['source_pattern']}")
+                        print(f"   🎯 替换模式: {target_pattern}")
+                        print(f"   🔄 映射结果: {mapped_path}")
+                        print(f"   ==========================================")
                     
                     return mapped_path
                     
@@ -1616,10 +1845,29 @@ class GitSvnManager:
                 print(f"   ❌ 规则 {rule_id} 处理失败: {e}")
                 continue
         
-        print(f"   ⚠️ 没有匹配的映射规则，使用原始路径")
-        print(f"   ==========================================")
+        if PATH_MAPPING_VERBOSE:
+            print(f"   ⚠️ 没有匹配的映射规则，使用原始路径")
+            print(f"   ==========================================")
         return assets_path
     
+    def _get_compiled_mapping_rules(self) -> List[Tuple[str, dict, Any]]:
+        """返回按优先级排序、源模式已预编译的启用规则 [(rule_id, rule, compiled_pattern)]
+        
+        结果缓存到规则被修改为止；源模式不是合法正则的规则会被跳过。
+        """
+        if self._compiled_mapping_rules is None:
+            compiled_rules = []
+            for rule_id, rule in self.path_mapping_rules.items():
+                if not rule.get('enabled', True):
+                    continue
+                try:
+                    compiled_rules.append((rule_id, rule, re.compile(rule['source_pattern'])))
+                except (re.error, KeyError, TypeError) as e:
+                    print(f"   ❌ 规则 {rule_id} 处理失败: {e}")
+            compiled_rules.sort(key=lambda item: item[1].get('priority', 999))
+            self._compiled_mapping_rules = compiled_rules
+        return self._compiled_mapping_rules
+    
     def get_path_mapping_rules(self) -> dict:
         """获取当前路径映射规则"""
         return self.path_mapping_rules.copy()
@@ -1627,17 +1875,20 @@ class GitSvnManager:
     def update_path_mapping_rule(self, rule_id: str, rule_data: dict):
         """更新路径映射规则（运行时修改，重启后恢复默认）"""
         self.path_mapping_rules[rule_id] = rule_data
+        self._compiled_mapping_rules = None
         print(f"📝 [CONFIG] 更新映射规则: {rule_id} (运行时修改)")
     
     def add_path_mapping_rule(self, rule_id: str, rule_data: dict):
         """添加新的路径映射规则（运行时添加，重启后恢复默认）"""
         self.path_mapping_rules[rule_id] = rule_data
+        self._compiled_mapping_rules = None
         print(f"➕ [CONFIG] 添加映射规则: {rule_id} (运行时添加)")
     
     def remove_path_mapping_rule(self, rule_id: str):
         """删除路径映射规则（运行时删除，重启后恢复默认）"""
         if rule_id in self.path_mapping_rules:
             del self.path_mapping_rules[rule_id]
+            self._compiled_mapping_rules = None
             print(f"🗑️ [CONFIG] 删除映射规则: {rule_id} (运行时删除)")
     
     def set_path_mapping_enabled(self, enabled: bool):
@@ -1713,6 +1964,10 @@ class GitSvnManager:
     
     def set_paths(self, git_path: str, svn_path: str):
         """设置Git和SVN路径"""
+        # 路径未变化时无需重复清缓存和重建CRLF修复器（各操作入口都会调用本方法）
+        if self.git_path == git_path and self.svn_path == svn_path:
+            return
+        
         # 如果路径发生变化，清除缓存
         if self.git_path != git_path:
             self._clear_branch_cache()
@@ -3256,6 +3511,15 @@ class ResourceChecker(QThread):
     detailed_report = pyqtSignal(dict)
     git_sync_required = pyqtSignal(dict)  # 新增：Git同步需求信号
     
+    # 逐文件检查使用的线程数（检查以文件I/O为主）
+    _MAX_WORKERS = os.cpu_count() or 4
+    
+    # 逐文件进度/状态信号的最小发送间隔（秒），避免跨线程信号刷屏导致界面卡顿
+    _EMIT_INTERVAL = 0.05
+    
+    # 不阻塞推送的问题类型（警告/信息）
+    _NON_BLOCKING_TYPES = frozenset({'meta_missing_git', 'guid_file_update', 'no_template_found'})
+    
     def __init__(self, upload_files, git_manager, target_directory, folder_upload_modes=None):
         super().__init__()
         self.upload_files = upload_files
@@ -3264,6 +3528,11 @@ class ResourceChecker(QThread):
         self.folder_upload_modes = folder_upload_modes or {}
         self.analyzer = ResourceDependencyAnalyzer()
         
+        # 信号节流状态
+        self._last_progress_emit = 0.0
+        self._last_status_emit = 0.0
+        self._pending_status = []
+        
         # 需要检查GUID引用的文件类型（按优先级排序）
         self.high_priority_types = {'.mat', '.controller', '.prefab'}  # 复杂GUID引用
         self.medium_priority_types = {'.asset'}  # 可能有引用
@@ -3302,7 +3571,7 @@ class ResourceChecker(QThread):
             # 1. Meta文件检查
             self.status_updated.emit("检查Meta文件...")
             self.progress_updated.emit(8)
-            meta_issues = self._check_meta_files()
+            meta_issues = self._check_meta_files(progress_range=(8, 25))
             all_issues.extend(meta_issues)
             
             # 2. 中文字符检查
@@ -3314,7 +3583,7 @@ class ResourceChecker(QThread):
             # 3. 图片尺寸检查
             self.status_updated.emit("检查图片尺寸...")
             self.progress_updated.emit(40)
-            image_issues = self._check_image_sizes()
+            image_issues = self._check_image_sizes(progress_range=(40, 55))
             all_issues.extend(image_issues)
             
             # 4. GUID一致性检查
@@ -3347,26 +3616,33 @@ class ResourceChecker(QThread):
             
             self.progress_updated.emit(100)
             
-            # 区分阻塞性错误和警告/信息
+            # 区分阻塞性错误和警告/信息（单次遍历计数）
             # meta_missing_git 和 guid_file_update 类型的问题是警告/信息，不阻塞推送操作
-            non_blocking_types = {'meta_missing_git', 'guid_file_update', 'no_template_found'}
-            blocking_issues = [issue for issue in all_issues if issue.get('type') not in non_blocking_types]
-            warning_issues = [issue for issue in all_issues if issue.get('type') in non_blocking_types]
+            blocking_count = 0
+            warning_count = 0
+            file_updates = 0
+            for issue in all_issues:
+                issue_type = issue.get('type')
+                if issue_type in self._NON_BLOCKING_TYPES:
+                    warning_count += 1
+                    if issue_type == 'guid_file_update':
+                        file_updates += 1
+                else:
+                    blocking_count += 1
             
-            if blocking_issues:
-                self.check_completed.emit(False, f"发现 {len(blocking_issues)} 个阻塞性问题，请查看详细报告")
+            if blocking_count:
+                self.check_completed.emit(False, f"发现 {blocking_count} 个阻塞性问题，请查看详细报告")
             else:
-                if warning_issues:
+                if warning_count:
                     # 统计不同类型的非阻塞问题
-                    file_updates = len([issue for issue in warning_issues if issue.get('type') == 'guid_file_update'])
-                    other_warnings = len(warning_issues) - file_updates
+                    other_warnings = warning_count - file_updates
                     
                     if file_updates > 0 and other_warnings > 0:
                         self.check_completed.emit(True, f"检查通过！发现 {file_updates} 个文件更新和 {other_warnings} 个警告")
                     elif file_updates > 0:
                         self.check_completed.emit(True, f"检查通过！发现 {file_updates} 个文件更新（将覆盖Git中的现有版本）")
                     else:
-                        self.check_completed.emit(True, f"检查通过！发现 {len(warning_issues)} 个警告（推送时会自动处理）")
+                        self.check_completed.emit(True, f"检查通过！发现 {warning_count} 个警告（推送时会自动处理）")
                 else:
                     self.check_completed.emit(True, f"所有 {len(self.upload_files)} 个文件检查通过")
                 
@@ -3375,10 +3651,49 @@ class ResourceChecker(QThread):
             import traceback
             traceback.print_exc()
 
-    def _check_meta_files(self) -> List[Dict[str, str]]:
-        """检查Meta文件完整性 - 严格的GUID一致性检查"""
+    def _emit_progress(self, value: int, force: bool = False):
+        """节流发送进度信号，两次发送间隔不小于_EMIT_INTERVAL（force时立即发送）"""
+        now = time.monotonic()
+        if force or now - self._last_progress_emit >= self._EMIT_INTERVAL:
+            self._last_progress_emit = now
+            self.progress_updated.emit(value)
+
+    def _queue_status(self, message: str):
+        """缓存逐文件状态信息，按_EMIT_INTERVAL合并为一条信号发送"""
+        self._pending_status.append(message)
+        if time.monotonic() - self._last_status_emit >= self._EMIT_INTERVAL:
+            self._flush_status()
+
+    def _flush_status(self):
+        """立即发送已缓存的状态信息（逐文件循环结束后调用，保证日志顺序）"""
+        if self._pending_status:
+            self.status_updated.emit("\n".join(self._pending_status))
+            self._pending_status = []
+        self._last_status_emit = time.monotonic()
+
+    def _run_per_file_checks(self, check_func, progress_range=None) -> List[Dict[str, str]]:
+        """在线程池中并行执行逐文件检查，按原文件顺序合并问题列表
+        
+        check_func 接收单个文件路径并返回该文件的问题列表。各文件检查只读取
+        自身的文件，互不依赖，因此可以安全地并发执行。
+        """
         issues = []
+        total = len(self.upload_files)
+        if total == 0:
+            return issues
+        
+        with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as executor:
+            # map按提交顺序返回结果，保证报告顺序与串行检查一致
+            for index, file_issues in enumerate(executor.map(check_func, self.upload_files), 1):
+                issues.extend(file_issues)
+                if progress_range:
+                    start, end = progress_range
+                    self._emit_progress(start + (end - start) * index // total, force=index == total)
         
+        return issues
+
+    def _check_meta_files(self, progress_range=None) -> List[Dict[str, str]]:
+        """检查Meta文件完整性 - 严格的GUID一致性检查"""
         # 检查是否有替换模式的文件夹
         has_replace_mode = False
         if hasattr(self, 'folder_upload_modes') and self.folder_upload_modes:
@@ -3387,177 +3702,185 @@ class ResourceChecker(QThread):
                     has_replace_mode = True
                     break
         
-        for file_path in self.upload_files:
-            try:
-                if file_path.lower().endswith('.meta'):
-                    # 跳过.meta文件本身
-                    continue
-                
-                # 1. 检查SVN中是否有对应的.meta文件
-                svn_meta_path = file_path + '.meta'
-                svn_has_meta = os.path.exists(svn_meta_path)
-                svn_guid = None
-                
-                if svn_has_meta:
-                    # 读取SVN中的GUID
-                    try:
-                        svn_guid = self.analyzer.parse_meta_file(svn_meta_path)
-                        if not svn_guid:
-                            issues.append({
-                                'file': file_path,
-                                'type': 'svn_meta_no_guid',
-                                'message': 'SVN中的.meta文件缺少有效GUID'
-                            })
-                    except Exception as e:
+        return self._run_per_file_checks(
+            lambda file_path: self._check_meta_file(file_path, has_replace_mode),
+            progress_range
+        )
+
+    def _check_meta_file(self, file_path: str, has_replace_mode: bool) -> List[Dict[str, str]]:
+        """检查单个文件的Meta完整性"""
+        issues = []
+        
+        try:
+            if file_path.lower().endswith('.meta'):
+                # 跳过.meta文件本身
+                return issues
+            
+            # 1. 检查SVN中是否有对应的.meta文件
+            svn_meta_path = file_path + '.meta'
+            svn_has_meta = os.path.exists(svn_meta_path)
+            svn_guid = None
+            
+            if svn_has_meta:
+                # 读取SVN中的GUID
+                try:
+                    svn_guid = self.analyzer.parse_meta_file(svn_meta_path)
+                    if not svn_guid:
                         issues.append({
                             'file': file_path,
-                            'type': 'svn_meta_read_error',
-                            'message': f'SVN中的.meta文件读取失败: {str(e)}'
+                            'type': 'svn_meta_no_guid',
+                            'message': 'SVN中的.meta文件缺少有效GUID'
                         })
-                
-                # 2. 计算Git中对应的文件路径
-                git_file_path = None
-                git_meta_path = None
-                git_has_meta = False
-                git_guid = None
-                
-                try:
-                    # 重要：与push_files_to_git保持一致，直接使用git_path作为基础路径
-                    # 不再拼接target_directory，因为git_path已经是完整路径
-                    git_file_path = self.git_manager._calculate_target_path(file_path, self.git_manager.git_path)
-                    
-                    if git_file_path:
-                        git_meta_path = git_file_path + '.meta'
-                        git_has_meta = os.path.exists(git_meta_path)
-                        
-                        if git_has_meta:
-                            # 读取Git中的GUID
-                            try:
-                                git_guid = self.analyzer.parse_meta_file(git_meta_path)
-                            except Exception as e:
-                                issues.append({
-                                    'file': file_path,
-                                    'type': 'git_meta_read_error',
-                                    'message': f'Git中的.meta文件读取失败: {str(e)}'
-                                })
-                
                 except Exception as e:
                     issues.append({
                         'file': file_path,
-                        'type': 'git_path_calc_error',
-                        'message': f'计算Git路径失败: {str(e)}'
+                        'type': 'svn_meta_read_error',
+                        'message': f'SVN中的.meta文件读取失败: {str(e)}'
                     })
+            
+            # 2. 计算Git中对应的文件路径
+            git_file_path = None
+            git_meta_path = None
+            git_has_meta = False
+            git_guid = None
+            
+            try:
+                # 重要：与push_files_to_git保持一致，直接使用git_path作为基础路径
+                # 不再拼接target_directory，因为git_path已经是完整路径
+                git_file_path = self.git_manager._calculate_target_path(file_path, self.git_manager.git_path)
                 
-                # 3. 根据不同情况进行检查
-                if not svn_has_meta and not git_has_meta:
-                    # 两边都没有.meta文件
+                if git_file_path:
+                    git_meta_path = git_file_path + '.meta'
+                    git_has_meta = os.path.exists(git_meta_path)
+                    
+                    if git_has_meta:
+                        # 读取Git中的GUID
+                        try:
+                            git_guid = self.analyzer.parse_meta_file(git_meta_path)
+                        except Exception as e:
+                            issues.append({
+                                'file': file_path,
+                                'type': 'git_meta_read_error',
+                                'message': f'Git中的.meta文件读取失败: {str(e)}'
+                            })
+            
+            except Exception as e:
+                issues.append({
+                    'file': file_path,
+                    'type': 'git_path_calc_error',
+                    'message': f'计算Git路径失败: {str(e)}'
+                })
+            
+            # 3. 根据不同情况进行检查
+            if not svn_has_meta and not git_has_meta:
+                # 两边都没有.meta文件
+                issues.append({
+                    'file': file_path,
+                    'type': 'meta_missing_both',
+                    'message': 'SVN和Git中都缺少.meta文件',
+                    'svn_path': file_path,
+                    'git_path': git_file_path or '路径计算失败'
+                })
+            
+            elif not svn_has_meta and git_has_meta:
+                # SVN中没有，Git中有
+                if git_guid:
+                    issues.append({
+                        'file': file_path,
+                        'type': 'meta_missing_svn',
+                        'message': f'SVN中缺少.meta文件，Git中存在(GUID: {git_guid})',
+                        'svn_path': file_path,
+                        'git_path': git_file_path,
+                        'git_guid': git_guid
+                    })
+                else:
+                    issues.append({
+                        'file': file_path,
+                        'type': 'meta_missing_svn_invalid_git',
+                        'message': 'SVN中缺少.meta文件，Git中的.meta文件无效',
+                        'svn_path': file_path,
+                        'git_path': git_file_path
+                    })
+            
+            elif svn_has_meta and not git_has_meta:
+                # SVN中有，Git中没有
+                if svn_guid:
+                    issues.append({
+                        'file': file_path,
+                        'type': 'meta_missing_git',
+                        'message': f'Git中缺少.meta文件，SVN中存在(GUID: {svn_guid})',
+                        'svn_path': file_path,
+                        'git_path': git_file_path or '路径计算失败',
+                        'svn_guid': svn_guid
+                    })
+                else:
                     issues.append({
                         'file': file_path,
-                        'type': 'meta_missing_both',
-                        'message': 'SVN和Git中都缺少.meta文件',
+                        'type': 'meta_missing_git_invalid_svn',
+                        'message': 'Git中缺少.meta文件，SVN中的.meta文件无效',
                         'svn_path': file_path,
                         'git_path': git_file_path or '路径计算失败'
                     })
-                
-                elif not svn_has_meta and git_has_meta:
-                    # SVN中没有，Git中有
-                    if git_guid:
+            
+            elif svn_has_meta and git_has_meta:
+                # 两边都有.meta文件，检查GUID一致性（仅在非替换模式下）
+                if not has_replace_mode:
+                    if svn_guid and git_guid:
+                        if svn_guid != git_guid:
+                            issues.append({
+                                'file': file_path,
+                                'type': 'guid_mismatch',
+                                'message': f'GUID不一致 - SVN: {svn_guid}, Git: {git_guid}',
+                                'svn_path': file_path,
+                                'git_path': git_file_path,
+                                'svn_guid': svn_guid,
+                                'git_guid': git_guid
+                            })
+                        # 如果GUID一致，则通过检查，不添加问题
+                    elif not svn_guid and not git_guid:
                         issues.append({
                             'file': file_path,
-                            'type': 'meta_missing_svn',
-                            'message': f'SVN中缺少.meta文件，Git中存在(GUID: {git_guid})',
+                            'type': 'guid_invalid_both',
+                            'message': 'SVN和Git中的.meta文件都没有有效GUID',
                             'svn_path': file_path,
-                            'git_path': git_file_path,
-                            'git_guid': git_guid
+                            'git_path': git_file_path
                         })
-                    else:
+                    elif not svn_guid:
                         issues.append({
                             'file': file_path,
-                            'type': 'meta_missing_svn_invalid_git',
-                            'message': 'SVN中缺少.meta文件，Git中的.meta文件无效',
+                            'type': 'guid_invalid_svn',
+                            'message': f'SVN中的.meta文件无效GUID，Git中有效(GUID: {git_guid})',
                             'svn_path': file_path,
-                            'git_path': git_file_path
+                            'git_path': git_file_path,
+                            'git_guid': git_guid
                         })
-                
-                elif svn_has_meta and not git_has_meta:
-                    # SVN中有，Git中没有
-                    if svn_guid:
+                    elif not git_guid:
                         issues.append({
                             'file': file_path,
-                            'type': 'meta_missing_git',
-                            'message': f'Git中缺少.meta文件，SVN中存在(GUID: {svn_guid})',
+                            'type': 'guid_invalid_git',
+                            'message': f'Git中的.meta文件无效GUID，SVN中有效(GUID: {svn_guid})',
                             'svn_path': file_path,
-                            'git_path': git_file_path or '路径计算失败',
+                            'git_path': git_file_path,
                             'svn_guid': svn_guid
                         })
-                    else:
+                else:
+                    # 替换模式下，跳过GUID一致性检查
+                    # 只检查SVN中的.meta文件是否有效
+                    if not svn_guid:
                         issues.append({
                             'file': file_path,
-                            'type': 'meta_missing_git_invalid_svn',
-                            'message': 'Git中缺少.meta文件，SVN中的.meta文件无效',
+                            'type': 'guid_invalid_svn',
+                            'message': f'SVN中的.meta文件无效GUID（替换模式下忽略Git中的GUID）',
                             'svn_path': file_path,
-                            'git_path': git_file_path or '路径计算失败'
+                            'git_path': git_file_path
                         })
-                
-                elif svn_has_meta and git_has_meta:
-                    # 两边都有.meta文件，检查GUID一致性（仅在非替换模式下）
-                    if not has_replace_mode:
-                        if svn_guid and git_guid:
-                            if svn_guid != git_guid:
-                                issues.append({
-                                    'file': file_path,
-                                    'type': 'guid_mismatch',
-                                    'message': f'GUID不一致 - SVN: {svn_guid}, Git: {git_guid}',
-                                    'svn_path': file_path,
-                                    'git_path': git_file_path,
-                                    'svn_guid': svn_guid,
-                                    'git_guid': git_guid
-                                })
-                            # 如果GUID一致，则通过检查，不添加问题
-                        elif not svn_guid and not git_guid:
-                            issues.append({
-                                'file': file_path,
-                                'type': 'guid_invalid_both',
-                                'message': 'SVN和Git中的.meta文件都没有有效GUID',
-                                'svn_path': file_path,
-                                'git_path': git_file_path
-                            })
-                        elif not svn_guid:
-                            issues.append({
-                                'file': file_path,
-                                'type': 'guid_invalid_svn',
-                                'message': f'SVN中的.meta文件无效GUID，Git中有效(GUID: {git_guid})',
-                                'svn_path': file_path,
-                                'git_path': git_file_path,
-                                'git_guid': git_guid
-                            })
-                        elif not git_guid:
-                            issues.append({
-                                'file': file_path,
-                                'type': 'guid_invalid_git',
-                                'message': f'Git中的.meta文件无效GUID，SVN中有效(GUID: {svn_guid})',
-                                'svn_path': file_path,
-                                'git_path': git_file_path,
-                                'svn_guid': svn_guid
-                            })
-                    else:
-                        # 替换模式下，跳过GUID一致性检查
-                        # 只检查SVN中的.meta文件是否有效
-                        if not svn_guid:
-                            issues.append({
-                                'file': file_path,
-                                'type': 'guid_invalid_svn',
-                                'message': f'SVN中的.meta文件无效GUID（替换模式下忽略Git中的GUID）',
-                                'svn_path': file_path,
-                                'git_path': git_file_path
-                            })
-                        
-            except Exception as e:
-                issues.append({
-                    'file': file_path,
-                    'type': 'meta_check_error',
-                    'message': f'Meta文件检查失败: {str(e)}'
-                })
+                    
+        except Exception as e:
+            issues.append({
+                'file': file_path,
+                'type': 'meta_check_error',
+                'message': f'Meta文件检查失败: {str(e)}'
+            })
         
         return issues
 
@@ -3584,58 +3907,61 @@ class ResourceChecker(QThread):
         
         return issues
 
-    def _check_image_sizes(self) -> List[Dict[str, str]]:
+    def _check_image_sizes(self, progress_range=None) -> List[Dict[str, str]]:
         """检查图片尺寸"""
+        return self._run_per_file_checks(self._check_image_size, progress_range)
+
+    def _check_image_size(self, file_path: str) -> List[Dict[str, str]]:
+        """检查单个图片的尺寸"""
         issues = []
         
-        for file_path in self.upload_files:
-            try:
-                _, ext = os.path.splitext(file_path.lower())
-                if ext in self.image_types:
-                    try:
-                        from PIL import Image
-                        with Image.open(file_path) as img:
-                            width, height = img.size
-                            
-                            # 检查是否为2的幂次
-                            if not (width & (width - 1) == 0 and width != 0):
-                                issues.append({
-                                    'file': file_path,
-                                    'type': 'image_width_not_power_of_2',
-                                    'message': f'图片宽度({width})不是2的幂次'
-                                })
-                            
-                            if not (height & (height - 1) == 0 and height != 0):
-                                issues.append({
-                                    'file': file_path,
-                                    'type': 'image_height_not_power_of_2',
-                                    'message': f'图片高度({height})不是2的幂次'
-                                })
-                            
-                            # 检查尺寸是否过大
-                            if width > 2048 or height > 2048:
-                                issues.append({
-                                    'file': file_path,
-                                    'type': 'image_too_large',
-                                    'message': f'图片尺寸过大({width}x{height})'
-                                })
-                                
-                    except ImportError:
-                        # PIL不可用，跳过图片检查
-                        pass
-                    except Exception as e:
-                        issues.append({
-                            'file': file_path,
-                            'type': 'image_check_error',
-                            'message': f'图片检查失败: {str(e)}'
-                        })
+        try:
+            _, ext = os.path.splitext(file_path.lower())
+            if ext in self.image_types:
+                try:
+                    from PIL import Image
+                    with Image.open(file_path) as img:
+                        width, height = img.size
                         
-            except Exception as e:
-                issues.append({
-                    'file': file_path,
-                    'type': 'image_size_check_error',
-                    'message': f'图片尺寸检查失败: {str(e)}'
-                })
+                        # 检查是否为2的幂次
+                        if not (width & (width - 1) == 0 and width != 0):
+                            issues.append({
+                                'file': file_path,
+                                'type': 'image_width_not_power_of_2',
+                                'message': f'图片宽度({width})不是2的幂次'
+                            })
+                        
+                        if not (height & (height - 1) == 0 and height != 0):
+                            issues.append({
+                                'file': file_path,
+                                'type': 'image_height_not_power_of_2',
+                                'message': f'图片高度({height})不是2的幂次'
+                            })
+                        
+                        # 检查尺寸是否过大
+                        if width > 2048 or height > 2048:
+                            issues.append({
+                                'file': file_path,
+                                'type': 'image_too_large',
+                                'message': f'图片尺寸过大({width}x{height})'
+                            })
+                            
+                except ImportError:
+                    # PIL不可用，跳过图片检查
+                    pass
+                except Exception as e:
+                    issues.append({
+                        'file': file_path,
+                        'type': 'image_check_error',
+                        'message': f'图片检查失败: {str(e)}'
+                    })
+                    
+        except Exception as e:
+            issues.append({
+                'file': file_path,
+                'type': 'image_size_check_error',
+                'message': f'图片尺寸检查失败: {str(e)}'
+            })
         
         return issues
 
@@ -3725,13 +4051,13 @@ class ResourceChecker(QThread):
                         else:
                             guid_to_meta[guid] = meta_file
                         
-                        self.status_updated.emit(f"找到GUID: {guid[:8]}... ({os.path.basename(meta_file)})")
+                        self._queue_status(f"找到GUID: {guid[:8]}... ({os.path.basename(meta_file)})")
                     else:
                         # GUID解析失败，但这会在meta文件检查中处理
                         pass
                         
                 except Exception as e:
-                    self.status_updated.emit(f"❌ 解析meta文件失败: {os.path.basename(meta_file)} - {e}")
+                    self._queue_status(f"❌ 解析meta文件失败: {os.path.basename(meta_file)} - {e}")
                     # 找到对应的资源文件用于报告
                     resource_file = meta_file[:-5] if meta_file.endswith('.meta') else meta_file
                     issues.append({
@@ -3740,6 +4066,7 @@ class ResourceChecker(QThread):
                         'message': f'GUID解析失败: {str(e)}'
                     })
             
+            self._flush_status()
             self.status_updated.emit(f"收集到 {len(guid_to_meta)} 个唯一GUID")
             
             # 第三步：检查内部重复
@@ -3799,15 +4126,15 @@ class ResourceChecker(QThread):
                         
                         # 调试信息（只输出前3个）
                         if debug_count < 3:
-                            self.status_updated.emit(f"🔍 路径比较调试:")
-                            self.status_updated.emit(f"   文件: {os.path.basename(resource_file)}")
-                            self.status_updated.emit(f"   上传路径: '{upload_relative_path}'")
-                            self.status_updated.emit(f"   Git路径: '{git_relative_path}'")
+                            self._queue_status(f"🔍 路径比较调试:")
+                            self._queue_status(f"   文件: {os.path.basename(resource_file)}")
+                            self._queue_status(f"   上传路径: '{upload_relative_path}'")
+                            self._queue_status(f"   Git路径: '{git_relative_path}'")
                             
                             # 显示路径映射结果
                             if hasattr(self.git_manager, 'apply_path_mapping'):
                                 mapped_path = self.git_manager.apply_path_mapping(upload_relative_path)
-                                self.status_updated.emit(f"   映射后路径: '{mapped_path}'")
+                                self._queue_status(f"   映射后路径: '{mapped_path}'")
                             
                             debug_count += 1
                         
@@ -3821,7 +4148,7 @@ class ResourceChecker(QThread):
                                 'upload_path': upload_relative_path,
                                 'git_path': git_relative_path
                             })
-                            self.status_updated.emit(f"📝 文件更新: {guid[:8]}... ({os.path.basename(resource_file)})")
+                            self._queue_status(f"📝 文件更新: {guid[:8]}... ({os.path.basename(resource_file)})")
                         else:
                             # 真正的GUID冲突 - 不同文件使用相同GUID
                             git_conflicts.append({
@@ -3832,7 +4159,8 @@ class ResourceChecker(QThread):
                                 'git_path': git_relative_path,
                                 'git_file_name': git_file_info['resource_name']
                             })
-                            self.status_updated.emit(f"⚠️ GUID冲突: {guid[:8]}... (上传:{os.path.basename(resource_file)} vs Git:{git_file_info['resource_name']})")
+                            self._queue_status(f"⚠️ GUID冲突: {guid[:8]}... (上传:{os.path.basename(resource_file)} vs Git:{git_file_info['resource_name']})")
+                self._flush_status()
             
             # 记录文件更新（信息级别，不是错误）
             for update in file_updates:
@@ -3883,6 +4211,7 @@ class ResourceChecker(QThread):
                 self.status_updated.emit("✅ GUID唯一性检查通过，所有GUID都是唯一的")
                 
         except Exception as e:
+            self._flush_status()
             error_msg = f"GUID唯一性检查异常: {str(e)}"
             self.status_updated.emit(f"❌ {error_msg}")
             
@@ -4001,7 +4330,7 @@ class ResourceChecker(QThread):
                     guid = self.analyzer.parse_meta_file(file_path)
                     if guid:
                         local_guids[guid] = file_path
-                        self.status_updated.emit(f"找到本地GUID: {guid[:8]}... ({os.path.basename(file_path)})")
+                        self._queue_status(f"找到本地GUID: {guid[:8]}... ({os.path.basename(file_path)})")
                 else:
                     # 检查对应的meta文件
                     meta_path = file_path + '.meta'
@@ -4009,8 +4338,9 @@ class ResourceChecker(QThread):
                         guid = self.analyzer.parse_meta_file(meta_path)
                         if guid:
                             local_guids[guid] = meta_path
-                            self.status_updated.emit(f"找到本地GUID: {guid[:8]}... ({os.path.basename(meta_path)})")
+                            self._queue_status(f"找到本地GUID: {guid[:8]}... ({os.path.basename(meta_path)})")
             
+            self._flush_status()
             self.status_updated.emit(f"本次推送包含 {len(local_guids)} 个GUID")
             
             # 获取Git仓库中的所有GUID
@@ -4029,7 +4359,7 @@ class ResourceChecker(QThread):
                         referenced_guids = self.analyzer.parse_editor_asset(file_path)
                         
                         if referenced_guids:
-                            self.status_updated.emit(f"文件 {os.path.basename(file_path)} 引用了 {len(referenced_guids)} 个GUID")
+                            self._queue_status(f"文件 {os.path.basename(file_path)} 引用了 {len(referenced_guids)} 个GUID")
                             
                             for ref_guid in referenced_guids:
                                 # 检查引用的GUID是否存在
@@ -4045,26 +4375,28 @@ class ResourceChecker(QThread):
                                         'analysis': analysis
                                     })
                                     
-                                    self.status_updated.emit(f"⚠️ 缺失GUID引用: {ref_guid[:8]}... 在文件 {os.path.basename(file_path)}")
+                                    self._queue_status(f"⚠️ 缺失GUID引用: {ref_guid[:8]}... 在文件 {os.path.basename(file_path)}")
                                 else:
                                     # 找到引用，记录来源
                                     if ref_guid in local_guids:
                                         source = f"本地文件: {os.path.basename(local_guids[ref_guid])}"
                                     else:
                                         source = "Git仓库"
-                                    self.status_updated.emit(f"✅ GUID引用正常: {ref_guid[:8]}... -> {source}")
+                                    self._queue_status(f"✅ GUID引用正常: {ref_guid[:8]}... -> {source}")
                         else:
-                            self.status_updated.emit(f"文件 {os.path.basename(file_path)} 没有GUID引用")
+                            self._queue_status(f"文件 {os.path.basename(file_path)} 没有GUID引用")
                             
                     except Exception as e:
                         error_msg = f"分析文件失败: {os.path.basename(file_path)} - {str(e)}"
-                        self.status_updated.emit(f"❌ {error_msg}")
+                        self._queue_status(f"❌ {error_msg}")
                         issues.append({
                             'type': 'analysis_error',
                             'file': file_path,
                             'description': error_msg
                         })
             
+            self._flush_status()
+            
             # 检查内部依赖完整性
             self.status_updated.emit("检查内部依赖完整性...")
             internal_issues = self._check_internal_dependencies(local_guids)
@@ -4076,6 +4408,7 @@ class ResourceChecker(QThread):
                 self.status_updated.emit("✅ GUID引用检查通过，所有引用都完整")
             
         except Exception as e:
+            self._flush_status()
             error_msg = f"GUID引用检查异常: {str(e)}"
             self.status_updated.emit(f"❌ {error_msg}")
             
@@ -4137,7 +4470,8 @@ class ResourceChecker(QThread):
                 except:
                     continue
             
-            # 检查内部引用的完整性
+            # 检查内部引用的完整性（推送列表转为集合，避免逐个GUID线性查找）
+            upload_file_set = set(self.upload_files)
             for file_path, referenced_guids in file_dependencies.items():
                 for guid in referenced_guids:
                     # 如果这个GUID在本次推送的文件中
@@ -4145,7 +4479,7 @@ class ResourceChecker(QThread):
                         referenced_file = local_guids[guid]
                         
                         # 检查被引用的文件是否真的在推送列表中
-                        if referenced_file not in self.upload_files:
+                        if referenced_file not in upload_file_set:
                             issues.append({
                                 'file': file_path,
                                 'type': 'internal_dependency_missing',
@@ -4191,139 +4525,37 @@ class ResourceChecker(QThread):
         """检查材质模板使用情况"""
         issues = []
         
-        # 允许的材质模板列表
-        allowed_templates = {
-            # 角色和场景模板
-            'Character_NPR_Opaque.templatemat',
-            'Character_NPR_Masked.templatemat',
-            'Character_NPR_Tranclucent.templatemat',
-            'Character_AVATAR_Masked.templatemat',
-            'Character_AVATAR_Opaque.templatemat',
-            'Character_AVATAR_Tranclucent.templatemat',
-            'Character_PBR_Opaque.templatemat',
-            'Character_PBR_Translucent.templatemat',
-            'Scene_Prop_Opaque.templatemat',
-            'Scene_Prop_Tranclucent.templatemat',
-            'Scene_Prop_Masked.templatemat',
-            'Sight.templatemat',
-            
-            # 特效模板
-            'fx_basic_ADD.templatemat',
-            'fx_basic_fire.templatemat',
-            'fx_basic_TRANSLUCENT.templatemat',
-            'fx_dissolve_ADD.templatemat',
-            'fx_dissolve_fresnel_ADD.templatemat',
-            'fx_dissolve_fresnel_TRANSLUCENT.templatemat',
-            'fx_dissolve_fresneluvwarp_ADD.templatemat',
-            'fx_dissolve_fresneluvwarp_TRANSLUCENT.templatemat',
-            'fx_dissolve_TRANSLUCENT.templatemat',
-            'fx_dissolve_uvwarp_ADD.templatemat',
-            'fx_dissolve_uvwarp_Fire_ADD.templatemat',
-            'fx_dissolve_uvwarp_Fire_TRANSLUCENT.templatemat',
-            'fx_dissolve_uvwarp_TRANSLUCENT.templatemat',
-            'fx_dissolve_vertexesoffsetWithMask_ADD.templatemat',
-            'fx_dissolve_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
-            'fx_fresnel_ADD.templatemat',
-            'fx_fresnel_TRANSLUCENT.templatemat',
-            'fx_uvwarp_ADD.templatemat',
-            'fx_uvwarp_TRANSLUCENT.templatemat',
-            'fx_vertexesoffset_ADD.templatemat',
-            'fx_vertexesoffset_TRANSLUCENT.templatemat',
-            'fx_vertexesoffsetWithMask_ADD.templatemat',
-            'fx_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
-            'PolarDistortion.templatemat',
-            'standard_particle_additive.templatemat',
-            'standard_particle_translucent.templatemat'
-        }
-        
         try:
             self.status_updated.emit("🔍 开始材质模板检查...")
             
             # 筛选出需要检查的材质文件
             material_files = []
             for file_path in self.upload_files:
-                if not file_path.lower().endswith('.mat'):
+                if file_path[-4:].lower() != '.mat':
                     continue
                 
                 # 检查是否在entity目录下
-                normalized_path = os.path.normpath(file_path)
-                path_parts = normalized_path.split(os.sep)
-                
-                # 查找entity目录
-                entity_index = -1
-                for i, part in enumerate(path_parts):
-                    if part.lower() == 'entity':
-                        entity_index = i
-                        break
-                
-                if entity_index == -1:
+                entity_match = ENTITY_DIR_RE.search(file_path)
+                if not entity_match:
                     continue  # 不在entity目录下，跳过
                 
-                # 检查是否在排除的目录中
-                excluded_path = False
-                remaining_parts = path_parts[entity_index + 1:]
-                
                 # 检查是否在entity/Environment/Scenes目录下
-                if (len(remaining_parts) >= 2 and 
-                    remaining_parts[0].lower() == 'environment' and 
-                    remaining_parts[1].lower() == 'scenes'):
-                    excluded_path = True
+                if ENTITY_EXCLUDED_RE.match(file_path, entity_match.end()):
+                    continue
                 
-                if not excluded_path:
-                    material_files.append(file_path)
+                material_files.append(file_path)
             
             self.status_updated.emit(f"找到 {len(material_files)} 个需要检查的材质文件")
             
-            # 检查每个材质文件的模板使用情况
-            for file_path in material_files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # 查找模板引用
-                    template_references = self._find_template_references(content)
-                    
-                    if not template_references:
-                        # 没有找到模板引用，这可能是问题
-                        issues.append({
-                            'file': file_path,
-                            'type': 'no_template_found',
-                            'message': '未找到材质模板引用'
-                        })
-                    else:
-                        # 检查使用的模板是否在允许列表中
-                        found_valid_template = False
-                        for template_name in template_references:
-                            # 跳过GUID引用，这些不是实际的模板名称
-                            if template_name.startswith('TEMPLATE_GUID:'):
-                                continue
-                            
-                            if template_name in allowed_templates:
-                                # 记录使用了正确的模板（信息性）
-                                self.status_updated.emit(f"✅ {os.path.basename(file_path)} 使用了正确模板: {template_name}")
-                                found_valid_template = True
-                            else:
-                                issues.append({
-                                    'file': file_path,
-                                    'type': 'invalid_template',
-                                    'message': f'使用了不允许的材质模板: {template_name}',
-                                    'template_name': template_name
-                                })
-                        
-                        # 如果只找到了GUID引用而没有找到实际的模板名称，视为没有模板
-                        if not found_valid_template and all(ref.startswith('TEMPLATE_GUID:') for ref in template_references):
-                            issues.append({
-                                'file': file_path,
-                                'type': 'no_template_found',
-                                'message': '未找到材质模板引用（仅找到GUID引用）'
-                            })
-                    
-                except Exception as e:
-                    issues.append({
-                        'file': file_path,
-                        'type': 'template_check_error',
-                        'message': f'材质模板检查失败: {str(e)}'
-                    })
+            # 检查每个材质文件的模板使用情况（读取文件以I/O为主，多线程并行，按原顺序合并结果）
+            if material_files:
+                with ThreadPoolExecutor(max_workers=min(self._MAX_WORKERS, len(material_files))) as executor:
+                    for file_issues, status_messages in executor.map(self._check_material_template, material_files):
+                        for message in status_messages:
+                            self._queue_status(message)
+                        issues.extend(file_issues)
+            
+            self._flush_status()
             
             if issues:
                 blocking_issues = [issue for issue in issues if issue.get('type') != 'no_template_found']
@@ -4335,6 +4567,7 @@ class ResourceChecker(QThread):
                 self.status_updated.emit("✅ 材质模板检查通过，所有材质都使用了正确的模板")
                 
         except Exception as e:
+            self._flush_status()
             issues.append({
                 'file': 'SYSTEM',
                 'type': 'template_check_system_error',
@@ -4343,52 +4576,66 @@ class ResourceChecker(QThread):
         
         return issues
 
-    def _find_template_references(self, content: str) -> List[str]:
-        """查找材质文件中的模板引用"""
-        template_references = []
+    def _check_material_template(self, file_path: str) -> Tuple[List[Dict[str, str]], List[str]]:
+        """检查单个材质文件的模板使用情况，返回 (问题列表, 状态消息列表)
+        
+        在线程池中调用，不直接发送信号，状态消息由调用方按文件顺序输出。
+        """
+        issues = []
+        status_messages = []
         
         try:
-            # 查找templatemat引用
-            import re
-            
-            # 使用多种模式查找模板引用
-            template_patterns = [
-                # 直接的templatemat引用
-                r'templatemat:\s*([^\s\n]+\.templatemat)',
-                # template引用
-                r'template:\s*([^\s\n]+\.templatemat)',
-                # 任何.templatemat文件引用
-                r'([A-Za-z_][A-Za-z0-9_]*\.templatemat)',
-                # JSON格式的templatemat引用
-                r'"templatemat":\s*"([^"]+\.templatemat)"',
-                # 其他可能的格式
-                r'templatemat["\']?\s*[:=]\s*["\']?([^"\'\s\n]+\.templatemat)',
-            ]
+            # 查找模板引用（文件未修改时复用缓存结果）
+            file_stat = os.stat(file_path)
+            template_references = list(_read_template_references(file_path, file_stat.st_mtime_ns, file_stat.st_size))
             
-            found_templates = set()
-            for pattern in template_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    template_name = match.strip().strip('"\'')
-                    if template_name and template_name.endswith('.templatemat'):
-                        found_templates.add(template_name)
-            
-            # 转换为列表
-            template_references = list(found_templates)
-            
-            # 如果还没找到，查找可能的GUID引用（作为备选方案）
             if not template_references:
-                guid_pattern = r'guid:\s*([a-f0-9]{32})'
-                guid_matches = re.findall(guid_pattern, content, re.IGNORECASE)
+                # 没有找到模板引用，这可能是问题
+                issues.append({
+                    'file': file_path,
+                    'type': 'no_template_found',
+                    'message': '未找到材质模板引用'
+                })
+            else:
+                # 检查使用的模板是否在允许列表中
+                found_valid_template = False
+                for template_name in template_references:
+                    # 跳过GUID引用，这些不是实际的模板名称
+                    if template_name.startswith('TEMPLATE_GUID:'):
+                        continue
+                    
+                    if template_name in ALLOWED_MATERIAL_TEMPLATES:
+                        # 记录使用了正确的模板（信息性）
+                        status_messages.append(f"✅ {os.path.basename(file_path)} 使用了正确模板: {template_name}")
+                        found_valid_template = True
+                    else:
+                        issues.append({
+                            'file': file_path,
+                            'type': 'invalid_template',
+                            'message': f'使用了不允许的材质模板: {template_name}',
+                            'template_name': template_name
+                        })
                 
-                for guid in guid_matches:
-                    # 标记为GUID引用，以便后续处理
-                    template_references.append(f'TEMPLATE_GUID:{guid}')
+                # 如果只找到了GUID引用而没有找到实际的模板名称，视为没有模板
+                if not found_valid_template and all(ref.startswith('TEMPLATE_GUID:') for ref in template_references):
+                    issues.append({
+                        'file': file_path,
+                        'type': 'no_template_found',
+                        'message': '未找到材质模板引用（仅找到GUID引用）'
+                    })
             
         except Exception as e:
-            debug_print(f"查找模板引用失败: {str(e)}")
+            issues.append({
+                'file': file_path,
+                'type': 'template_check_error',
+                'message': f'材质模板检查失败: {str(e)}'
+            })
         
-        return template_references
+        return issues, status_messages
+
+    def _find_template_references(self, content) -> List[str]:
+        """查找材质文件中的模板引用（见find_template_references）"""
+        return find_template_references(content)
 
     def _generate_detailed_report(self, all_issues: List[Dict[str, str]], total_files: int) -> Dict[str, Any]:
         """生成详细报告 - 美术友好版本"""
@@ -5615,6 +5862,8 @@ class BranchSelectorDialog(QDialog):
         
         # 分支列表
         self.branch_list = QListWidget()
+        # 所有行高度一致，Qt无需逐项计算尺寸
+        self.branch_list.setUniformItemSizes(True)
         self.populate_branch_list()
         layout.addWidget(self.branch_list)
         
@@ -5642,29 +5891,31 @@ class BranchSelectorDialog(QDialog):
         self.search_input.setFocus()
     
     def populate_branch_list(self):
-        """填充分支列表"""
-        self.branch_list.clear()
-        
-        if not self.filtered_branches:
-            # 没有匹配的分支时显示提示
-            item = QListWidgetItem("没有找到匹配的分支")
-            item.setFlags(Qt.NoItemFlags)  # 不可选择
-            item.setTextAlignment(Qt.AlignCenter)
-            self.branch_list.addItem(item)
-            return
-        
-        for branch in self.filtered_branches:
-            item = QListWidgetItem(branch)
-            if branch == self.current_branch:
-                item.setText(f"★ {branch} (当前分支)")
+        """填充分支列表（每次输入过滤都会调用，整批填充只触发一次重绘）"""
+        self.branch_list.setUpdatesEnabled(False)
+        try:
+            self.branch_list.clear()
+            
+            if not self.filtered_branches:
+                # 没有匹配的分支时显示提示
+                item = QListWidgetItem("没有找到匹配的分支")
+                item.setFlags(Qt.NoItemFlags)  # 不可选择
+                item.setTextAlignment(Qt.AlignCenter)
+                self.branch_list.addItem(item)
+                return
+            
+            # 普通分支直接按字符串批量添加，当前分支单独加粗并选中
+            self.branch_list.addItems(self.filtered_branches)
+            if self.current_branch in self.filtered_branches:
+                item = self.branch_list.item(self.filtered_branches.index(self.current_branch))
+                item.setText(f"★ {self.current_branch} (当前分支)")
                 font = item.font()
                 font.setBold(True)
                 item.setFont(font)
                 # 设置当前分支为选中状态
-                self.branch_list.addItem(item)
                 self.branch_list.setCurrentItem(item)
-            else:
-                self.branch_list.addItem(item)
+        finally:
+            self.branch_list.setUpdatesEnabled(True)
     
     def filter_branches(self):
         """根据搜索关键词过滤分支"""
@@ -5783,7 +6034,8 @@ class SimpleBranchComboBox(QComboBox):
         """获取当前选中的分支名称（去除装饰）"""
         text = self.currentText()
         if text.startswith("★ "):
-            return text.replace("★ ", "").replace(" (当前)", "")
+            # 装饰格式固定为 "★ {branch} (当前)"，只需去掉首尾装饰
+            return text[2:].removesuffix(" (当前)")
         return text
 
 
@@ -5792,13 +6044,8 @@ class DragDropListWidget(QListWidget):
     
     files_dropped = pyqtSignal(list)  # 文件拖拽信号
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.DropOnly)
-        
-        # 设置样式，使拖拽区域更明显
-        self.setStyleSheet("""
+    # 拖拽区域样式，使拖拽区域更明显
+    _STYLE = """
             QListWidget {
                 border: 2px dashed #aaa;
                 border-radius: 5px;
@@ -5808,10 +6055,21 @@ class DragDropListWidget(QListWidget):
                 border-color: #0078d4;
                 background-color: #f0f8ff;
             }
-        """)
+        """
+    
+    # 占位提示文本
+    _PLACEHOLDER_TEXT = "拖拽任意文件或文件夹到此处，或使用上方按钮选择"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAcceptDrops(True)
+        self.setDragDropMode(QListWidget.DropOnly)
+        
+        # 设置样式
+        self.setStyleSheet(self._STYLE)
         
-        # 添加提示文本
-        self.placeholder_item = QListWidgetItem("拖拽任意文件或文件夹到此处，或使用上方按钮选择")
+        # 添加提示文本（占位项只创建一次，清空时复用）
+        self.placeholder_item = QListWidgetItem(self._PLACEHOLDER_TEXT)
         self.placeholder_item.setFlags(Qt.NoItemFlags)
         self.placeholder_item.setTextAlignment(Qt.AlignCenter)
         self.addItem(self.placeholder_item)
@@ -5857,32 +6115,53 @@ class DragDropListWidget(QListWidget):
     
     def add_file_item(self, file_path: str):
         """添加文件项到列表"""
-        # 移除占位符
-        if self.count() > 0 and self.item(0) == self.placeholder_item:
-            self.takeItem(0)
+        self.add_file_items([file_path])
+    
+    def add_file_items(self, file_paths: List[str]):
+        """批量添加文件项到列表，整批只触发一次重绘"""
+        if not file_paths:
+            return
         
-        item = QListWidgetItem(file_path)
-        self.addItem(item)
+        self.setUpdatesEnabled(False)
+        try:
+            # 移除占位符
+            if self.count() > 0 and self.item(0) == self.placeholder_item:
+                self.takeItem(0)
+            
+            self.addItems(file_paths)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def clear_all_items(self):
         """清空所有项目并重新添加占位符"""
+        # 先取出占位项，避免clear()将其一并销毁，之后直接复用
+        row = self.row(self.placeholder_item)
+        if row >= 0:
+            self.takeItem(row)
         self.clear()
-        self.placeholder_item = QListWidgetItem("拖拽任意文件或文件夹到此处，或使用上方按钮选择")
-        self.placeholder_item.setFlags(Qt.NoItemFlags)
-        self.placeholder_item.setTextAlignment(Qt.AlignCenter)
         self.addItem(self.placeholder_item)
 
 
 class ArtResourceManager(QMainWindow):
     """美术资源管理器主窗口"""
     
+    # 日志/结果文本框保留的最大行数
+    MAX_LOG_BLOCKS = 10000
+    
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
         self.git_manager = GitSvnManager()
         self.upload_files = []
+        self._upload_files_set = set()  # 与upload_files同步，用于O(1)去重判断
+        # SVN仓库GUID索引（会话级，首次查询GUID时建立）
+        self._svn_guid_index = None
+        self._svn_guid_index_root = None
+        self._clipboard = QApplication.clipboard()
         # 文件夹上传模式跟踪
         self.folder_upload_modes = {}  # 格式：{folder_path: {"mode": "replace", "target_path": "..."}}
+        # 正在运行的文件夹扫描线程，扫描期间禁止检查、推送和清空列表
+        self._folder_scan_threads = set()
         self.init_ui()
         self.load_settings()
 
@@ -6013,11 +6292,10 @@ class ArtResourceManager(QMainWindow):
             self.config_manager.set_last_selected_branch(current_branch)
         
         # 保存最近使用的文件
-        for file_path in self.upload_files:
-            self.config_manager.add_recent_file(file_path)
+        self.config_manager.add_recent_files(self.upload_files)
         
-        # 保存配置到文件
-        self.config_manager.save_config()
+        # 保存配置到文件（程序即将退出，立即写盘）
+        self.config_manager.flush()
         
     def closeEvent(self, event):
         """程序关闭事件"""
@@ -6416,12 +6694,15 @@ class ArtResourceManager(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Consolas", 9))
+        # 限制最大行数，超出后丢弃最早的行，避免长时间运行后文档无限增长
+        self.log_text.document().setMaximumBlockCount(self.MAX_LOG_BLOCKS)
         tab_widget.addTab(self.log_text, "操作日志")
         
         # 结果标签页
         self.result_text = QTextEdit()
         self.result_text.setReadOnly(True)
         self.result_text.setFont(QFont("Consolas", 9))
+        self.result_text.document().setMaximumBlockCount(self.MAX_LOG_BLOCKS)
         tab_widget.addTab(self.result_text, "检查结果")
         
         return widget
@@ -6620,38 +6901,20 @@ class ArtResourceManager(QMainWindow):
     
     def open_svn_folder(self):
         """打开SVN文件夹"""
-        path = self.svn_path_edit.text().strip()
-        if not path:
-            QMessageBox.warning(self, "警告", "SVN仓库路径为空！")
-            return
-        
-        if not os.path.exists(path):
-            QMessageBox.warning(self, "警告", f"SVN仓库路径不存在：{path}")
-            return
-        
-        try:
-            if sys.platform == "win32":
-                os.startfile(path)
-            elif sys.platform == "darwin":
-                subprocess.run(["open", path], creationflags=SUBPROCESS_FLAGS)
-            else:
-                subprocess.run(["xdg-open", path], creationflags=SUBPROCESS_FLAGS)
-            
-            self.log_text.append(f"已打开SVN文件夹: {path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"无法打开文件夹: {str(e)}")
-            self.log_text.append(f"打开SVN文件夹失败: {str(e)}")
+        self._open_folder("SVN", self.svn_path_edit.text().strip())
     
     def open_git_folder(self):
         """打开Git文件夹"""
-        path = self.git_path_edit.text().strip()
+        self._open_folder("Git", self.git_path_edit.text().strip())
+    
+    def _open_folder(self, label: str, path: str):
+        """在系统文件管理器中打开指定仓库文件夹"""
         if not path:
-            QMessageBox.warning(self, "警告", "Git仓库路径为空！")
+            QMessageBox.warning(self, "警告", f"{label}仓库路径为空！")
             return
         
         if not os.path.exists(path):
-            QMessageBox.warning(self, "警告", f"Git仓库路径不存在：{path}")
+            QMessageBox.warning(self, "警告", f"{label}仓库路径不存在：{path}")
             return
         
         try:
@@ -6662,11 +6925,11 @@ class ArtResourceManager(QMainWindow):
             else:
                 subprocess.run(["xdg-open", path], creationflags=SUBPROCESS_FLAGS)
             
-            self.log_text.append(f"已打开Git文件夹: {path}")
+            self.log_text.append(f"已打开{label}文件夹: {path}")
             
         except Exception as e:
             QMessageBox.critical(self, "错误", f"无法打开文件夹: {str(e)}")
-            self.log_text.append(f"打开Git文件夹失败: {str(e)}")
+            self.log_text.append(f"打开{label}文件夹失败: {str(e)}")
     
 
     
@@ -6809,7 +7072,10 @@ class ArtResourceManager(QMainWindow):
     
     def show_current_branch(self):
         """显示当前分支"""
-        current_branch = self.git_manager.get_current_branch()
+        self._show_branch_info(self.git_manager.get_current_branch())
+    
+    def _show_branch_info(self, current_branch: str):
+        """显示已知的当前分支名（调用方已获取分支时复用，避免重复执行git命令）"""
         self.log_text.append(f"当前分支: {current_branch}")
         QMessageBox.information(self, "当前分支", f"当前分支: {current_branch}")
     
@@ -6856,8 +7122,8 @@ class ArtResourceManager(QMainWindow):
         
         # 创建分支切换线程
         self.branch_switch_thread = BranchSwitchThread(self.git_manager, selected_branch, current_branch)
-        self.branch_switch_thread.progress_updated.connect(self.progress_bar.setValue)
-        self.branch_switch_thread.status_updated.connect(self.log_text.append)
+        self.branch_switch_thread.progress_updated.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        self.branch_switch_thread.status_updated.connect(self.log_text.append, Qt.QueuedConnection)
         self.branch_switch_thread.switch_completed.connect(self.on_branch_switch_completed)
         
         # 启动线程
@@ -6905,31 +7171,43 @@ class ArtResourceManager(QMainWindow):
             "Unity资源文件 (*.prefab *.mat *.anim *.controller *.asset *.unity);;所有文件 (*.*)"
         )
         
-        for file in files:
-            if file not in self.upload_files:
-                self.upload_files.append(file)
-                self.file_list.add_file_item(file)
+        self._add_upload_files(files)
     
     def select_folder(self):
         """选择文件夹"""
         folder = QFileDialog.getExistingDirectory(self, "选择要上传的文件夹")
         if folder:
-            for root, dirs, files in os.walk(folder):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if file_path not in self.upload_files:
-                        self.upload_files.append(file_path)
-                        self.file_list.add_file_item(file_path)
+            self._add_upload_files(iter_folder_files(folder))
+    
+    def _add_upload_files(self, file_paths) -> List[str]:
+        """批量添加文件到上传列表，已存在的跳过；界面列表整批更新一次，返回新增的文件"""
+        added_files = []
+        for file_path in file_paths:
+            if file_path not in self._upload_files_set:
+                self.upload_files.append(file_path)
+                self._upload_files_set.add(file_path)
+                added_files.append(file_path)
+        
+        self.file_list.add_file_items(added_files)
+        return added_files
     
     def clear_files(self):
         """清空文件列表"""
+        if self._folder_scan_threads:
+            self.log_text.append("⚠️ 文件夹扫描进行中，请稍候再清空列表")
+            return
         self.upload_files.clear()
+        self._upload_files_set.clear()
         self.file_list.clear_all_items()
         # 清空文件夹上传模式信息
         self.folder_upload_modes.clear()
     
     def check_and_push(self):
         """检查资源（不自动推送）"""
+        if self._folder_scan_threads:
+            QMessageBox.warning(self, "警告", "文件夹扫描尚未完成，请稍候再检查！")
+            return
+        
         if not self.upload_files:
             QMessageBox.warning(self, "警告", "请先选择要上传的文件！")
             return
@@ -6969,8 +7247,8 @@ class ArtResourceManager(QMainWindow):
             self.folder_upload_modes
         )
         
-        self.checker_thread.progress_updated.connect(self.progress_bar.setValue)
-        self.checker_thread.status_updated.connect(self.log_text.append)
+        self.checker_thread.progress_updated.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        self.checker_thread.status_updated.connect(self.log_text.append, Qt.QueuedConnection)
         self.checker_thread.check_completed.connect(self.on_check_completed)
         self.checker_thread.detailed_report.connect(self.on_detailed_report_received)
         self.checker_thread.git_sync_required.connect(self.on_git_sync_required)
@@ -7069,9 +7347,14 @@ class ArtResourceManager(QMainWindow):
     
     def show_push_confirmation_dialog(self):
         """显示推送确认对话框"""
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("检查通过 - 确认推送")
-        msg_box.setIcon(QMessageBox.Question)
+        # 对话框和按钮只创建一次，之后每次仅更新文本
+        if not hasattr(self, '_push_msgbox'):
+            self._push_msgbox = QMessageBox(self)
+            self._push_msgbox.setWindowTitle("检查通过 - 确认推送")
+            self._push_msgbox.setIcon(QMessageBox.Question)
+            self._push_button = self._push_msgbox.addButton("推送到Git", QMessageBox.AcceptRole)
+            self._push_cancel_button = self._push_msgbox.addButton("取消", QMessageBox.RejectRole)
+        msg_box = self._push_msgbox
         
         dialog_text = (
             f"🎯 资源检查通过！\n\n"
@@ -7081,14 +7364,15 @@ class ArtResourceManager(QMainWindow):
             f"是否要将这些文件推送到Git仓库?"
         )
         msg_box.setText(dialog_text)
-        
-        push_button = msg_box.addButton("推送到Git", QMessageBox.AcceptRole)
-        cancel_button = msg_box.addButton("取消", QMessageBox.RejectRole)
-        msg_box.setDefaultButton(push_button)
+        msg_box.setDefaultButton(self._push_button)
         
         msg_box.exec()
         
-        if msg_box.clickedButton() == push_button:
+        if msg_box.clickedButton() == self._push_button:
+            if self._folder_scan_threads:
+                # 扫描中的文件夹尚未加入列表，此时推送会丢失其文件（替换模式下还会删除目标文件夹）
+                QMessageBox.warning(self, "警告", "文件夹扫描尚未完成，请等待扫描结束后重新检查再推送！")
+                return
             self.log_text.append("用户确认推送文件")
             self.execute_push_operation()
         else:
@@ -7257,7 +7541,8 @@ class ArtResourceManager(QMainWindow):
                 QMessageBox.information(self, "拉取成功", f"{message}\n\n🔄 GUID缓存已自动清除，确保下次检查使用最新数据。")
                 # 异步刷新分支列表，避免阻塞界面（强制更新，因为可能有新分支）
                 self.refresh_branches_async(fast_mode=True, force_update_ui=True)
-                self.show_current_branch()
+                # 操作开始时已获取过当前分支，且拉取/重置不会切换分支，直接复用
+                self._show_branch_info(self.git_manager.current_branch)
             else:
                 self.log_text.append(f"✗ 拉取失败: {message}")
                 self.result_text.append(f"✗ Git分支拉取失败: {message}")
@@ -7315,7 +7600,8 @@ class ArtResourceManager(QMainWindow):
                 QMessageBox.information(self, "重置成功", f"{message}\n\n🔄 GUID缓存已自动清除，确保下次检查使用最新数据。")
                 # 异步刷新分支列表，避免阻塞界面（强制更新，因为状态已重置）
                 self.refresh_branches_async(fast_mode=True, force_update_ui=True)
-                self.show_current_branch()
+                # 操作开始时已获取过当前分支，且拉取/重置不会切换分支，直接复用
+                self._show_branch_info(self.git_manager.current_branch)
             else:
                 self.log_text.append(f"✗ 重置失败: {message}")
                 self.result_text.append(f"✗ Git仓库重置失败: {message}")
@@ -7459,7 +7745,7 @@ class ArtResourceManager(QMainWindow):
         )
         
         # 连接信号
-        self.delete_reclone_thread.progress_updated.connect(self.progress_bar.setValue)
+        self.delete_reclone_thread.progress_updated.connect(self.progress_bar.setValue, Qt.QueuedConnection)
         self.delete_reclone_thread.status_updated.connect(self.on_delete_reclone_status_updated)
         self.delete_reclone_thread.operation_completed.connect(self.on_delete_reclone_completed)
         
@@ -7543,68 +7829,70 @@ class ArtResourceManager(QMainWindow):
 
     
     def show_git_url(self):
-        """显示git仓url"""
+        """显示git仓url（git命令在后台线程执行，输出逐行写入日志）"""
         if not self.git_path_edit.text():
             QMessageBox.warning(self, "警告", "请先设置Git仓库路径！")
             return
         
-        try:
-            result = subprocess.run(['git', 'remote', 'get-url', 'origin'], 
-                                  cwd=self.git_path_edit.text(), 
-                                  capture_output=True, 
-                                  text=True,
-                                  encoding='utf-8',
-                                  errors='ignore',
-                                  creationflags=SUBPROCESS_FLAGS)
-            if result.returncode == 0:
-                url = result.stdout.strip()
-                self.log_text.append(f"Git仓库URL: {url}")
-                
-                dialog = QDialog(self)
-                dialog.setWindowTitle("Git仓库URL")
-                dialog.setMinimumWidth(500)
-                dialog.setMinimumHeight(150)
-                
-                layout = QVBoxLayout()
-                dialog.setLayout(layout)
-                
-                url_text = QTextEdit()
-                url_text.setPlainText(url)
-                url_text.setReadOnly(True)
-                url_text.setMaximumHeight(60)
-                layout.addWidget(url_text)
-                
-                button_layout = QHBoxLayout()
-                
-                copy_btn = QPushButton("复制")
-                copy_btn.clicked.connect(lambda: self.copy_url_to_clipboard(url))
-                button_layout.addWidget(copy_btn)
-                
-                ok_btn = QPushButton("确定")
-                ok_btn.clicked.connect(dialog.accept)
-                ok_btn.setDefault(True)
-                button_layout.addWidget(ok_btn)
-                
-                layout.addLayout(button_layout)
-                dialog.exec_()
-                
-            else:
-                QMessageBox.warning(self, "错误", "无法获取Git仓库URL")
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"获取Git URL失败: {str(e)}")
+        # 命令执行期间禁用按钮，防止重复点击
+        self.show_git_url_btn.setEnabled(False)
+        self.git_url_thread = GitCommandThread(['remote', 'get-url', 'origin'], self.git_path_edit.text(), self)
+        self.git_url_thread.output_line.connect(lambda line: self.log_text.append(f"Git仓库URL: {line}"))
+        self.git_url_thread.error_line.connect(lambda line: self.log_text.append(f"❌ git remote: {line}"))
+        self.git_url_thread.command_finished.connect(self.on_git_url_received)
+        self.git_url_thread.finished.connect(self.git_url_thread.deleteLater)
+        self.git_url_thread.start()
+    
+    def on_git_url_received(self, returncode: int, output: str):
+        """获取Git仓库URL完成回调"""
+        self.show_git_url_btn.setEnabled(True)
+        
+        if returncode != 0:
+            QMessageBox.warning(self, "错误", "无法获取Git仓库URL")
+            return
+        
+        url = output.strip()
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Git仓库URL")
+        dialog.setMinimumWidth(500)
+        dialog.setMinimumHeight(150)
+        
+        layout = QVBoxLayout()
+        dialog.setLayout(layout)
+        
+        url_text = QTextEdit()
+        url_text.setPlainText(url)
+        url_text.setReadOnly(True)
+        url_text.setMaximumHeight(60)
+        layout.addWidget(url_text)
+        
+        button_layout = QHBoxLayout()
+        
+        copy_btn = QPushButton("复制")
+        copy_btn.clicked.connect(lambda: self.copy_url_to_clipboard(url))
+        button_layout.addWidget(copy_btn)
+        
+        ok_btn = QPushButton("确定")
+        ok_btn.clicked.connect(dialog.accept)
+        ok_btn.setDefault(True)
+        button_layout.addWidget(ok_btn)
+        
+        layout.addLayout(button_layout)
+        dialog.exec_()
     
     def copy_url_to_clipboard(self, url: str):
         """复制URL到剪贴板"""
         try:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(url)
+            self._clipboard.setText(url)
             self.log_text.append(f"已复制URL到剪贴板: {url}")
-            QMessageBox.information(self, "复制成功", "Git仓库URL已复制到剪贴板！")
+            # 使用状态栏提示代替模态对话框，避免阻塞事件循环
+            self.statusBar().showMessage("Git仓库URL已复制到剪贴板", 2000)
         except Exception as e:
             QMessageBox.critical(self, "复制失败", f"复制到剪贴板失败: {str(e)}")
     
     def query_guid(self):
-        """查询GUID"""
+        """查询GUID（在后台线程扫描SVN仓库，避免阻塞界面）"""
         guid = self.guid_edit.text().strip()
         if not guid:
             QMessageBox.warning(self, "警告", "请输入GUID！")
@@ -7614,22 +7902,31 @@ class ArtResourceManager(QMainWindow):
             QMessageBox.warning(self, "警告", "请先设置SVN仓库路径！")
             return
         
+        if hasattr(self, 'guid_query_thread') and self.guid_query_thread.isRunning():
+            self.log_text.append("⚠️ GUID查询正在进行中，请稍候...")
+            return
+        
         self.log_text.append(f"在SVN仓库中查询GUID: {guid}")
+        self.query_btn.setEnabled(False)
         
-        found_files = []
         svn_path = self.svn_path_edit.text()
-        
-        for root, dirs, files in os.walk(svn_path):
-            for file in files:
-                if file.endswith('.meta'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            if guid in content:
-                                found_files.append(file_path)
-                    except Exception:
-                        continue
+        # 复用本次会话已建立的GUID索引（SVN路径变化后索引失效）
+        guid_index = self._svn_guid_index if self._svn_guid_index_root == svn_path else None
+        self.guid_query_thread = GuidQueryThread(svn_path, guid, guid_index)
+        self.guid_query_thread.index_built.connect(self.on_guid_index_built)
+        self.guid_query_thread.query_completed.connect(self.on_guid_query_completed)
+        self.guid_query_thread.query_failed.connect(self.on_guid_query_failed)
+        self.guid_query_thread.start()
+    
+    def on_guid_index_built(self, svn_path: str, guid_index: dict):
+        """保存GUID查询线程建立的索引，供后续查询复用"""
+        self._svn_guid_index_root = svn_path
+        self._svn_guid_index = guid_index
+        self.log_text.append(f"📇 已建立SVN GUID索引，共 {len(guid_index)} 个GUID")
+    
+    def on_guid_query_completed(self, guid: str, found_files: list):
+        """GUID查询完成回调"""
+        self.query_btn.setEnabled(True)
         
         if found_files:
             result_msg = f"找到 {len(found_files)} 个匹配的文件:\n"
@@ -7644,9 +7941,19 @@ class ArtResourceManager(QMainWindow):
             msg = f"未找到GUID为 {guid} 的文件"
             self.result_text.append(msg)
             QMessageBox.information(self, "查询结果", msg)
+    
+    def on_guid_query_failed(self, error_message: str):
+        """GUID查询失败回调"""
+        self.query_btn.setEnabled(True)
+        self.log_text.append(f"❌ {error_message}")
+        QMessageBox.critical(self, "查询失败", error_message)
 
     def clear_guid_cache(self):
         """清除GUID缓存"""
+        # 同时丢弃SVN GUID索引，下次查询时重新建立
+        self._svn_guid_index = None
+        self._svn_guid_index_root = None
+        
         try:
             if not self.git_manager.git_path or not os.path.exists(self.git_manager.git_path):
                 QMessageBox.warning(self, "警告", "Git仓库路径无效，无法清除缓存")
@@ -7915,7 +8222,7 @@ class ArtResourceManager(QMainWindow):
                     if meta_path in result['meta_files']:
                         original_meta_count += 1
                         original_meta_files.append(meta_path)
-                        if meta_path not in self.upload_files:
+                        if meta_path not in self._upload_files_set:
                             self.log_text.append(f"📝 原始文件 {os.path.basename(file_path)} 的Meta文件将被添加")
             
             if original_meta_count > 0:
@@ -7948,22 +8255,21 @@ class ArtResourceManager(QMainWindow):
                 
                 if reply == QMessageBox.Yes:
                     # 添加文件到上传列表
-                    added_count = 0
+                    pending_files = []
                     for file_path in files_to_add:
                         if os.path.exists(file_path):
-                            # 使用标准化路径进行重复检查
+                            # 使用标准化路径进行重复检查（复用上方构建的标准化路径集合）
                             normalized_file_path = os.path.normpath(os.path.abspath(file_path))
-                            existing_normalized = [os.path.normpath(os.path.abspath(f)) for f in self.upload_files]
                             
-                            if normalized_file_path not in existing_normalized:
-                                self.upload_files.append(file_path)
-                                added_count += 1
-                                
-                                # 添加到UI列表
-                                self.file_list.add_file_item(file_path)
+                            if normalized_file_path not in normalized_upload_files and file_path not in self._upload_files_set:
+                                normalized_upload_files.add(normalized_file_path)
+                                pending_files.append(file_path)
                             else:
                                 self.log_text.append(f"⚠️ 最终检查：跳过重复文件 {os.path.basename(file_path)}")
                     
+                    # 整批添加到上传列表和UI列表
+                    added_count = len(self._add_upload_files(pending_files))
+                    
                     self.log_text.append(f"✅ 成功添加 {added_count} 个依赖文件到上传列表")
                     self.log_text.append(f"📋 当前上传列表总计: {len(self.upload_files)} 个文件")
                     
@@ -8008,25 +8314,36 @@ class ArtResourceManager(QMainWindow):
             self.log_text.append(f"❌ 拖拽失败：SVN仓库路径不存在")
             return
         
-        # 分离文件和文件夹
-        files = [path for path in file_paths if os.path.isfile(path)]
-        folders = [path for path in file_paths if os.path.isdir(path)]
+        # 分离文件和文件夹（每个顶层路径只判断一次类型，子项交由iter_folder_files遍历）
+        files = []
+        folders = []
+        for path in file_paths:
+            if os.path.isdir(path):
+                folders.append(path)
+            elif os.path.isfile(path):
+                files.append(path)
         
         print(f"DEBUG: 分离结果 - 文件: {len(files)}, 文件夹: {len(folders)}")
         
-        total_added = 0
+        # 本次拖拽的汇总信息，处理过程中不弹窗，最后统一显示一个总结对话框
+        drop_result = {
+            "svn_repo_path": svn_repo_path,
+            "has_entries": bool(files or folders),
+            "added_count": 0,
+            "invalid": [],
+            "skipped_non_assets": 0,
+        }
         
         # 处理文件（使用现有逻辑）
         if files:
             print(f"DEBUG: 处理文件: {files}")
             valid_files, invalid_files = self._validate_dropped_files(files, svn_repo_path)
-            
-            if invalid_files:
-                self._show_invalid_files_warning(invalid_files, svn_repo_path, len(valid_files))
+            drop_result["invalid"].extend(invalid_files)
             
             if valid_files:
-                added_count = self._add_valid_files(valid_files)
-                total_added += added_count
+                added_count, skipped_count = self._add_valid_files(valid_files)
+                drop_result["added_count"] += added_count
+                drop_result["skipped_non_assets"] += skipped_count
                 
                 if added_count > 0:
                     self.log_text.append(f"✅ 通过拖拽添加了 {added_count} 个文件")
@@ -8037,30 +8354,104 @@ class ArtResourceManager(QMainWindow):
             
             # 验证文件夹是否在SVN仓库目录下
             valid_folders, invalid_folders = self._validate_dropped_files(folders, svn_repo_path)
-            
-            if invalid_folders:
-                self._show_invalid_files_warning(invalid_folders, svn_repo_path, len(valid_folders))
+            drop_result["invalid"].extend(invalid_folders)
             
             if valid_folders:
-                folder_added_count = self._handle_folder_drops(valid_folders)
-                total_added += folder_added_count
+                selected_folders = self._handle_folder_drops(valid_folders, drop_result)
+                if selected_folders:
+                    # 文件夹遍历放到后台线程，完成后再添加文件并显示总结
+                    self._start_folder_scan(selected_folders, drop_result)
+                    return
+        
+        self._show_drop_summary(drop_result)
+
+    def _show_drop_summary(self, drop_result: dict):
+        """显示拖拽操作的总结信息（无效路径、跳过的文件和添加结果合并到一个非模态对话框）"""
+        total_added = drop_result["added_count"]
+        invalid_paths = drop_result["invalid"]
+        skipped_count = drop_result["skipped_non_assets"]
+        sections = []
+        
+        if invalid_paths:
+            invalid_count = len(invalid_paths)
+            self.log_text.append(f"❌ 路径验证失败：{invalid_count} 个文件或文件夹不在SVN仓库目录中")
+            
+            invalid_msg = f"检测到 {invalid_count} 个文件或文件夹不在指定的SVN仓库目录中：\n\n"
+            invalid_msg += f"SVN仓库路径：{drop_result['svn_repo_path']}\n\n"
+            invalid_msg += "无效的路径：\n"
+            for i, invalid_path in enumerate(invalid_paths[:5], 1):
+                invalid_msg += f"  {i}. {invalid_path}\n"
+            if invalid_count > 5:
+                invalid_msg += f"  ... 还有 {invalid_count - 5} 个\n"
+            invalid_msg += "\n❌ 只有位于该SVN仓库目录下的文件或文件夹才能被添加！"
+            sections.append(invalid_msg)
+        
+        if skipped_count > 0:
+            sections.append(f"⚠️ 跳过了 {skipped_count} 个不在Assets目录下的文件")
         
-        # 显示总结信息
         if total_added > 0:
-            success_msg = f"成功添加了 {total_added} 个有效文件到上传列表"
             self.log_text.append(f"✅ 拖拽操作完成，共添加 {total_added} 个文件")
-            QMessageBox.information(self, "添加成功", success_msg)
-        elif not files and not folders:
+            sections.append(f"✅ 成功添加了 {total_added} 个有效文件到上传列表")
+        elif not drop_result["has_entries"]:
             self.log_text.append("❌ 没有有效文件或文件夹可添加")
         else:
             self.log_text.append("❌ 没有添加新文件（文件可能已存在或不在Assets目录下）")
+        
+        if not sections:
+            return
+        
+        # 非模态显示，不阻塞事件循环，也不影响下一次拖拽
+        msg_box = QMessageBox(self)
+        msg_box.setAttribute(Qt.WA_DeleteOnClose)
+        msg_box.setIcon(QMessageBox.Warning if invalid_paths else QMessageBox.Information)
+        msg_box.setWindowTitle("文件路径验证失败" if invalid_paths else "添加成功")
+        msg_box.setText("\n\n".join(sections))
+        msg_box.setStandardButtons(QMessageBox.Close)
+        msg_box.setModal(False)
+        msg_box.show()
+
+    def _start_folder_scan(self, folder_paths: List[str], drop_result: dict):
+        """启动后台线程遍历拖拽的文件夹，避免大目录阻塞界面"""
+        self.log_text.append(f"🔍 正在扫描 {len(folder_paths)} 个文件夹...")
+        self.statusBar().showMessage("正在扫描拖拽的文件夹...")
+        
+        # 每次拖拽使用独立线程（以主窗口为父对象保持存活，结束后自动释放），
+        # 本次拖拽的汇总信息随完成信号一起带回
+        scan_thread = FolderScanThread(folder_paths, drop_result, self)
+        scan_thread.scan_completed.connect(self.on_folder_scan_completed)
+        scan_thread.finished.connect(lambda: self._on_folder_scan_finished(scan_thread))
+        scan_thread.finished.connect(scan_thread.deleteLater)
+        self._folder_scan_threads.add(scan_thread)
+        self._update_folder_scan_buttons()
+        scan_thread.start()
+
+    def on_folder_scan_completed(self, folder_files: dict, drop_result: dict):
+        """文件夹扫描完成回调：登记替换模式并整批添加文件，然后显示总结"""
+        # 替换模式与文件夹中的文件同时生效，避免推送时只删除目标文件夹却没有文件可复制
+        self.folder_upload_modes.update(drop_result.get("replace_modes", {}))
+        for folder_path, scanned_files in folder_files.items():
+            drop_result["added_count"] += self._add_folder_files_to_upload_list(folder_path, scanned_files)
+        
+        self.statusBar().showMessage("就绪")
+        self._show_drop_summary(drop_result)
+
+    def _on_folder_scan_finished(self, scan_thread: QThread):
+        """文件夹扫描线程结束后移出跟踪集合，全部结束时恢复按钮"""
+        self._folder_scan_threads.discard(scan_thread)
+        self._update_folder_scan_buttons()
+
+    def _update_folder_scan_buttons(self):
+        """文件夹扫描期间禁用检查和清空按钮"""
+        scanning = bool(self._folder_scan_threads)
+        self.check_btn.setEnabled(not scanning)
+        self.clear_files_btn.setEnabled(not scanning)
 
     def _validate_dropped_files(self, file_paths: List[str], svn_repo_path: str) -> Tuple[List[str], List[str]]:
         """验证拖拽的文件或文件夹是否在SVN仓库目录下"""
         valid_files = []
         invalid_files = []
         
-        normalized_svn_path = os.path.abspath(svn_repo_path).replace('\\', '/')
+        normalized_svn_path = self._normalize_svn_repo_path(svn_repo_path)
         
         for file_path in file_paths:
             normalized_file_path = os.path.abspath(file_path).replace('\\', '/')
@@ -8072,62 +8463,49 @@ class ArtResourceManager(QMainWindow):
         
         return valid_files, invalid_files
 
-    def _show_invalid_files_warning(self, invalid_files: List[str], svn_repo_path: str, valid_count: int):
-        """显示无效文件警告"""
-        invalid_count = len(invalid_files)
-        
-        error_msg = f"检测到 {invalid_count} 个文件或文件夹不在指定的SVN仓库目录中：\n\n"
-        error_msg += f"SVN仓库路径：{svn_repo_path}\n\n"
-        
-        error_msg += "无效的路径：\n"
-        for i, invalid_file in enumerate(invalid_files[:5], 1):
-            error_msg += f"  {i}. {invalid_file}\n"
-        if invalid_count > 5:
-            error_msg += f"  ... 还有 {invalid_count - 5} 个\n"
-        
-        error_msg += "\n❌ 只有位于该SVN仓库目录下的文件或文件夹才能被添加！"
-        
-        if valid_count > 0:
-            error_msg += f"\n\n✅ 其中 {valid_count} 个有效路径将被处理并添加到上传列表。"
-        
-        QMessageBox.warning(self, "文件路径验证失败", error_msg)
-        self.log_text.append(f"❌ 路径验证失败：{invalid_count} 个文件或文件夹不在SVN仓库目录中")
-
-    def _add_valid_files(self, valid_files: List[str]) -> int:
-        """添加有效文件到上传列表"""
+    def _add_valid_files(self, valid_files: List[str]) -> Tuple[int, int]:
+        """添加有效文件到上传列表，返回 (添加数量, 跳过的非Assets文件数量)"""
         added_count = 0
+        skipped_count = 0
         svn_repo_path = self.svn_path_edit.text().strip()
+        pending_files = []  # 待整批添加的单个文件，保持原有添加顺序
         
         for file_path in valid_files:
             if os.path.isfile(file_path):
                 if self._is_valid_assets_file(file_path, svn_repo_path):
-                    if file_path not in self.upload_files:
-                        self.upload_files.append(file_path)
-                        self.file_list.add_file_item(file_path)
-                        added_count += 1
+                    pending_files.append(file_path)
                 else:
+                    skipped_count += 1
                     self.log_text.append(f"⚠️ 跳过非Assets目录下的文件: {os.path.basename(file_path)}")
                     
             elif os.path.isdir(file_path):
-                folder_added_count = 0
-                for root, _, files in os.walk(file_path):
-                    for file in files:
-                        full_path = os.path.join(root, file)
-                        if self._is_valid_assets_file(full_path, svn_repo_path):
-                            if full_path not in self.upload_files:
-                                self.upload_files.append(full_path)
-                                self.file_list.add_file_item(full_path)
-                                added_count += 1
-                                folder_added_count += 1
+                # 先提交之前收集的单个文件，再整批添加文件夹内容
+                added_count += len(self._add_upload_files(pending_files))
+                pending_files = []
+                
+                folder_files = [full_path for full_path in iter_folder_files(file_path)
+                                if self._is_valid_assets_file(full_path, svn_repo_path)]
+                folder_added_count = len(self._add_upload_files(folder_files))
+                added_count += folder_added_count
                 if folder_added_count > 0:
                     self.log_text.append(f"✅ 从文件夹 {os.path.basename(file_path)} 添加了 {folder_added_count} 个文件")
-        return added_count
+        
+        added_count += len(self._add_upload_files(pending_files))
+        return added_count, skipped_count
+    
+    def _normalize_svn_repo_path(self, svn_repo_path: str) -> str:
+        """规范化SVN仓库路径（结果按原始路径缓存，批量校验文件时只计算一次）"""
+        cached = getattr(self, '_normalized_svn_path_cache', None)
+        if cached is None or cached[0] != svn_repo_path:
+            cached = (svn_repo_path, os.path.abspath(svn_repo_path).replace('\\', '/'))
+            self._normalized_svn_path_cache = cached
+        return cached[1]
     
     def _is_valid_assets_file(self, file_path: str, svn_repo_path: str) -> bool:
         """检查文件是否在SVN仓库的Assets目录下"""
         try:
             normalized_file_path = os.path.abspath(file_path).replace('\\', '/')
-            normalized_svn_path = os.path.abspath(svn_repo_path).replace('\\', '/')
+            normalized_svn_path = self._normalize_svn_repo_path(svn_repo_path)
             
             if not normalized_file_path.startswith(normalized_svn_path):
                 return False
@@ -8140,9 +8518,13 @@ class ArtResourceManager(QMainWindow):
         except Exception as e:
             return False
 
-    def _handle_folder_drops(self, folder_paths: List[str]) -> int:
-        """处理文件夹拖拽的主方法"""
-        total_added = 0
+    def _handle_folder_drops(self, folder_paths: List[str], drop_result: dict) -> List[str]:
+        """处理文件夹拖拽的主方法：为每个文件夹选择上传模式，返回需要扫描添加的文件夹
+        
+        替换模式的信息先记在drop_result["replace_modes"]中，扫描完成后才与文件一起登记。
+        """
+        selected_folders = []
+        replace_modes = drop_result.setdefault("replace_modes", {})
         
         for folder_path in folder_paths:
             folder_name = os.path.basename(folder_path)
@@ -8156,21 +8538,21 @@ class ArtResourceManager(QMainWindow):
                 print(f"DEBUG: 用户为文件夹 {folder_name} 选择了模式: {selected_mode}")
                 
                 if selected_mode == FolderUploadModeDialog.REPLACE_MODE:
-                    added_count = self._handle_replace_mode(folder_path)
-                    total_added += added_count
+                    replace_modes[folder_path] = self._handle_replace_mode(folder_path)
+                    selected_folders.append(folder_path)
                 elif selected_mode == FolderUploadModeDialog.MERGE_MODE:
-                    added_count = self._handle_merge_mode(folder_path)
-                    total_added += added_count
+                    # 合并模式就是现有的逻辑，直接添加文件夹中的所有文件
+                    selected_folders.append(folder_path)
                 
                 self._log_folder_mode_selection(folder_path, selected_mode)
             else:
                 # 用户取消了文件夹的上传
                 self.log_text.append(f"❌ 用户取消了文件夹 {folder_name} 的上传")
         
-        return total_added
+        return selected_folders
     
-    def _handle_replace_mode(self, folder_path: str) -> int:
-        """处理替换模式：记录文件夹信息，在推送时执行删除"""
+    def _handle_replace_mode(self, folder_path: str) -> dict:
+        """处理替换模式：返回文件夹的替换信息，推送时据此删除目标文件夹（由扫描完成回调登记）"""
         folder_name = os.path.basename(folder_path)
         
         # 计算在Git仓库中的目标路径
@@ -8186,41 +8568,23 @@ class ArtResourceManager(QMainWindow):
         # 在Git仓库中的完整目标路径
         target_folder_path = os.path.join(git_path, mapped_path).replace('\\', '/')
         
-        # 记录文件夹上传模式信息
-        self.folder_upload_modes[folder_path] = {
+        print(f"DEBUG: 替换模式 - 源路径: {folder_path}")
+        print(f"DEBUG: 替换模式 - 目标路径: {target_folder_path}")
+        
+        # 文件夹上传模式信息
+        return {
             "mode": "replace",
             "target_path": target_folder_path,
             "folder_name": folder_name
         }
-        
-        print(f"DEBUG: 替换模式 - 源路径: {folder_path}")
-        print(f"DEBUG: 替换模式 - 目标路径: {target_folder_path}")
-        
-        # 添加文件夹中的所有文件到上传列表
-        added_count = self._add_folder_files_to_upload_list(folder_path)
-        
-        return added_count
     
-    def _handle_merge_mode(self, folder_path: str) -> int:
-        """处理合并模式：使用现有的添加文件逻辑"""
-        # 合并模式就是现有的逻辑，直接添加文件夹中的所有文件
-        added_count = self._add_folder_files_to_upload_list(folder_path)
-        
-        return added_count
-    
-    def _add_folder_files_to_upload_list(self, folder_path: str) -> int:
-        """将文件夹中的所有有效文件添加到上传列表"""
-        added_count = 0
+    def _add_folder_files_to_upload_list(self, folder_path: str, scanned_files: List[str]) -> int:
+        """将文件夹中扫描到的所有有效文件添加到上传列表"""
         svn_repo_path = self.svn_path_edit.text().strip()
         
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                full_path = os.path.join(root, file)
-                if self._is_valid_assets_file(full_path, svn_repo_path):
-                    if full_path not in self.upload_files:
-                        self.upload_files.append(full_path)
-                        self.file_list.add_file_item(full_path)
-                        added_count += 1
+        folder_files = [full_path for full_path in scanned_files
+                        if self._is_valid_assets_file(full_path, svn_repo_path)]
+        added_count = len(self._add_upload_files(folder_files))
         
         return added_count
     
@@ -8432,7 +8796,7 @@ class ArtResourceManager(QMainWindow):
         
         # 创建部署线程
         self.deploy_thread = DeployRepositoriesThread(deploy_dir)
-        self.deploy_thread.progress_updated.connect(self.progress_bar.setValue)
+        self.deploy_thread.progress_updated.connect(self.progress_bar.setValue, Qt.QueuedConnection)
         self.deploy_thread.status_updated.connect(self.on_deploy_status_updated)
         self.deploy_thread.deployment_completed.connect(self.on_deployment_completed)
         
@@ -9078,6 +9442,124 @@ class BranchLoadThread(QThread):
             self.load_failed.emit(error_msg)
 
 
+class GuidQueryThread(QThread):
+    """GUID查询线程 - 在后台扫描SVN仓库中的meta文件
+    
+    完整的32位GUID：若该GUID是某个资源自身的GUID，只返回该资源的meta文件；
+    否则返回内容中引用了该GUID的meta文件。首次查询在同一次扫描中顺带建立会话级索引，
+    之后的查询直接查索引，索引未命中时只做一次内容扫描（不重建索引）。
+    输入不是完整GUID时，始终按内容扫描。
+    """
+    
+    query_completed = pyqtSignal(str, list)  # guid, found_files
+    query_failed = pyqtSignal(str)  # error_message
+    index_built = pyqtSignal(str, dict)  # svn_path, guid_index
+    
+    GUID_PATTERN = re.compile(r'[a-fA-F0-9]{32}')
+    
+    def __init__(self, svn_path: str, guid: str, guid_index: dict = None):
+        super().__init__()
+        self.svn_path = svn_path
+        self.guid = guid
+        self.guid_index = guid_index  # 已有的会话索引，None表示尚未建立
+    
+    def run(self):
+        """扫描SVN仓库查找包含GUID的meta文件"""
+        try:
+            if self.GUID_PATTERN.fullmatch(self.guid):
+                found_files = self._query_full_guid(self.guid.lower())
+            else:
+                found_files = search_guid_in_meta_files(self.svn_path, self.guid)
+            self.query_completed.emit(self.guid, found_files)
+        except Exception as e:
+            self.query_failed.emit(f"查询GUID失败: {str(e)}")
+    
+    def _query_full_guid(self, guid: str) -> List[str]:
+        """查询完整GUID，优先返回该GUID对应资源自身的meta文件"""
+        if self.guid_index is None:
+            # 首次查询：一次扫描同时建立索引和收集内容匹配结果
+            self.guid_index, content_matches = build_meta_guid_index(self.svn_path, guid)
+            self.index_built.emit(self.svn_path, self.guid_index)
+            return self.guid_index.get(guid) or content_matches
+        
+        # 命中的文件再次确认内容，避免使用过期的索引结果
+        needle = guid.encode('utf-8')
+        found_files = [path for path in self.guid_index.get(guid, []) if _meta_file_contains_guid(path, needle)]
+        if found_files:
+            return found_files
+        # 索引未命中（或已过期），回退为内容扫描
+        return search_guid_in_meta_files(self.svn_path, guid)
+
+
+class FolderScanThread(QThread):
+    """文件夹扫描线程 - 在后台遍历拖拽的文件夹"""
+    
+    scan_completed = pyqtSignal(dict, dict)  # {folder_path: [file_path, ...]}, drop_result
+    
+    def __init__(self, folder_paths: List[str], drop_result: dict = None, parent=None):
+        super().__init__(parent)
+        self.folder_paths = folder_paths
+        self.drop_result = drop_result if drop_result is not None else {}  # 同一次拖拽的汇总信息
+    
+    def run(self):
+        """遍历所有文件夹，按文件夹收集文件路径"""
+        folder_files = {}
+        for folder_path in self.folder_paths:
+            folder_files[folder_path] = list(iter_folder_files(folder_path))
+        self.scan_completed.emit(folder_files, self.drop_result)
+
+
+class GitCommandThread(QThread):
+    """Git命令线程 - 在后台执行git命令，stdout和stderr分别逐行通过信号送回主线程"""
+    
+    output_line = pyqtSignal(str)  # stdout的一行
+    error_line = pyqtSignal(str)  # stderr的一行
+    command_finished = pyqtSignal(int, str)  # 退出码, 完整的stdout输出
+    
+    def __init__(self, args: List[str], cwd: str, parent=None):
+        super().__init__(parent)
+        self.args = args
+        self.cwd = cwd
+    
+    def run(self):
+        """执行git命令；stderr由辅助线程同时读取，避免任一管道写满导致阻塞"""
+        try:
+            process = subprocess.Popen(
+                ['git'] + self.args,
+                cwd=self.cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                errors='ignore',
+                bufsize=1,
+                creationflags=SUBPROCESS_FLAGS
+            )
+        except Exception as e:
+            self.error_line.emit(str(e))
+            self.command_finished.emit(-1, "")
+            return
+        
+        stderr_reader = threading.Thread(target=self._read_stderr, args=(process.stderr,), daemon=True)
+        stderr_reader.start()
+        
+        output_lines = []
+        for line in process.stdout:
+            output_lines.append(line)
+            self.output_line.emit(line.rstrip())
+        process.stdout.close()
+        stderr_reader.join()
+        
+        self.command_finished.emit(process.wait(), ''.join(output_lines))
+    
+    def _read_stderr(self, stream):
+        """逐行读取stderr并作为错误输出发出"""
+        for line in stream:
+            if line.strip():
+                self.error_line.emit(line.rstrip())
+        stream.close()
+
+
 class PathMappingManagerDialog(QDialog):
     """路径映射管理对话框"""
     
@@ -9302,9 +9784,9 @@ class PathMappingManagerDialog(QDialog):
         rule = rules[rule_id]
         
         try:
-            import re
-            if re.match(rule['source_pattern'], test_path):
-                result = re.sub(rule['source_pattern'], rule['target_pattern'], test_path)
+            source_pattern = re.compile(rule['source_pattern'])
+            if source_pattern.match(test_path):
+                result = source_pattern.sub(rule['target_pattern'], test_path)
                 self.test_result.setText(f"✅ 规则匹配成功\n原始路径: {test_path}\n映射结果: {result}")
             else:
                 self.test_result.setText(f"❌ 规则不匹配\n测试路径: {test_path}\n匹配模式: {rule['source_pattern']}")
@@ -9467,6 +9949,8 @@ class BranchSelectorDialog(QDialog):
         
         # 分支列表
         self.branch_list = QListWidget()
+        # 所有行高度一致，Qt无需逐项计算尺寸
+        self.branch_list.setUniformItemSizes(True)
         self.populate_branch_list()
         layout.addWidget(self.branch_list)
         
@@ -9494,29 +9978,31 @@ class BranchSelectorDialog(QDialog):
         self.search_input.setFocus()
     
     def populate_branch_list(self):
-        """填充分支列表"""
-        self.branch_list.clear()
-        
-        if not self.filtered_branches:
-            # 没有匹配的分支时显示提示
-            item = QListWidgetItem("没有找到匹配的分支")
-            item.setFlags(Qt.NoItemFlags)  # 不可选择
-            item.setTextAlignment(Qt.AlignCenter)
-            self.branch_list.addItem(item)
-            return
-        
-        for branch in self.filtered_branches:
-            item = QListWidgetItem(branch)
-            if branch == self.current_branch:
-                item.setText(f"★ {branch} (当前分支)")
+        """填充分支列表（每次输入过滤都会调用，整批填充只触发一次重绘）"""
+        self.branch_list.setUpdatesEnabled(False)
+        try:
+            self.branch_list.clear()
+            
+            if not self.filtered_branches:
+                # 没有匹配的分支时显示提示
+                item = QListWidgetItem("没有找到匹配的分支")
+                item.setFlags(Qt.NoItemFlags)  # 不可选择
+                item.setTextAlignment(Qt.AlignCenter)
+                self.branch_list.addItem(item)
+                return
+            
+            # 普通分支直接按字符串批量添加，当前分支单独加粗并选中
+            self.branch_list.addItems(self.filtered_branches)
+            if self.current_branch in self.filtered_branches:
+                item = self.branch_list.item(self.filtered_branches.index(self.current_branch))
+                item.setText(f"★ {self.current_branch} (当前分支)")
                 font = item.font()
                 font.setBold(True)
                 item.setFont(font)
                 # 设置当前分支为选中状态
-                self.branch_list.addItem(item)
                 self.branch_list.setCurrentItem(item)
-            else:
-                self.branch_list.addItem(item)
+        finally:
+            self.branch_list.setUpdatesEnabled(True)
     
     def filter_branches(self):
         """根据搜索关键词过滤分支"""
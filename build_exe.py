@@ -10,6 +10,48 @@ import sys
 import subprocess
 import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# 最终输出的exe（copy_exe_to_root会删除dist目录，因此以根目录下的副本判断是否需要重新打包）
+OUTPUT_EXE = Path("美术资源上传工具.exe")
+# 除Python源码外会被打包进exe的文件
+EXTRA_BUILD_INPUTS = ("config.json", "app_icon.ico")
+# 收集源码时跳过的目录
+SOURCE_EXCLUDE_DIRS = {"build", "dist", "__pycache__"}
+
+# 并行删除文件的线程数（删除以I/O为主，Windows上逐个unlink是清理的主要耗时）
+RMTREE_WORKERS = 64
+
+def fast_rmtree(root):
+    """并行删除目录树，替代逐个删除文件的shutil.rmtree"""
+    files = []
+    dirs = []
+    for current_dir, sub_dirs, file_names in os.walk(root, topdown=False):
+        files.extend(os.path.join(current_dir, name) for name in file_names)
+        # 指向目录的符号链接不会被os.walk进入，按文件方式删除链接本身
+        files.extend(os.path.join(current_dir, name) for name in sub_dirs
+                     if os.path.islink(os.path.join(current_dir, name)))
+        dirs.append(current_dir)
+    
+    with ThreadPoolExecutor(RMTREE_WORKERS) as executor:
+        list(executor.map(os.unlink, files))
+    
+    # topdown=False保证子目录先于父目录出现，可直接依次删除
+    for dir_path in dirs:
+        os.rmdir(dir_path)
+
+def collect_build_sources():
+    """收集参与打包的源文件（排除构建输出目录）"""
+    sources = [path for path in Path('.').rglob('*.py')
+               if not SOURCE_EXCLUDE_DIRS.intersection(path.parts)]
+    sources.extend(Path(name) for name in EXTRA_BUILD_INPUTS if os.path.exists(name))
+    return sources
+
+def _needs_rebuild(exe_path, sources):
+    """exe不存在或任一源文件比exe新时需要重新打包"""
+    if not exe_path.exists() or not sources:
+        return True
+    return max(source.stat().st_mtime for source in sources) > exe_path.stat().st_mtime
 
 def check_pyinstaller():
     """检查是否安装了PyInstaller"""
@@ -126,7 +168,7 @@ def clean_build_files():
     
     for dir_name in dirs_to_remove:
         if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
+            fast_rmtree(dir_name)
             print(f"  删除目录: {dir_name}")
     
     for file_name in files_to_remove:
@@ -138,12 +180,12 @@ def copy_exe_to_root():
     """将生成的exe文件复制到项目根目录"""
     exe_path = Path("dist/美术资源上传工具.exe")
     if exe_path.exists():
-        shutil.copy2(exe_path, "美术资源上传工具.exe")
+        shutil.copy2(exe_path, OUTPUT_EXE)
         print("✅ exe文件已复制到项目根目录")
         
         # 删除dist目录
         if os.path.exists("dist"):
-            shutil.rmtree("dist")
+            fast_rmtree("dist")
             print("  删除了dist目录")
         
         return True
@@ -174,6 +216,11 @@ def main():
         print("  3. 打包将继续进行，但exe文件将使用默认图标")
         print()
     
+    # 源文件未变化时跳过耗时的PyInstaller打包
+    if not _needs_rebuild(OUTPUT_EXE, collect_build_sources()):
+        print(f"✅ {OUTPUT_EXE} 已是最新（源文件未修改），跳过打包")
+        return True
+    
     # 检查并安装PyInstaller
     if not check_pyinstaller():
         if not install_pyinstaller():
@@ -4,11 +4,50 @@
 import os
 import sys
 import re
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 
 # 添加当前目录到路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from art_resource_manager import ResourceDependencyAnalyzer
+from art_resource_manager import ResourceDependencyAnalyzer, iter_folder_files
+
+# 贴图GUID提取正则：合并YAML与JSON两种写法，一次扫描完成
+# - YAML: texture: {...guid: xxx} / m_Texture: {...m_GUID: xxx}（忽略大小写时 texture:/guid: 已覆盖带 m_ 前缀的写法）
+# - JSON: "texture"/"m_Texture": {... "guid"/"m_GUID": "xxx"}
+# 两个分支都限定在同一个 {...} 内匹配（[^}]），不会跨越到后续引用中回溯，扫描时间与文件长度线性相关
+# 按字节匹配（GUID均为ASCII），配合mmap直接扫描文件内容，无需解码出完整字符串
+TEXTURE_GUID_RE = re.compile(
+    rb'texture:\s*{[^}]*?guid:\s*([a-f0-9]{32})'
+    rb'|"(?:m_)?texture":\s*{[^}]*"(?:m_)?guid":\s*"([a-f0-9]{32})"',
+    re.IGNORECASE | re.DOTALL
+)
+
+# 图片资源扩展名
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.tga', '.psd', '.tiff', '.bmp'})
+
+# 材质数量低于该值时串行解析：进程池启动时每个子进程都要重新导入art_resource_manager和PyQt5
+# （Windows下为spawn方式），材质较少时启动开销远大于并行收益。解析是持有GIL的正则匹配，
+# 换成线程池也不会更快，因此仍使用进程池，只在材质很多时启用
+PARALLEL_MIN_MATERIALS = 500
+
+
+def _extract_texture_guids(material_path):
+    """提取单个材质文件中的贴图GUID（模块级函数，便于进程池序列化）
+    
+    返回 (GUID列表, 错误信息)，读取失败时GUID列表为空。
+    """
+    try:
+        with open(material_path, 'rb') as f:
+            # 空文件无法mmap，也不可能包含贴图引用
+            if os.fstat(f.fileno()).st_size == 0:
+                return [], None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return [(yaml_guid or json_guid).decode('ascii').lower()
+                        for yaml_guid, json_guid in TEXTURE_GUID_RE.findall(content)], None
+    except Exception as e:
+        return [], str(e)
+
 
 def check_material_textures():
     """检查材质文件中的贴图引用"""
@@ -40,54 +79,42 @@ def check_material_textures():
     found_materials = []
     
     print(f"🔍 在SVN仓库中查找材质文件...")
-    for root, dirs, files in os.walk(svn_root):
-        for file in files:
-            if file in material_files:
-                file_path = os.path.join(root, file)
-                found_materials.append(file_path)
-                print(f"✅ 找到: {file}")
+    remaining_materials = set(material_files)
+    for file_path in iter_folder_files(svn_root, '.mat'):
+        file = os.path.basename(file_path)
+        if file in remaining_materials:
+            found_materials.append(file_path)
+            remaining_materials.discard(file)
+            print(f"✅ 找到: {file}")
+            # 所有目标材质都已找到，无需继续遍历整个SVN仓库
+            if not remaining_materials:
+                break
     
     print(f"\n📊 找到 {len(found_materials)} 个材质文件")
     
-    # 分析每个材质文件中的贴图引用
+    # 分析每个材质文件中的贴图引用（正则解析为CPU密集型，文件较多时交给进程池并行）
     all_texture_guids = set()
     
-    for material_path in found_materials:
+    if len(found_materials) < PARALLEL_MIN_MATERIALS:
+        results = [_extract_texture_guids(path) for path in found_materials]
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_extract_texture_guids, found_materials, chunksize=32))
+    
+    for material_path, (found_textures, error) in zip(found_materials, results):
         print(f"\n🔍 分析材质文件: {os.path.basename(material_path)}")
         
-        try:
-            with open(material_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 查找贴图引用
-            texture_patterns = [
-                r'texture:\s*{.*?guid:\s*([a-f0-9]{32})',
-                r'texture:\s*{.*?m_GUID:\s*([a-f0-9]{32})',
-                r'm_Texture:\s*{.*?guid:\s*([a-f0-9]{32})',
-                r'm_Texture:\s*{.*?m_GUID:\s*([a-f0-9]{32})',
-                r'"texture":\s*{[^}]*"guid":\s*"([a-f0-9]{32})"',
-                r'"texture":\s*{[^}]*"m_GUID":\s*"([a-f0-9]{32})"',
-                r'"m_Texture":\s*{[^}]*"guid":\s*"([a-f0-9]{32})"',
-                r'"m_Texture":\s*{[^}]*"m_GUID":\s*"([a-f0-9]{32})"',
-            ]
-            
-            found_textures = []
-            for pattern in texture_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    guid = match.lower()
-                    found_textures.append(guid)
-                    all_texture_guids.add(guid)
-            
-            if found_textures:
-                print(f"   🎨 找到 {len(found_textures)} 个贴图GUID:")
-                for guid in found_textures:
-                    print(f"      - {guid}")
-            else:
-                print(f"   ❌ 没有找到贴图引用")
-                
-        except Exception as e:
-            print(f"   ❌ 读取文件失败: {e}")
+        if error:
+            print(f"   ❌ 读取文件失败: {error}")
+            continue
+        
+        all_texture_guids.update(found_textures)
+        if found_textures:
+            print(f"   🎨 找到 {len(found_textures)} 个贴图GUID:")
+            for guid in found_textures:
+                print(f"      - {guid}")
+        else:
+            print(f"   ❌ 没有找到贴图引用")
     
     print(f"\n📊 总共找到 {len(all_texture_guids)} 个唯一的贴图GUID")
     
@@ -96,26 +123,20 @@ def check_material_textures():
         print(f"\n🔍 检查贴图GUID在SVN中的映射...")
         
         guid_map = {}
-        analyzer._scan_directory_for_guids(svn_root, guid_map)
+        analyzer._scan_directory_for_guids(svn_root, guid_map, wanted=all_texture_guids)
         
         found_in_svn = 0
         for guid in all_texture_guids:
             if guid in guid_map:
                 found_in_svn += 1
+                # guid_map中记录的已是资源文件路径（扫描时已去掉.meta后缀），无需再stat确认
                 file_path = guid_map[guid]
                 file_ext = os.path.splitext(file_path)[1].lower()
                 print(f"   ✅ {guid} -> {os.path.basename(file_path)} ({file_ext})")
                 
                 # 检查是否是图片文件
-                image_extensions = ['.png', '.jpg', '.jpeg', '.tga', '.psd', '.tiff', '.bmp']
-                if file_ext in image_extensions:
+                if file_ext in IMAGE_EXTENSIONS:
                     print(f"      🎉 这是图片文件!")
-                elif file_ext == '.meta':
-                    resource_file = file_path[:-5]
-                    if os.path.exists(resource_file):
-                        resource_ext = os.path.splitext(resource_file)[1].lower()
-                        if resource_ext in image_extensions:
-                            print(f"      🎉 对应的资源文件是图片!")
             else:
                 print(f"   ❌ {guid} -> 未找到")
         
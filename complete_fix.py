@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import ast
+
 def fix_material_template_method():
     """完全修复材质模板检查方法"""
     
@@ -11,24 +13,18 @@ def fix_material_template_method():
     # 找到有问题的方法并替换
     lines = content.split('\n')
     
-    # 找到方法的开始和结束位置
+    # 通过AST定位方法的开始和结束位置（lineno从1开始，end_lineno为方法最后一行）
     start_line = -1
     end_line = -1
     
-    for i, line in enumerate(lines):
-        if 'def _check_material_templates(self) -> List[Dict[str, str]]:' in line:
-            start_line = i
-        elif start_line != -1 and line.strip() and not line.startswith('    ') and not line.startswith('\t'):
-            end_line = i
+    tree = ast.parse(content)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == '_check_material_templates':
+            # 方法带装饰器时从第一个装饰器开始替换，避免残留的装饰器套到新方法上
+            start_line = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list]) - 1
+            end_line = node.end_lineno
             break
     
-    # 如果没有找到结束位置，查找下一个方法
-    if end_line == -1:
-        for i in range(start_line + 1, len(lines)):
-            if lines[i].strip() and lines[i].startswith('    def '):
-                end_line = i
-                break
-    
     if start_line == -1:
         print("没有找到方法开始位置")
         return
@@ -38,29 +34,13 @@ def fix_material_template_method():
         """检查材质模板使用情况"""
         issues = []
         
-        # 允许的材质模板列表
-        allowed_templates = {
-            'Character_NPR_Opaque.templatemat',
-            'Character_NPR_Masked.templatemat',
-            'Character_NPR_Tranclucent.templatemat',
-            'Character_AVATAR_Masked.templatemat',
-            'Character_AVATAR_Opaque.templatemat',
-            'Character_AVATAR_Tranclucent.templatemat',
-            'Character_PBR_Opaque.templatemat',
-            'Character_PBR_Translucent.templatemat',
-            'Scene_Prop_Opaque.templatemat',
-            'Scene_Prop_Tranclucent.templatemat',
-            'Scene_Prop_Masked.templatemat',
-            'Sight.templatemat'
-        }
-        
         try:
             self.status_updated.emit("🔍 开始材质模板检查...")
             
             # 筛选出需要检查的材质文件
             material_files = []
             for file_path in self.upload_files:
-                if not file_path.lower().endswith('.mat'):
+                if file_path[-4:].lower() != '.mat':
                     continue
                 
                 # 检查是否在entity目录下
@@ -116,7 +96,7 @@ def fix_material_template_method():
                             if template_name.startswith('TEMPLATE_GUID:'):
                                 continue
                             
-                            if template_name in allowed_templates:
+                            if template_name in ALLOWED_MATERIAL_TEMPLATES:
                                 # 记录使用了正确的模板（信息性）
                                 self.status_updated.emit(f"✅ {os.path.basename(file_path)} 使用了正确模板: {template_name}")
                                 found_valid_template = True
@@ -160,12 +140,9 @@ def fix_material_template_method():
             })
         
         return issues
-'''.split('\n')
+'''.rstrip('\n').split('\n')
     
     # 替换有问题的方法
-    if end_line == -1:
-        end_line = len(lines)
-    
     new_lines = lines[:start_line] + new_method + lines[end_line:]
     
     # 写回文件
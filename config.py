@@ -1,79 +1,162 @@
+import copy
 import json
 import os
-from typing import Dict, Any
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+
+# 优先使用orjson（可选依赖，解析/序列化更快且直接输出UTF-8字节），未安装时回退到标准库json
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    def _loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    def _loads(data: bytes):
+        return json.loads(data.decode('utf-8'))
+
+
+# 默认配置（只读，加载配置时按需复制，不直接修改）
+DEFAULT_CONFIG = {
+    "svn_path": "E:/newprefab04",
+    "git_path": "E:/git8a/assetruntimenew/CommonResource",
+    "window_geometry": {
+        "x": 100,
+        "y": 100,
+        "width": 1200,
+        "height": 800
+    },
+    "last_selected_branch": "",
+    "resource_types": {
+        "prefab": True,
+        "material": True,
+        "texture": True,
+        "animation": True,
+        "script": True
+    },
+    "recent_files": [],
+    "max_recent_files": 10
+}
+
+# 点分键查找缓存中表示“键不存在”的标记
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """拆分点分隔的配置键（配置键数量有限，结果缓存复用）"""
+    return tuple(key.split('.'))
 
 
 class ConfigManager:
     """配置管理器"""
     
+    # 修改配置后延迟写盘的时间（秒）
+    SAVE_DELAY = 0.5
+    
     def __init__(self, config_file: str = "config.json"):
         self.config_file = config_file
-        self.default_config = {
-                    "svn_path": "E:/newprefab04",
-        "git_path": "E:/git8a/assetruntimenew/CommonResource",
-            "window_geometry": {
-                "x": 100,
-                "y": 100,
-                "width": 1200,
-                "height": 800
-            },
-            "last_selected_branch": "",
-            "resource_types": {
-                "prefab": True,
-                "material": True,
-                "texture": True,
-                "animation": True,
-                "script": True
-            },
-            "recent_files": [],
-            "max_recent_files": 10
-        }
+        self.default_config = DEFAULT_CONFIG
         self.config = self.load_config()
+        # 内存中的配置是否有尚未写入磁盘的修改
+        self._dirty = False
+        # 延迟写盘：短时间内的多次修改合并为一次写入
+        self._timer = None
+        self._lock = threading.RLock()
+        # 点分键的查找结果缓存（set时清空）
+        self._get_cache: Dict[str, Any] = {}
     
     def load_config(self) -> Dict[str, Any]:
         """加载配置文件"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    # 合并默认配置，确保所有必需的键都存在
-                    merged_config = self.default_config.copy()
+                with open(self.config_file, 'rb') as f:
+                    config = _loads(f.read())
+                    # 合并默认配置，确保所有必需的键都存在（只复制配置文件中缺失的默认值，
+                    # 嵌套的默认值必须深拷贝，set会原地修改嵌套字典）
+                    merged_config = {key: config[key] if key in config else copy.deepcopy(value)
+                                     for key, value in self.default_config.items()}
                     merged_config.update(config)
                     return merged_config
             except Exception as e:
                 print(f"加载配置文件失败: {e}")
-                return self.default_config.copy()
+                return copy.deepcopy(self.default_config)
         else:
-            return self.default_config.copy()
+            return copy.deepcopy(self.default_config)
     
     def save_config(self):
-        """保存配置文件"""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"保存配置文件失败: {e}")
+        """保存配置文件（延迟SAVE_DELAY秒写盘，期间的多次保存请求合并为一次）"""
+        self._schedule_save()
+    
+    def flush(self):
+        """立即将配置写入磁盘（程序退出时调用，配置未修改且文件已存在时跳过写盘）"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty and os.path.exists(self.config_file):
+                return
+            try:
+                # 先写临时文件再原子替换，避免写入中断导致配置文件损坏
+                temp_file = self.config_file + '.tmp'
+                with open(temp_file, 'wb') as f:
+                    f.write(_dumps(self.config))
+                os.replace(temp_file, self.config_file)
+                self._dirty = False
+            except Exception as e:
+                print(f"保存配置文件失败: {e}")
+    
+    def _schedule_save(self):
+        """重新开始延迟写盘计时"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
     
     def get(self, key: str, default=None):
         """获取配置值"""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        return value
+        # 绝大多数配置键是顶层键，直接查字典
+        if '.' not in key:
+            return self.config.get(key, default)
+        
+        value = self._get_cache.get(key, None)
+        if value is None:
+            value = self.config
+            for k in _split_key(key):
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._get_cache[key] = value
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any):
-        """设置配置值"""
-        keys = key.split('.')
-        config = self.config
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        config[keys[-1]] = value
+        """设置配置值（仅修改内存，写盘由save_config统一完成）"""
+        with self._lock:
+            self._get_cache.clear()
+            if '.' not in key:
+                if key not in self.config or self.config[key] != value:
+                    self.config[key] = value
+                    self._dirty = True
+                return
+            keys = _split_key(key)
+            config = self.config
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            if keys[-1] not in config or config[keys[-1]] != value:
+                config[keys[-1]] = value
+                self._dirty = True
     
     def get_svn_path(self) -> str:
         return self.get("svn_path", "")
@@ -103,21 +186,26 @@ class ConfigManager:
     
     def add_recent_file(self, file_path: str):
         """添加最近使用的文件"""
-        recent_files = self.get("recent_files", [])
+        self.add_recent_files([file_path])
+    
+    def add_recent_files(self, file_paths: list):
+        """批量添加最近使用的文件
         
-        # 如果文件已存在，先移除
-        if file_path in recent_files:
-            recent_files.remove(file_path)
+        结果与依次调用add_recent_file相同（后添加的排在前面），但只做一次去重和截断。
+        """
+        # 后添加的文件排在最前，重复的文件以最后一次出现为准
+        seen = set()
+        new_files = []
+        for file_path in reversed(file_paths):
+            if file_path not in seen:
+                seen.add(file_path)
+                new_files.append(file_path)
         
-        # 添加到列表开头
-        recent_files.insert(0, file_path)
+        recent_files = new_files + [f for f in self.get("recent_files", []) if f not in seen]
         
         # 限制最大数量
         max_files = self.get("max_recent_files", 10)
-        if len(recent_files) > max_files:
-            recent_files = recent_files[:max_files]
-        
-        self.set("recent_files", recent_files)
+        self.set("recent_files", recent_files[:max_files])
     
     def get_recent_files(self) -> list:
         return self.get("recent_files", [])
@@ -24,8 +24,18 @@ def convert_to_ico(input_file, output_file="app_icon.ico"):
         # 创建多种尺寸的图标
         sizes = [(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)]
         
+        # 从大到小逐级用Lanczos缩放生成各尺寸图标（保持宽高比），
+        # 每一级以上一级为源图，不必每个尺寸都从原图重新缩放
+        resample = getattr(Image, 'Resampling', Image).LANCZOS
+        images = []
+        current = img
+        for size in reversed(sizes):
+            current = current.copy()
+            current.thumbnail(size, resample)
+            images.append(current)
+        
         # 保存为ico格式
-        img.save(output_file, format='ICO', sizes=sizes)
+        images[0].save(output_file, format='ICO', sizes=sizes, append_images=images[1:])
         
         print(f"✅ 成功转换: {input_file} -> {output_file}")
         print(f"📁 图标文件已保存到: {os.path.abspath(output_file)}")
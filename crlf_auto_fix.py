@@ -6,6 +6,7 @@ CRLF自动修复模块
 """
 
 import os
+import sys
 import subprocess
 import re
 import platform
@@ -17,6 +18,16 @@ if platform.system() == 'Windows':
 else:
     SUBPROCESS_FLAGS = 0
 
+# 从Git错误消息中提取问题文件的正则（模块加载时编译一次）
+# 常见的CRLF错误格式：
+# "warning: LF will be replaced by CRLF in path/to/file.ext"
+# "fatal: LF would be replaced by CRLF in path/to/file.ext"
+CRLF_ERROR_PATTERNS = (
+    re.compile(r'LF (?:will be|would be) replaced by CRLF in (.+)', re.MULTILINE),
+    re.compile(r'CRLF (?:will be|would be) replaced by LF in (.+)', re.MULTILINE),
+    re.compile(r'in file (.+?)(?:\s|$)', re.MULTILINE),  # 其他格式
+)
+
 
 class CRLFAutoFixer:
     """CRLF问题自动修复器"""
@@ -66,15 +77,18 @@ class CRLFAutoFixer:
             
             # 从错误消息中提取文件信息
             problematic_files = self._extract_problematic_files_from_error(error_message)
+            # 每个文件的扩展名只计算一次，供后续步骤共用
+            typed_files = [(file_path, sys.intern(os.path.splitext(file_path)[1].lower()))
+                           for file_path in problematic_files]
             
             # 创建或更新.gitattributes文件
-            success = self._create_smart_gitattributes(gitattributes_path, problematic_files)
+            success = self._create_smart_gitattributes(gitattributes_path, typed_files)
             if not success:
                 print(f"   ⚠️ .gitattributes 创建失败，继续尝试其他方法")
             
             # 3. 对于Unity特定的二进制文件，强制标记为binary
             print(f"   3. 处理Unity二进制文件...")
-            self._handle_unity_binary_files(problematic_files)
+            self._handle_unity_binary_files(typed_files)
             
             print(f"   ✅ CRLF问题自动修复完成")
             return True, "CRLF问题已自动修复"
@@ -85,23 +99,14 @@ class CRLFAutoFixer:
     def _extract_problematic_files_from_error(self, error_message: str) -> List[str]:
         """从Git错误消息中提取有问题的文件路径"""
         problematic_files = []
+        seen_files = set()
         
         try:
-            # 常见的CRLF错误格式：
-            # "warning: LF will be replaced by CRLF in path/to/file.ext"
-            # "fatal: LF would be replaced by CRLF in path/to/file.ext"
-            
-            patterns = [
-                r'LF (?:will be|would be) replaced by CRLF in (.+)',
-                r'CRLF (?:will be|would be) replaced by LF in (.+)',
-                r'in file (.+?)(?:\s|$)',  # 其他格式
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, error_message, re.MULTILINE)
-                for match in matches:
-                    file_path = match.strip().strip('"\'')
-                    if file_path and file_path not in problematic_files:
+            for pattern in CRLF_ERROR_PATTERNS:
+                for match in pattern.finditer(error_message):
+                    file_path = match.group(1).strip().strip('"\'')
+                    if file_path and file_path not in seen_files:
+                        seen_files.add(file_path)
                         problematic_files.append(file_path)
                         print(f"   检测到问题文件: {file_path}")
             
@@ -110,21 +115,27 @@ class CRLFAutoFixer:
         
         return problematic_files
     
-    def _create_smart_gitattributes(self, gitattributes_path: str, problematic_files: List[str]) -> bool:
-        """根据问题文件智能创建.gitattributes规则"""
+    def _create_smart_gitattributes(self, gitattributes_path: str, typed_files: List[Tuple[str, str]]) -> bool:
+        """根据问题文件智能创建.gitattributes规则（typed_files为(文件路径, 小写扩展名)列表）"""
         try:
-            # 检查现有内容
-            existing_content = ""
+            # 检查现有内容：一次解析出已有规则的文件模式，后续按集合判断是否已存在
+            existing_rules = set()
+            has_text_auto = False
             if os.path.exists(gitattributes_path):
                 with open(gitattributes_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    existing_content = f.read()
+                    for line in f:
+                        parts = line.split()
+                        if not parts or parts[0].startswith('#'):
+                            continue
+                        existing_rules.add(parts[0])
+                        if parts[0] == '*' and 'text=auto' in parts[1:]:
+                            has_text_auto = True
             
             # 分析文件扩展名
             extensions_to_fix = set()
             binary_extensions = {'.mesh', '.terraindata', '.cubemap', '.fbx', '.png', '.jpg', '.jpeg', '.gif', '.ico', '.dll', '.exe', '.so', '.dylib'}
             
-            for file_path in problematic_files:
-                ext = os.path.splitext(file_path)[1].lower()
+            for _, ext in typed_files:
                 if ext:
                     extensions_to_fix.add(ext)
             
@@ -132,7 +143,7 @@ class CRLFAutoFixer:
             new_rules = []
             
             # 添加基本规则（如果不存在）
-            if "* text=auto" not in existing_content:
+            if not has_text_auto:
                 new_rules.extend([
                     "",
                     "# Auto-generated CRLF fix rules",
@@ -144,7 +155,7 @@ class CRLFAutoFixer:
             for ext in extensions_to_fix:
                 rule_pattern = f"*{ext}"
                 
-                if rule_pattern not in existing_content:
+                if rule_pattern not in existing_rules:
                     if ext in binary_extensions:
                         new_rules.append(f"*{ext} binary")
                         print(f"   添加二进制规则: *{ext} binary")
@@ -166,32 +177,57 @@ class CRLFAutoFixer:
             print(f"   ❌ 创建智能.gitattributes失败: {e}")
             return False
     
-    def _handle_unity_binary_files(self, problematic_files: List[str]):
-        """特别处理Unity二进制文件"""
+    def _handle_unity_binary_files(self, typed_files: List[Tuple[str, str]]):
+        """特别处理Unity二进制文件（typed_files为(文件路径, 小写扩展名)列表）"""
         try:
             unity_binary_extensions = {'.mesh', '.terraindata', '.cubemap', '.asset'}
             
-            for file_path in problematic_files:
-                ext = os.path.splitext(file_path)[1].lower()
+            # 先收集所有需要处理的文件，再一次性交给git update-index，避免每个文件启动一个git进程
+            target_files = []
+            for file_path, ext in typed_files:
                 if ext in unity_binary_extensions:
                     print(f"   🎮 处理Unity二进制文件: {file_path}")
                     
                     # 对于这些文件，我们可以尝试重新设置文件属性
                     full_path = os.path.join(self.git_path, file_path)
                     if os.path.exists(full_path):
-                        # 使用git update-index来强制设置属性
-                        result = subprocess.run(['git', 'update-index', '--assume-unchanged', file_path], 
-                                              cwd=self.git_path, 
-                                              capture_output=True, 
-                                              text=True,
-                                              encoding='utf-8',
-                                              errors='ignore',
-                                              timeout=10, creationflags=SUBPROCESS_FLAGS)
-                        
-                        if result.returncode == 0:
-                            print(f"   ✅ Unity文件属性已设置: {file_path}")
-                        else:
-                            print(f"   ⚠️ Unity文件属性设置失败: {file_path}")
+                        target_files.append(file_path)
+            
+            if not target_files:
+                return
+            
+            # 只处理已被Git跟踪的文件：update-index遇到未跟踪的路径（如新添加的文件）会整批失败
+            result = subprocess.run(['git', '--literal-pathspecs', 'ls-files', '-z', '--'] + target_files,
+                                  cwd=self.git_path,
+                                  capture_output=True,
+                                  text=True,
+                                  encoding='utf-8',
+                                  errors='ignore',
+                                  timeout=30, creationflags=SUBPROCESS_FLAGS)
+            tracked_files = set(result.stdout.split('\0')) if result.returncode == 0 else set()
+            untracked_count = len(target_files)
+            target_files = [file_path for file_path in target_files
+                            if file_path.replace('\\', '/') in tracked_files]
+            untracked_count -= len(target_files)
+            if untracked_count:
+                print(f"   ⏭️ 跳过未被Git跟踪的Unity文件: {untracked_count} 个")
+            if not target_files:
+                return
+            
+            # 使用git update-index来强制设置属性（路径通过stdin批量传入）
+            result = subprocess.run(['git', 'update-index', '--assume-unchanged', '--stdin'], 
+                                  input='\n'.join(target_files) + '\n',
+                                  cwd=self.git_path, 
+                                  capture_output=True, 
+                                  text=True,
+                                  encoding='utf-8',
+                                  errors='ignore',
+                                  timeout=30, creationflags=SUBPROCESS_FLAGS)
+            
+            if result.returncode == 0:
+                print(f"   ✅ Unity文件属性已设置: {len(target_files)} 个文件")
+            else:
+                print(f"   ⚠️ Unity文件属性设置失败: {result.stderr.strip()}")
             
         except Exception as e:
             print(f"   ❌ 处理Unity二进制文件失败: {e}")
@@ -263,13 +299,21 @@ class CRLFAutoFixer:
             ]
             
             # 检查是否需要创建或更新
-            create_file = True
+            # 逐行读取，两条必要规则都找到后立即停止
+            has_text_auto = has_mesh_binary = False
             if os.path.exists(gitattributes_path):
                 with open(gitattributes_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    existing = f.read()
-                    if "* text=auto" in existing and "*.mesh binary" in existing:
-                        create_file = False
-                        print(f"   ✅ .gitattributes 已存在且包含必要规则")
+                    for line in f:
+                        if "* text=auto" in line:
+                            has_text_auto = True
+                        if "*.mesh binary" in line:
+                            has_mesh_binary = True
+                        if has_text_auto and has_mesh_binary:
+                            break
+            
+            create_file = not (has_text_auto and has_mesh_binary)
+            if not create_file:
+                print(f"   ✅ .gitattributes 已存在且包含必要规则")
             
             if create_file:
                 with open(gitattributes_path, 'w', encoding='utf-8', newline='\n') as f:
@@ -8,7 +8,35 @@ import re
 # 添加当前目录到路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from art_resource_manager import ResourceChecker
+from art_resource_manager import iter_folder_files, ALLOWED_MATERIAL_TEMPLATES
+from test_support import make_checker
+
+# 允许的材质模板列表（与检查器使用的同一份）
+ALLOWED_TEMPLATES = ALLOWED_MATERIAL_TEMPLATES
+
+# 模板引用模式合并为一个正则，每个文件只扫描一遍：
+# - templatemat:/template: 字段，优先取到 .templatemat 结尾，否则取整个字段值
+# - 任何 xxx.templatemat 文件名
+TEMPLATE_RE = re.compile(
+    r'(templatemat|template)\s*:\s*([^\s\n]+\.templatemat|[^\s\n]+)'
+    r'|([A-Za-z_][A-Za-z0-9_]*\.templatemat)',
+    re.IGNORECASE
+)
+
+# 已知模板名称（忽略大小写），用于没有找到模板引用时的手动搜索
+KNOWN_TEMPLATE_RE = re.compile('|'.join(map(re.escape, sorted(ALLOWED_TEMPLATES))), re.IGNORECASE)
+KNOWN_TEMPLATE_NAMES = {template.lower(): template for template in ALLOWED_TEMPLATES}
+
+
+def _describe_template_match(match) -> str:
+    """返回模板引用匹配所属的模式说明"""
+    if match.group(3):
+        return "任何templatemat文件"
+    field = match.group(1).lower()
+    if match.group(2).lower().endswith('.templatemat'):
+        return "直接templatemat引用" if field == 'templatemat' else "template引用"
+    return "templatemat字段值" if field == 'templatemat' else "template字段值"
+
 
 def debug_material_template():
     """调试材质模板检查问题"""
@@ -23,10 +51,9 @@ def debug_material_template():
     mat_files = []
     if os.path.exists(svn_path):
         print(f"✅ 找到SVN路径: {svn_path}")
-        for root, dirs, files in os.walk(svn_path):
-            for file in files:
-                if file.lower().endswith('.mat'):
-                    mat_files.append(os.path.join(root, file))
+        # scandir遍历，只对末尾4个字符做不区分大小写的扩展名判断
+        mat_files = [file_path for file_path in iter_folder_files(svn_path)
+                     if file_path[-4:].lower() == '.mat']
     else:
         print(f"❌ SVN路径不存在: {svn_path}")
         # 让用户手动输入文件路径
@@ -43,31 +70,10 @@ def debug_material_template():
     for i, file_path in enumerate(mat_files, 1):
         print(f"  {i}. {os.path.basename(file_path)}")
     
-    # 允许的材质模板列表
-    allowed_templates = {
-        'Character_NPR_Opaque.templatemat',
-        'Character_NPR_Masked.templatemat',
-        'Character_NPR_Tranclucent.templatemat',
-        'Character_AVATAR_Masked.templatemat',
-        'Character_AVATAR_Opaque.templatemat',
-        'Character_AVATAR_Tranclucent.templatemat',
-        'Character_PBR_Opaque.templatemat',
-        'Character_PBR_Translucent.templatemat',
-        'Scene_Prop_Opaque.templatemat',
-        'Scene_Prop_Tranclucent.templatemat',
-        'Scene_Prop_Masked.templatemat',
-        'Sight.templatemat'
-    }
-    
     print(f"\n🔍 开始逐个分析材质文件...")
     
     # 创建一个模拟的ResourceChecker实例
-    class MockGitManager:
-        def __init__(self):
-            self.git_path = ""
-            self.svn_path = ""
-    
-    checker = ResourceChecker(mat_files, MockGitManager(), "CommonResource")
+    checker = make_checker(mat_files)
     
     for i, file_path in enumerate(mat_files, 1):
         print(f"\n📄 分析文件 {i}/{len(mat_files)}: {os.path.basename(file_path)}")
@@ -126,31 +132,21 @@ def debug_material_template():
         # 4. 查找模板引用
         print(f"   🔍 步骤3: 查找模板引用...")
         
-        # 使用多种模式查找模板引用
-        template_patterns = [
-            (r'templatemat:\s*([^\s\n]+\.templatemat)', "直接templatemat引用"),
-            (r'template:\s*([^\s\n]+\.templatemat)', "template引用"),
-            (r'([A-Za-z_][A-Za-z0-9_]*\.templatemat)', "任何templatemat文件"),
-            (r'templatemat:\s*([^\s\n]+)', "templatemat字段值"),
-            (r'template:\s*([^\s\n]+)', "template字段值"),
-        ]
-        
         found_templates = []
-        for pattern, desc in template_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                template_name = match.strip()
-                if template_name not in found_templates:
-                    found_templates.append(template_name)
-                    print(f"   🔑 找到模板引用: {template_name} (通过: {desc})")
+        for match in TEMPLATE_RE.finditer(content):
+            template_name = (match.group(2) or match.group(3)).strip()
+            if template_name not in found_templates:
+                found_templates.append(template_name)
+                print(f"   🔑 找到模板引用: {template_name} (通过: {_describe_template_match(match)})")
         
         if not found_templates:
             print(f"   ❌ 没有找到任何模板引用")
             
             # 手动搜索是否包含任何已知模板名称
             print(f"   🔍 手动搜索已知模板名称...")
-            for template in allowed_templates:
-                if template.lower() in content.lower():
+            for match in KNOWN_TEMPLATE_RE.finditer(content):
+                template = KNOWN_TEMPLATE_NAMES[match.group(0).lower()]
+                if template not in found_templates:
                     print(f"   🔑 在内容中找到模板: {template}")
                     found_templates.append(template)
         
@@ -161,7 +157,7 @@ def debug_material_template():
             print(f"   ⚠️  警告: 没有找到模板引用")
         else:
             for template_name in found_templates:
-                if template_name in allowed_templates:
+                if template_name in ALLOWED_TEMPLATES:
                     print(f"   ✅ 模板 {template_name} 是允许的")
                 else:
                     print(f"   ❌ 模板 {template_name} 不在允许列表中")
@@ -4,11 +4,56 @@
 import os
 import sys
 import re
+import mmap
+import subprocess
 
 # 添加当前目录到路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from art_resource_manager import ResourceDependencyAnalyzer
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+
+from art_resource_manager import (ResourceDependencyAnalyzer, iter_folder_files,
+                                  SUBPROCESS_FLAGS, GUID_SCAN_WORKERS)
+from debug_support import load_or_build_guid_map, cached_find_svn_root
+
+# ripgrep搜索超时时间（秒）
+RG_TIMEOUT = 120
+
+# Python回退扫描时每个线程任务处理的meta文件数
+META_SEARCH_CHUNK_SIZE = 1000
+
+# 优先使用google-re2（可选依赖，DFA引擎，大文件扫描更快），未安装时回退到标准库re
+try:
+    import re2 as _guid_re_engine
+except ImportError:
+    _guid_re_engine = re
+
+# 通用32位十六进制GUID：只扫描一遍内容，再按命中位置之前的文本判断引用方式
+GUID_RE = _guid_re_engine.compile(rb'(?i)[a-f0-9]{32}')
+
+# 引用方式按从具体到通用排列，匹配GUID之前的文本（以\Z锚定在GUID起始处）；都不匹配时为通用32位十六进制
+GUID_PREFIX_PATTERNS = [
+    (re.compile(rb'texture:\s*{fileID:\s*0,\s*guid:\s*\Z', re.IGNORECASE), "材质贴图引用2"),
+    (re.compile(rb'texture:\s*{fileID:\s*\d+,\s*guid:\s*\Z', re.IGNORECASE), "材质贴图引用1"),
+    (re.compile(rb'texture:\s*{guid:\s*\Z', re.IGNORECASE), "材质贴图引用3"),
+    (re.compile(rb'"m_GUID":\s*"\Z', re.IGNORECASE), "JSON格式m_GUID"),
+    (re.compile(rb'm_GUID:\s*\Z', re.IGNORECASE), "YAML格式m_GUID"),
+    (re.compile(rb'guid:\s*\Z', re.IGNORECASE), "YAML格式guid"),
+]
+GENERIC_GUID_DESC = "通用32位十六进制"
+
+# 判断引用方式时回看的字节数（足够覆盖 "texture: {fileID: 2800000, guid: " 这类前缀）
+GUID_PREFIX_WINDOW = 64
+
+def _classify_guid_reference(content, guid_start):
+    """根据GUID之前的一小段字节判断其引用方式"""
+    prefix = content[max(0, guid_start - GUID_PREFIX_WINDOW):guid_start]
+    for pattern, desc in GUID_PREFIX_PATTERNS:
+        if pattern.search(prefix):
+            return desc
+    return GENERIC_GUID_DESC
 
 def debug_png_reference():
     """详细诊断PNG文件引用问题"""
@@ -33,63 +78,57 @@ def debug_png_reference():
     # 1. 详细分析文件内容
     print(f"\n🔍 步骤1: 详细分析文件内容...")
     try:
-        with open(test_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        print(f"📄 文件大小: {len(content)} 字符")
-        
-        # 查找所有可能的GUID引用
-        print(f"\n🔍 查找所有GUID引用...")
-        
-        # 更全面的GUID模式
-        guid_patterns = [
-            (r'"m_GUID":\s*"([a-f0-9]{32})"', "JSON格式m_GUID"),
-            (r'guid:\s*([a-f0-9]{32})', "YAML格式guid"),
-            (r'm_GUID:\s*([a-f0-9]{32})', "YAML格式m_GUID"),
-            (r'texture:\s*{fileID:\s*\d+,\s*guid:\s*([a-f0-9]{32})', "材质贴图引用1"),
-            (r'texture:\s*{fileID:\s*0,\s*guid:\s*([a-f0-9]{32})', "材质贴图引用2"),
-            (r'texture:\s*{guid:\s*([a-f0-9]{32})', "材质贴图引用3"),
-            (r'([a-f0-9]{32})', "通用32位十六进制"),
-        ]
-        
-        all_guids = {}
-        for pattern, desc in guid_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                guid = match.lower()
-                if guid not in all_guids:
-                    all_guids[guid] = []
-                all_guids[guid].append(desc)
-                print(f"🔑 找到GUID: {guid} (通过: {desc})")
-        
-        print(f"\n📊 总共找到 {len(all_guids)} 个唯一GUID")
-        
-        # 2. 检查目标GUID
         target_guid = "c7c65a3a6a7673649a64d18d99fd0f8f"
-        if target_guid in all_guids:
-            print(f"\n🎯 目标GUID已找到: {target_guid}")
-            print(f"   检测方式: {all_guids[target_guid]}")
-            
-            # 显示目标GUID的上下文
-            guid_index = content.lower().find(target_guid)
-            if guid_index != -1:
-                start = max(0, guid_index - 100)
-                end = min(len(content), guid_index + 100)
-                context = content[start:end]
-                print(f"   上下文:")
-                print(f"   {context}")
-        else:
-            print(f"\n❌ 目标GUID未找到: {target_guid}")
+        
+        # 以mmap映射文件按字节扫描，不把整个文件读成字符串，也不再生成小写副本
+        with open(test_file, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            print(f"📄 文件大小: {file_size} 字节")
+            # 空文件无法mmap
+            with (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if file_size else nullcontext(b'')) as content:
+                # 查找所有可能的GUID引用
+                print(f"\n🔍 查找所有GUID引用...")
+                
+                # 单次扫描找出所有GUID，每处命中再按前缀归入最先匹配的（最具体的）引用方式
+                all_guids = {}
+                guid_names = {}  # 原始字节 -> 规范化的小写GUID，同一GUID多次出现时只解码一次
+                target_offset = -1  # 目标GUID第一次出现的位置，供后面显示上下文
+                for match in GUID_RE.finditer(content):
+                    raw_guid = match.group()
+                    guid = guid_names.get(raw_guid)
+                    if guid is None:
+                        guid = guid_names[raw_guid] = raw_guid.decode('ascii').lower()
+                    if target_offset == -1 and guid == target_guid:
+                        target_offset = match.start()
+                    desc = _classify_guid_reference(content, match.start())
+                    all_guids.setdefault(guid, []).append(desc)
+                    print(f"🔑 找到GUID: {guid} (通过: {desc})")
+                
+                print(f"\n📊 总共找到 {len(all_guids)} 个唯一GUID")
+                
+                # 2. 检查目标GUID
+                if target_guid in all_guids:
+                    print(f"\n🎯 目标GUID已找到: {target_guid}")
+                    print(f"   检测方式: {all_guids[target_guid]}")
+                    
+                    # 显示目标GUID的上下文（位置在上面的扫描中已经记录，无需再次查找）
+                    if target_offset != -1:
+                        start = max(0, target_offset - 100)
+                        end = min(file_size, target_offset + 100)
+                        context = content[start:end].decode('utf-8', 'replace')
+                        print(f"   上下文:")
+                        print(f"   {context}")
+                else:
+                    print(f"\n❌ 目标GUID未找到: {target_guid}")
         
         # 3. 扫描SVN仓库
         print(f"\n🔍 步骤2: 扫描SVN仓库...")
-        svn_root = analyzer._find_svn_root_from_files([test_file])
+        svn_root = cached_find_svn_root(test_file)
         if svn_root:
             print(f"✅ 找到SVN根目录: {svn_root}")
             
-            # 扫描GUID映射
-            guid_map = {}
-            analyzer._scan_directory_for_guids(svn_root, guid_map)
+            # 扫描GUID映射（10分钟内复用磁盘缓存，需要强制重扫时调用clear_guid_map_cache）
+            guid_map = load_or_build_guid_map(analyzer, svn_root)
             print(f"✅ 扫描完成，找到 {len(guid_map)} 个GUID映射")
             
             # 检查目标GUID是否在映射中
@@ -167,26 +206,67 @@ def debug_png_reference():
         import traceback
         traceback.print_exc()
 
-def search_guid_in_svn(svn_root, target_guid):
-    """在SVN仓库中搜索包含指定GUID的文件"""
+def _guid_needles(target_guid, match_upper):
+    """返回要查找的GUID字面量：Unity写入meta的GUID为小写十六进制，只有需要时才额外查找全大写写法"""
+    needles = [target_guid.lower()]
+    if match_upper:
+        needles.append(target_guid.upper())
+    return needles
+
+def search_guid_in_svn(svn_root, target_guid, match_upper=False):
+    """在SVN仓库中搜索包含指定GUID的文件，优先使用ripgrep，未安装或执行失败时回退到Python扫描"""
+    patterns = []
+    for needle in _guid_needles(target_guid, match_upper):
+        patterns += ['-e', needle]
+    try:
+        result = subprocess.run(
+            ['rg', '--files-with-matches', '--no-messages', '--no-ignore', '--hidden',
+             '--fixed-strings', '-g', '*.meta', *patterns, svn_root],
+            capture_output=True, text=True, encoding='utf-8', errors='replace',
+            timeout=RG_TIMEOUT, creationflags=SUBPROCESS_FLAGS)
+    except (OSError, subprocess.TimeoutExpired):
+        return _search_guid_in_svn_python(svn_root, target_guid, match_upper)
+    
+    # rg返回码：0=有匹配，1=无匹配，其他=出错（回退到Python扫描）
+    if result.returncode == 0:
+        return result.stdout.splitlines()
+    if result.returncode == 1:
+        return []
+    return _search_guid_in_svn_python(svn_root, target_guid, match_upper)
+
+def _search_guid_in_svn_python(svn_root, target_guid, match_upper=False):
+    """纯Python实现的GUID搜索（ripgrep不可用时使用），按块分发给线程池并发读取"""
     found_files = []
+    # 直接在字节内容中查找，不创建字符串、不做小写转换
+    needles = tuple(needle.encode('ascii') for needle in _guid_needles(target_guid, match_upper))
     
     try:
-        for root, dirs, files in os.walk(svn_root):
-            for file in files:
-                if file.endswith('.meta'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            if target_guid.lower() in content.lower():
-                                found_files.append(file_path)
-                    except:
-                        continue
+        meta_files = iter_folder_files(svn_root, '.meta')
+        chunks = iter(lambda: list(islice(meta_files, META_SEARCH_CHUNK_SIZE)), [])
+        with ThreadPoolExecutor(max_workers=GUID_SCAN_WORKERS) as executor:
+            for matched in executor.map(lambda paths: _chunk_search(paths, needles), chunks):
+                found_files.extend(matched)
     except Exception as e:
         print(f"搜索GUID时出错: {e}")
     
     return found_files
 
+def _chunk_search(paths, needles):
+    """在一批meta文件中查找任一needle，返回命中的文件路径列表"""
+    matched = []
+    min_size = min(len(needle) for needle in needles)
+    for file_path in paths:
+        try:
+            with open(file_path, 'rb') as f:
+                # 比GUID还短的文件（包括无法mmap的空文件）不可能包含目标GUID
+                if os.fstat(f.fileno()).st_size < min_size:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    if any(content.find(needle) != -1 for needle in needles):
+                        matched.append(file_path)
+        except OSError:
+            continue
+    return matched
+
 if __name__ == "__main__":
     debug_png_reference() 
\ No newline at end of file
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+调试脚本共用的缓存辅助函数（不属于主程序）
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+from functools import lru_cache
+from typing import Dict
+
+# 添加当前目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from art_resource_manager import ResourceDependencyAnalyzer
+
+# GUID映射磁盘缓存有效期（秒）
+GUID_MAP_CACHE_TTL = 600
+
+# 进程内的GUID映射缓存：{svn_root: (根目录mtime, 载入时间, guid_map)}
+_guid_map_memory = {}
+
+# 缓存解析共用的分析器（只用到无状态的解析方法）
+_analyzer = ResourceDependencyAnalyzer()
+
+
+def _guid_map_cache_path(svn_root: str) -> str:
+    """返回svn_root对应的GUID映射缓存文件路径（位于系统临时目录）"""
+    digest = hashlib.md5(os.path.normcase(os.path.abspath(svn_root)).encode('utf-8')).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f'guidcache_{digest}.json')
+
+
+def load_or_build_guid_map(analyzer, svn_root: str, ttl: float = GUID_MAP_CACHE_TTL) -> Dict[str, str]:
+    """读取磁盘上的GUID映射缓存，过期（超过ttl秒）或根目录有变动时重新扫描并原子写回
+
+    同一进程内再次调用时优先复用内存中的结果，不必重新读取缓存文件。
+    """
+    root_mtime = os.stat(svn_root).st_mtime_ns
+    memory_entry = _guid_map_memory.get(svn_root)
+    if memory_entry and memory_entry[0] == root_mtime and time.time() - memory_entry[1] < ttl:
+        return memory_entry[2]
+
+    guid_map = _load_or_build_guid_map_file(analyzer, svn_root, root_mtime, ttl)
+    _guid_map_memory[svn_root] = (root_mtime, time.time(), guid_map)
+    return guid_map
+
+
+def _load_or_build_guid_map_file(analyzer, svn_root: str, root_mtime: int, ttl: float) -> Dict[str, str]:
+    """load_or_build_guid_map的磁盘缓存部分"""
+    cache_path = _guid_map_cache_path(svn_root)
+    try:
+        if time.time() - os.path.getmtime(cache_path) < ttl:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('svn_root') == svn_root and cached.get('root_mtime') == root_mtime:
+                return cached['guid_map']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    guid_map = {}
+    analyzer._scan_directory_for_guids(svn_root, guid_map)
+
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'svn_root': svn_root, 'root_mtime': root_mtime, 'guid_map': guid_map}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"写入GUID映射缓存失败: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return guid_map
+
+
+def clear_guid_map_cache(svn_root: str) -> bool:
+    """丢弃svn_root对应的GUID映射缓存（内存和磁盘），返回是否确实删除了磁盘文件"""
+    _guid_map_memory.pop(svn_root, None)
+    try:
+        os.remove(_guid_map_cache_path(svn_root))
+        return True
+    except FileNotFoundError:
+        return False
+
+
+@lru_cache(maxsize=256)
+def _cached_yaml_asset_guids(file_path: str, mtime_ns: int, size: int) -> frozenset:
+    """按(路径, mtime, 大小)缓存的YAML资源解析；文件变化后键随之变化，旧结果自然失效"""
+    with open(file_path, 'rb') as f:
+        content = f.read().decode('utf-8', 'replace')
+    return frozenset(_analyzer._parse_yaml_asset(content, file_path))
+
+
+def cached_parse_yaml_asset(file_path: str) -> frozenset:
+    """解析YAML格式的编辑器资源文件，文件未变化时直接复用上次的结果"""
+    stat = os.stat(file_path)
+    return _cached_yaml_asset_guids(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _cached_svn_root(file_dir: str) -> str:
+    """按所在目录缓存SVN根目录的查找结果"""
+    return _analyzer._find_svn_root_from_files([os.path.join(file_dir, '_')])
+
+
+def cached_find_svn_root(file_path: str) -> str:
+    """查找文件所在的SVN根目录，同一目录只向上查找一次"""
+    return _cached_svn_root(os.path.dirname(os.path.abspath(file_path)))
+
+
+def clear_caches(svn_root: str = None):
+    """清空调试用的进程内缓存；指定svn_root时同时删除其GUID映射磁盘缓存"""
+    _cached_yaml_asset_guids.cache_clear()
+    _cached_svn_root.cache_clear()
+    _guid_map_memory.clear()
+    if svn_root:
+        clear_guid_map_cache(svn_root)
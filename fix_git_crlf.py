@@ -7,26 +7,116 @@ Git CRLF 问题修复工具
 
 import os
 import sys
+import re
 import subprocess
 import argparse
 
+# 需要写入[core]段的换行符设置：(键, 值, 说明)
+CRLF_CORE_SETTINGS = [
+    ("autocrlf", "false", "禁用自动换行符转换"),
+    ("safecrlf", "false", "允许混合换行符"),
+    ("eol", "lf", "设置默认换行符为LF")
+]
+
+SECTION_HEADER_RE = re.compile(r'^\s*\[\s*([^\]\s"]+)\s*(?:"[^"]*")?\s*\]')
+CONFIG_KEY_RE = re.compile(r'^\s*([A-Za-z][A-Za-z0-9-]*)\s*(?:=|$)')
+
+def _write_text_atomic(path, text, newline='\n'):
+    """先写同目录下的临时文件，再用os.replace原子替换目标文件"""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline=newline) as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _find_git_config(git_path):
+    """定位仓库的config文件（兼容.git为gitdir指针文件的worktree/子模块），找不到时返回None"""
+    git_dir = os.path.join(git_path, '.git')
+    if os.path.isfile(git_dir):
+        with open(git_dir, 'r', encoding='utf-8') as f:
+            line = f.readline().strip()
+        if not line.startswith('gitdir:'):
+            return None
+        git_dir = os.path.normpath(os.path.join(git_path, line[len('gitdir:'):].strip()))
+        # worktree的config位于公共目录
+        commondir_file = os.path.join(git_dir, 'commondir')
+        if os.path.isfile(commondir_file):
+            with open(commondir_file, 'r', encoding='utf-8') as f:
+                git_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    config_path = os.path.join(git_dir, 'config')
+    return config_path if os.path.isfile(config_path) else None
+
+def _set_core_options(config_path, options):
+    """直接改写config文件[core]段中的指定键（只动这几行，其余内容原样保留），通过临时文件原子替换"""
+    with open(config_path, 'r', encoding='utf-8', newline='') as f:
+        lines = f.readlines()
+    newline = '\r\n' if lines and lines[0].endswith('\r\n') else '\n'
+    
+    pending = {key.lower(): value for key, value in options}
+    option_keys = set(pending)
+    output = []
+    in_core = False
+    core_end = None
+    for line in lines:
+        header = SECTION_HEADER_RE.match(line)
+        if header:
+            if in_core:
+                core_end = len(output)
+            in_core = header.group(1).lower() == 'core' and '"' not in line
+            output.append(line)
+            continue
+        if in_core:
+            key_match = CONFIG_KEY_RE.match(line)
+            if key_match and key_match.group(1).lower() in option_keys:
+                key = key_match.group(1).lower()
+                # 同一键出现多次时只保留第一处
+                if key in pending:
+                    output.append(f"\t{key} = {pending.pop(key)}{newline}")
+                continue
+        output.append(line)
+    if in_core:
+        core_end = len(output)
+    
+    missing = [f"\t{key} = {value}{newline}" for key, value in pending.items()]
+    if missing:
+        if core_end is None:
+            if output and not output[-1].endswith('\n'):
+                output[-1] += newline
+            output.append(f"[core]{newline}")
+            output.extend(missing)
+        else:
+            output[core_end:core_end] = missing
+    
+    _write_text_atomic(config_path, ''.join(output), newline='')
+
 def configure_git_crlf(git_path):
     """配置Git换行符设置"""
     print(f"🔧 正在配置Git换行符设置...")
     print(f"   Git仓库路径: {git_path}")
     
-    commands = [
-        ("core.autocrlf", "false", "禁用自动换行符转换"),
-        ("core.safecrlf", "false", "允许混合换行符"),
-        ("core.eol", "lf", "设置默认换行符为LF")
-    ]
+    for config_key, config_value, description in CRLF_CORE_SETTINGS:
+        print(f"   设置 core.{config_key} = {config_value} ({description})")
+    
+    # 直接改写config文件，不再逐项启动git子进程
+    try:
+        config_path = _find_git_config(git_path)
+        if config_path:
+            _set_core_options(config_path, [(key, value) for key, value, _ in CRLF_CORE_SETTINGS])
+            print(f"   ✅ 换行符设置已写入 {config_path}")
+            return True
+        print(f"   ⚠️ 未找到Git配置文件，改用git config逐项设置")
+    except Exception as e:
+        print(f"   ⚠️ 直接写入Git配置失败: {e}，改用git config逐项设置")
     
     success_count = 0
-    for config_key, config_value, description in commands:
+    for config_key, config_value, description in CRLF_CORE_SETTINGS:
         try:
-            print(f"   设置 {config_key} = {config_value} ({description})")
             result = subprocess.run(
-                ['git', 'config', config_key, config_value], 
+                ['git', 'config', f'core.{config_key}', config_value], 
                 cwd=git_path, 
                 capture_output=True, 
                 text=True,
@@ -34,15 +124,15 @@ def configure_git_crlf(git_path):
             )
             
             if result.returncode == 0:
-                print(f"   ✅ {config_key} 设置成功")
+                print(f"   ✅ core.{config_key} 设置成功")
                 success_count += 1
             else:
-                print(f"   ❌ {config_key} 设置失败: {result.stderr}")
+                print(f"   ❌ core.{config_key} 设置失败: {result.stderr}")
                 
         except Exception as e:
-            print(f"   ❌ {config_key} 设置异常: {e}")
+            print(f"   ❌ core.{config_key} 设置异常: {e}")
     
-    return success_count == len(commands)
+    return success_count == len(CRLF_CORE_SETTINGS)
 
 def create_gitattributes(git_path):
     """创建.gitattributes文件"""
@@ -97,8 +187,8 @@ def create_gitattributes(git_path):
 """
     
     try:
-        with open(gitattributes_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(content)
+        # 先写临时文件再原子替换，避免写入中断留下空的.gitattributes导致后续git操作异常
+        _write_text_atomic(gitattributes_path, content)
         print(f"   ✅ .gitattributes 文件创建成功")
         return True
     except Exception as e:
@@ -158,8 +248,10 @@ def check_git_status(git_path):
         )
         
         if result.returncode == 0:
-            if result.stdout.strip():
-                changes = len(result.stdout.strip().split('\n'))
+            output = result.stdout
+            if output.strip():
+                # porcelain输出每个变更一行，直接数换行符，不拆分成行列表
+                changes = output.count('\n') + (not output.endswith('\n'))
                 print(f"   📝 检测到 {changes} 个文件变更")
             else:
                 print(f"   ✅ 工作目录干净，没有待提交的更改")
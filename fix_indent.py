@@ -1,39 +1,67 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import re
+TARGET_FILE = 'art_resource_manager.py'
+MARKER = '# 查找模板引用'.encode('utf-8')
+
+# 需要修正缩进的行：去掉首尾空白后的内容 -> 修正后的整行
+FIXED_LINES = {
+    '# 查找模板引用': '                    # 查找模板引用',
+    'template_references = self._find_template_references(content)':
+        '                    template_references = self._find_template_references(content)',
+    'if not template_references:': '                    if not template_references:',
+    '# 没有找到模板引用，这可能是问题': '                        # 没有找到模板引用，这可能是问题',
+}
+
+def _line_bounds(data, pos):
+    """返回pos所在行的[起始, 结束)字节位置（结束位置为换行符处或文件末尾）"""
+    line_start = data.rfind(b'\n', 0, pos) + 1
+    line_end = data.find(b'\n', pos)
+    return line_start, (len(data) if line_end == -1 else line_end)
+
+def _keep_line_ending(original, fixed):
+    """返回替换后的行，保留原行的行尾（CRLF检出时按\n拆分后行尾残留\r）"""
+    return fixed + '\r' if original.endswith('\r') else fixed
 
 def fix_indentation():
     """修复art_resource_manager.py中的缩进问题"""
     
-    # 读取文件
-    with open('art_resource_manager.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+    # 以字节读取，直接定位标记所在位置，只拆分需要修复的那一段，不把整个文件拆成行列表
+    with open(TARGET_FILE, 'rb') as f:
+        data = f.read()
     
-    # 修复第4165行和第4166行的缩进问题
-    # 查找有问题的行
-    lines = content.split('\n')
+    # 查找有问题的行：标记行的下一行应为template_references赋值
+    idx = data.find(MARKER)
+    while idx != -1:
+        line_start, line_end = _line_bounds(data, idx)
+        next_start, next_end = _line_bounds(data, min(line_end + 1, len(data)))
+        if b'template_references' in data[next_start:next_end]:
+            break
+        idx = data.find(MARKER, line_end)
+    else:
+        print("未找到需要修复的位置")
+        return
     
-    # 修复第4165行前后的缩进
-    for i, line in enumerate(lines):
-        if '# 查找模板引用' in line and 'template_references' in lines[i+1]:
-            # 找到了有问题的行
-            lines[i] = '                    # 查找模板引用'
-            lines[i+1] = '                    template_references = self._find_template_references(content)'
-            
-            # 继续修复后面的缩进
-            j = i + 2
-            while j < len(lines) and lines[j].strip():
-                if lines[j].strip() == 'if not template_references:':
-                    lines[j] = '                    if not template_references:'
-                elif lines[j].strip() == '# 没有找到模板引用，这可能是问题':
-                    lines[j] = '                        # 没有找到模板引用，这可能是问题'
-                j += 1
+    # 修复范围：标记行开始，到其后第一个空行为止
+    region_end = next_end
+    while region_end < len(data):
+        start, end = _line_bounds(data, region_end + 1)
+        if not data[start:end].strip():
             break
+        region_end = end
+    
+    region_lines = data[line_start:region_end].decode('utf-8').split('\n')
+    region_lines[0] = _keep_line_ending(region_lines[0], FIXED_LINES['# 查找模板引用'])
+    region_lines[1] = _keep_line_ending(
+        region_lines[1], FIXED_LINES['template_references = self._find_template_references(content)'])
+    for j in range(2, len(region_lines)):
+        fixed = FIXED_LINES.get(region_lines[j].strip())
+        if fixed is not None:
+            region_lines[j] = _keep_line_ending(region_lines[j], fixed)
     
-    # 写回文件
-    with open('art_resource_manager.py', 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+    # 写回文件（仅替换修复范围内的字节）
+    with open(TARGET_FILE, 'wb') as f:
+        f.write(data[:line_start] + '\n'.join(region_lines).encode('utf-8') + data[region_end:])
     
     print("缩进修复完成")
 
@@ -4,9 +4,25 @@
 批量修复subprocess.run调用，添加Windows窗口隐藏标志
 """
 
-import re
+import ast
 import os
 
+# 插入到缺少定义的模块中：导入时求值一次，之后每次调用只是读取一个整数常量
+SUBPROCESS_FLAGS_DEFINITION = (
+    "\n# 添加Windows特定的subprocess标志（非Windows平台为0）\n"
+    "SUBPROCESS_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)\n"
+)
+
+def _defines_subprocess_flags(tree):
+    """判断模块是否已经定义或导入了SUBPROCESS_FLAGS"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id == 'SUBPROCESS_FLAGS' and isinstance(node.ctx, ast.Store):
+            return True
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if any((alias.asname or alias.name) == 'SUBPROCESS_FLAGS' for alias in node.names):
+                return True
+    return False
+
 def fix_subprocess_calls(file_path):
     """修复文件中的subprocess.run调用"""
     print(f"🔧 修复文件: {file_path}")
@@ -14,26 +30,61 @@ def fix_subprocess_calls(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # 匹配subprocess.run调用，但不包含creationflags参数
-    pattern = r'(subprocess\.run\([^)]*)\)'
+    # 通过AST找到所有未传creationflags的subprocess.run调用（支持参数中含括号及跨多行的调用）
+    source = content.encode('utf-8')
+    line_offsets = [0]
+    for line in source.splitlines(keepends=True):
+        line_offsets.append(line_offsets[-1] + len(line))
     
-    def replace_func(match):
-        call_str = match.group(1)
+    tree = ast.parse(content)
+    insert_positions = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr == 'run'
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == 'subprocess'):
+            continue
         
         # 如果已经包含creationflags，跳过
-        if 'creationflags' in call_str:
-            return match.group(0)
+        if any(keyword.arg == 'creationflags' for keyword in node.keywords):
+            continue
         
-        # 检查是否以逗号结尾
-        if call_str.rstrip().endswith(','):
-            # 在最后一个逗号后添加creationflags
-            return call_str + f' creationflags=SUBPROCESS_FLAGS)'
+        arguments = node.args + node.keywords
+        if arguments:
+            # 插在最后一个参数之后（end_col_offset为UTF-8字节偏移），原有的结尾逗号和注释都保留在其后
+            last = max(arguments, key=lambda arg: (arg.end_lineno, arg.end_col_offset))
+            insert_positions.append((line_offsets[last.end_lineno - 1] + last.end_col_offset,
+                                     b', creationflags=SUBPROCESS_FLAGS'))
         else:
-            # 在最后添加逗号和creationflags
-            return call_str + f', creationflags=SUBPROCESS_FLAGS)'
+            # 没有参数时插在右括号之前
+            insert_positions.append((line_offsets[node.end_lineno - 1] + node.end_col_offset - 1,
+                                     b'creationflags=SUBPROCESS_FLAGS'))
+    
+    if not insert_positions:
+        print(f"✅ 无需修复: {file_path}")
+        return
+    
+    # 从后往前插入，保证前面的偏移不受影响
+    for position, addition in sorted(insert_positions, reverse=True):
+        source = source[:position] + addition + source[position:]
+    
+    # 确保插入的SUBPROCESS_FLAGS在该模块中可以解析：缺少定义时补在最后一条模块级import之后
+    if not _defines_subprocess_flags(tree):
+        import_ends = [node.end_lineno for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+        definition_offset = line_offsets[max(import_ends)] if import_ends else 0
+        source = (source[:definition_offset] + SUBPROCESS_FLAGS_DEFINITION.encode('utf-8')
+                  + source[definition_offset:])
+        print(f"   已添加SUBPROCESS_FLAGS定义")
+    
+    new_content = source.decode('utf-8')
     
-    # 执行替换
-    new_content = re.sub(pattern, replace_func, content)
+    # 修改后的代码必须仍能解析，否则放弃写回，避免破坏原文件
+    try:
+        ast.parse(new_content)
+    except SyntaxError as e:
+        print(f"❌ 修复后的代码存在语法错误，未写回文件: {file_path} ({e})")
+        return
     
     # 写回文件
     with open(file_path, 'w', encoding='utf-8') as f:
@@ -8,6 +8,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from art_resource_manager import ResourceDependencyAnalyzer
+from debug_support import load_or_build_guid_map, cached_parse_yaml_asset, cached_find_svn_root
 
 def quick_test_png():
     """快速测试PNG引用问题"""
@@ -31,10 +32,8 @@ def quick_test_png():
     # 1. 直接测试YAML解析
     print(f"\n🔍 步骤1: 测试YAML解析...")
     try:
-        with open(test_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        yaml_guids = analyzer._parse_yaml_asset(content, test_file)
+        # 文件未变化时复用同一会话中上次的解析结果
+        yaml_guids = cached_parse_yaml_asset(test_file)
         print(f"✅ YAML解析找到 {len(yaml_guids)} 个GUID")
         
         target_guid = "c7c65a3a6a7673649a64d18d99fd0f8f"
@@ -44,6 +43,8 @@ def quick_test_png():
             print(f"❌ 目标GUID未找到: {target_guid}")
             
             # 手动搜索
+            with open(test_file, 'r', encoding='utf-8') as f:
+                content = f.read()
             if target_guid in content.lower():
                 print(f"✅ 在文件内容中找到目标GUID")
             else:
@@ -55,12 +56,12 @@ def quick_test_png():
     
     # 2. 测试SVN扫描
     print(f"\n🔍 步骤2: 测试SVN扫描...")
-    svn_root = analyzer._find_svn_root_from_files([test_file])
+    svn_root = cached_find_svn_root(test_file)
     if svn_root:
         print(f"✅ 找到SVN根目录: {svn_root}")
         
-        guid_map = {}
-        analyzer._scan_directory_for_guids(svn_root, guid_map)
+        # 扫描GUID映射（10分钟内复用磁盘缓存，需要强制重扫时调用clear_guid_map_cache）
+        guid_map = load_or_build_guid_map(analyzer, svn_root)
         print(f"✅ 扫描完成，找到 {len(guid_map)} 个GUID映射")
         
         if target_guid in guid_map:
@@ -92,7 +93,8 @@ def quick_test_png():
     print(f"   缺失依赖: {result['analysis_stats']['total_missing']}")
     
     # 检查PNG文件
-    png_files = [f for f in result['dependency_files'] if f.lower().endswith('.png')]
+    # 只对扩展名部分做小写转换，不转换整条路径
+    png_files = [f for f in result['dependency_files'] if f[-4:].lower() == '.png']
     if png_files:
         print(f"\n🎉 找到 {len(png_files)} 个PNG文件:")
         for png_file in png_files:
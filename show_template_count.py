@@ -7,136 +7,73 @@ import sys
 # 添加当前目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from art_resource_manager import ResourceChecker
+from art_resource_manager import ALLOWED_MATERIAL_TEMPLATES
+
+# 允许的模板列表直接取自ResourceChecker使用的常量，避免两处维护
+ALLOWED_TEMPLATES = ALLOWED_MATERIAL_TEMPLATES
+
+# 新增的特效和粒子模板（从允许列表中按前缀筛选）
+NEW_FX_TEMPLATES = frozenset(
+    t for t in ALLOWED_TEMPLATES if t.startswith(('fx_', 'standard_particle_', 'PolarDistortion'))
+)
+
+# 模板分类：(名称前缀, 分类名)，按顺序匹配，前缀为None的一项兜底
+TEMPLATE_CATEGORIES = (
+    ('Character_', '角色模板'),
+    ('Scene_', '场景模板'),
+    ('fx_', '特效模板'),
+    ('standard_particle_', '粒子模板'),
+    (None, '其他模板'),
+)
+CATEGORY_PREFIXES = tuple(prefix for prefix, _ in TEMPLATE_CATEGORIES if prefix)
+OTHER_CATEGORY = TEMPLATE_CATEGORIES[-1][1]
+
+def _bucket_templates():
+    """单次遍历按前缀把模板分桶，返回 {分类名: 排序后的模板元组}"""
+    buckets = {name: [] for _, name in TEMPLATE_CATEGORIES}
+    for template in ALLOWED_TEMPLATES:
+        # 先用一次startswith(元组)判断是否属于任何已知分类
+        if not template.startswith(CATEGORY_PREFIXES):
+            buckets[OTHER_CATEGORY].append(template)
+            continue
+        for prefix, name in TEMPLATE_CATEGORIES:
+            if template.startswith(prefix):
+                buckets[name].append(template)
+                break
+    return {name: tuple(sorted(templates)) for name, templates in buckets.items()}
+
+# 各分类的模板列表（导入时分好类并排序，之后只需格式化输出）
+TEMPLATE_BUCKETS = _bucket_templates()
 
 def show_template_count():
     """显示所有允许的模板数量和列表"""
     
-    print("🔍 查看所有允许的材质模板")
-    print("=" * 60)
-    
-    # 创建一个临时的ResourceChecker实例来获取模板列表
-    class MockGitManager:
-        def __init__(self):
-            self.git_path = ""
-            self.svn_path = ""
-    
-    checker = ResourceChecker([], MockGitManager(), "CommonResource")
-    
-    # 获取允许的模板列表 (从代码中提取)
-    allowed_templates = {
-        # 角色和场景模板
-        'Character_NPR_Opaque.templatemat',
-        'Character_NPR_Masked.templatemat',
-        'Character_NPR_Tranclucent.templatemat',
-        'Character_AVATAR_Masked.templatemat',
-        'Character_AVATAR_Opaque.templatemat',
-        'Character_AVATAR_Tranclucent.templatemat',
-        'Character_PBR_Opaque.templatemat',
-        'Character_PBR_Translucent.templatemat',
-        'Scene_Prop_Opaque.templatemat',
-        'Scene_Prop_Tranclucent.templatemat',
-        'Scene_Prop_Masked.templatemat',
-        'Sight.templatemat',
-        
-        # 特效模板
-        'fx_basic_ADD.templatemat',
-        'fx_basic_fire.templatemat',
-        'fx_basic_TRANSLUCENT.templatemat',
-        'fx_dissolve_ADD.templatemat',
-        'fx_dissolve_fresnel_ADD.templatemat',
-        'fx_dissolve_fresnel_TRANSLUCENT.templatemat',
-        'fx_dissolve_fresneluvwarp_ADD.templatemat',
-        'fx_dissolve_fresneluvwarp_TRANSLUCENT.templatemat',
-        'fx_dissolve_TRANSLUCENT.templatemat',
-        'fx_dissolve_uvwarp_ADD.templatemat',
-        'fx_dissolve_uvwarp_Fire_ADD.templatemat',
-        'fx_dissolve_uvwarp_Fire_TRANSLUCENT.templatemat',
-        'fx_dissolve_uvwarp_TRANSLUCENT.templatemat',
-        'fx_dissolve_vertexesoffsetWithMask_ADD.templatemat',
-        'fx_dissolve_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
-        'fx_fresnel_ADD.templatemat',
-        'fx_fresnel_TRANSLUCENT.templatemat',
-        'fx_uvwarp_ADD.templatemat',
-        'fx_uvwarp_TRANSLUCENT.templatemat',
-        'fx_vertexesoffset_ADD.templatemat',
-        'fx_vertexesoffset_TRANSLUCENT.templatemat',
-        'fx_vertexesoffsetWithMask_ADD.templatemat',
-        'fx_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
-        'PolarDistortion.templatemat',
-        'standard_particle_additive.templatemat',
-        'standard_particle_translucent.templatemat'
-    }
-    
-    # 分类显示
-    character_templates = [t for t in allowed_templates if t.startswith('Character_')]
-    scene_templates = [t for t in allowed_templates if t.startswith('Scene_')]
-    fx_templates = [t for t in allowed_templates if t.startswith('fx_')]
-    particle_templates = [t for t in allowed_templates if t.startswith('standard_particle_')]
-    other_templates = [t for t in allowed_templates if not any(t.startswith(prefix) for prefix in ['Character_', 'Scene_', 'fx_', 'standard_particle_'])]
-    
-    print(f"📊 模板统计:")
-    print(f"   总计: {len(allowed_templates)} 个模板")
-    print(f"   角色模板: {len(character_templates)} 个")
-    print(f"   场景模板: {len(scene_templates)} 个")
-    print(f"   特效模板: {len(fx_templates)} 个")
-    print(f"   粒子模板: {len(particle_templates)} 个")
-    print(f"   其他模板: {len(other_templates)} 个")
-    
-    print(f"\n📋 详细列表:")
+    # 输出先收集到列表中，最后一次性写出
+    lines = []
+    emit = lines.append
     
-    print(f"\n【角色模板】({len(character_templates)} 个):")
-    for template in sorted(character_templates):
-        print(f"   - {template}")
+    emit("🔍 查看所有允许的材质模板")
+    emit("=" * 60)
     
-    print(f"\n【场景模板】({len(scene_templates)} 个):")
-    for template in sorted(scene_templates):
-        print(f"   - {template}")
+    emit(f"📊 模板统计:")
+    emit(f"   总计: {len(ALLOWED_TEMPLATES)} 个模板")
+    for _, name in TEMPLATE_CATEGORIES:
+        emit(f"   {name}: {len(TEMPLATE_BUCKETS[name])} 个")
     
-    print(f"\n【特效模板】({len(fx_templates)} 个):")
-    for template in sorted(fx_templates):
-        print(f"   - {template}")
+    emit(f"\n📋 详细列表:")
     
-    print(f"\n【粒子模板】({len(particle_templates)} 个):")
-    for template in sorted(particle_templates):
-        print(f"   - {template}")
+    for _, name in TEMPLATE_CATEGORIES:
+        emit(f"\n【{name}】({len(TEMPLATE_BUCKETS[name])} 个):")
+        for template in TEMPLATE_BUCKETS[name]:
+            emit(f"   - {template}")
     
-    print(f"\n【其他模板】({len(other_templates)} 个):")
-    for template in sorted(other_templates):
-        print(f"   - {template}")
+    emit(f"\n🎯 新增的特效模板:")
     
-    print(f"\n🎯 新增的特效模板:")
-    new_fx_templates = [
-        'fx_basic_ADD.templatemat',
-        'fx_basic_fire.templatemat',
-        'fx_basic_TRANSLUCENT.templatemat',
-        'fx_dissolve_ADD.templatemat',
-        'fx_dissolve_fresnel_ADD.templatemat',
-        'fx_dissolve_fresnel_TRANSLUCENT.templatemat',
-        'fx_dissolve_fresneluvwarp_ADD.templatemat',
-        'fx_dissolve_fresneluvwarp_TRANSLUCENT.templatemat',
-        'fx_dissolve_TRANSLUCENT.templatemat',
-        'fx_dissolve_uvwarp_ADD.templatemat',
-        'fx_dissolve_uvwarp_Fire_ADD.templatemat',
-        'fx_dissolve_uvwarp_Fire_TRANSLUCENT.templatemat',
-        'fx_dissolve_uvwarp_TRANSLUCENT.templatemat',
-        'fx_dissolve_vertexesoffsetWithMask_ADD.templatemat',
-        'fx_dissolve_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
-        'fx_fresnel_ADD.templatemat',
-        'fx_fresnel_TRANSLUCENT.templatemat',
-        'fx_uvwarp_ADD.templatemat',
-        'fx_uvwarp_TRANSLUCENT.templatemat',
-        'fx_vertexesoffset_ADD.templatemat',
-        'fx_vertexesoffset_TRANSLUCENT.templatemat',
-        'fx_vertexesoffsetWithMask_ADD.templatemat',
-        'fx_vertexesoffsetWithMask_TRANSLUCENT.templatemat',
-        'PolarDistortion.templatemat',
-        'standard_particle_additive.templatemat',
-        'standard_particle_translucent.templatemat'
-    ]
+    emit(f"   本次新增: {len(NEW_FX_TEMPLATES)} 个特效和粒子模板")
+    emit(f"   从原来的 12 个模板增加到现在的 {len(ALLOWED_TEMPLATES)} 个模板")
     
-    print(f"   本次新增: {len(new_fx_templates)} 个特效和粒子模板")
-    print(f"   从原来的 12 个模板增加到现在的 {len(allowed_templates)} 个模板")
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     show_template_count() 
\ No newline at end of file
@@ -13,9 +13,10 @@ def main():
         print("安装PyInstaller...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
     
-    # 执行打包
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
+    # 执行打包：在当前进程中直接调用PyInstaller，省去再启动一个解释器
+    import PyInstaller.__main__
+    
+    pyinstaller_args = [
         "--onefile",
         "--windowed", 
         "--name=美术资源上传工具",
@@ -23,10 +24,18 @@ def main():
         "art_resource_manager.py"
     ]
     
-    print("执行命令:", " ".join(cmd))
-    result = subprocess.run(cmd)
+    print("执行命令: PyInstaller", " ".join(pyinstaller_args))
+    try:
+        PyInstaller.__main__.run(pyinstaller_args)
+        success = True
+    except SystemExit as e:
+        # PyInstaller出错时通过SystemExit退出
+        success = not e.code
+    except Exception as e:
+        print(f"PyInstaller执行异常: {e}")
+        success = False
     
-    if result.returncode == 0:
+    if success:
         print("打包成功!")
     else:
         print("打包失败!")
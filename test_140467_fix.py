@@ -7,7 +7,8 @@ import sys
 # 添加当前目录到路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from art_resource_manager import ResourceChecker
+from art_resource_manager import iter_folder_files
+from test_support import make_checker
 
 def test_140467_fix():
     """测试140467文件的材质模板检查修复"""
@@ -23,12 +24,11 @@ def test_140467_fix():
     
     mat_files = []
     if os.path.exists(svn_path):
-        for root, dirs, files in os.walk(svn_path):
-            for file in files:
-                if file.lower().endswith('.mat'):
-                    full_path = os.path.join(root, file)
-                    mat_files.append(full_path)
-                    print(f"✅ 找到材质文件: {full_path}")
+        # 基于scandir逐个产出文件，只对扩展名部分做忽略大小写的比较
+        for full_path in iter_folder_files(svn_path):
+            if full_path[-4:].lower() == '.mat':
+                mat_files.append(full_path)
+                print(f"✅ 找到材质文件: {full_path}")
     
     if not mat_files:
         print("❌ 没有找到材质文件")
@@ -37,12 +37,7 @@ def test_140467_fix():
     print(f"📁 总共找到 {len(mat_files)} 个材质文件")
     
     # 创建ResourceChecker实例
-    class MockGitManager:
-        def __init__(self):
-            self.git_path = ""
-            self.svn_path = ""
-    
-    checker = ResourceChecker(mat_files, MockGitManager(), "CommonResource")
+    checker = make_checker(mat_files)
     
     # 运行材质模板检查
     print("\n🔍 运行材质模板检查...")
@@ -52,19 +47,19 @@ def test_140467_fix():
     print(f"   发现问题数量: {len(issues)}")
     
     if issues:
-        # 按类型分组问题
+        # 按类型分组问题，同时每个文件只计算一次文件名
         issue_types = {}
+        filenames = {}
         for issue in issues:
-            issue_type = issue.get('type', 'unknown')
-            if issue_type not in issue_types:
-                issue_types[issue_type] = []
-            issue_types[issue_type].append(issue)
+            issue_types.setdefault(issue.get('type', 'unknown'), []).append(issue)
+            if issue['file'] not in filenames:
+                filenames[issue['file']] = os.path.basename(issue['file'])
         
         print(f"\n📋 问题详情:")
         for issue_type, type_issues in issue_types.items():
             print(f"   {issue_type}: {len(type_issues)} 个")
             for issue in type_issues:
-                filename = os.path.basename(issue['file'])
+                filename = filenames[issue['file']]
                 message = issue['message']
                 template_name = issue.get('template_name', 'N/A')
                 print(f"     - {filename}: {message}")
@@ -14,37 +14,25 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from art_resource_manager import ResourceDependencyAnalyzer
 
-def create_test_files():
-    """创建测试文件"""
-    test_dir = tempfile.mkdtemp()
-    print(f"📁 创建测试目录: {test_dir}")
+# 测试文件结构
+TEST_FILE_NAMES = (
+    # 原始文件
+    "test.prefab",
+    "test.prefab.meta",
+    "material.mat",
+    "material.mat.meta",
+    "texture.png",
+    "texture.png.meta",
     
-    # 创建测试文件结构
-    files_to_create = [
-        # 原始文件
-        "test.prefab",
-        "test.prefab.meta",
-        "material.mat",
-        "material.mat.meta",
-        "texture.png",
-        "texture.png.meta",
-        
-        # 依赖文件
-        "dependency.fbx",
-        "dependency.fbx.meta",
-        "shader.shader",
-        "shader.shader.meta",
-    ]
-    
-    for file_name in files_to_create:
-        file_path = os.path.join(test_dir, file_name)
-        with open(file_path, 'w') as f:
-            if file_name.endswith('.meta'):
-                # 创建meta文件内容
-                f.write(f"guid: {file_name.replace('.meta', '').replace('.', '')}123456789abcdef\n")
-            elif file_name == 'test.prefab':
-                # 创建prefab文件，引用其他文件
-                f.write('''
+    # 依赖文件
+    "dependency.fbx",
+    "dependency.fbx.meta",
+    "shader.shader",
+    "shader.shader.meta",
+)
+
+# prefab文件，引用其他文件
+PREFAB_BODY = '''
 {
   "m_GUID": "test123456789abcdef123456789abcdef",
   "materials": [
@@ -58,20 +46,42 @@ def create_test_files():
     }
   ]
 }
-                ''')
-            elif file_name == 'material.mat':
-                # 创建材质文件，引用着色器
-                f.write('''
+                '''
+
+# 材质文件，引用着色器
+MATERIAL_BODY = '''
 {
   "m_GUID": "material123456789abcdef123456789abcdef",
   "shader": {
     "m_GUID": "shader123456789abcdef123456789abcdef"
   }
 }
-                ''')
-            else:
-                # 其他文件
-                f.write(f"# Test file: {file_name}\n")
+                '''
+
+META_TEMPLATE = "guid: {}123456789abcdef\n"
+OTHER_FILE_TEMPLATE = "# Test file: {}\n"
+
+def _iter_test_file_specs():
+    """逐个产出 (文件名, 文件内容)"""
+    for file_name in TEST_FILE_NAMES:
+        if file_name.endswith('.meta'):
+            # 去掉末尾的.meta用切片，只对剩余部分做一次replace
+            yield file_name, META_TEMPLATE.format(file_name[:-len('.meta')].replace('.', ''))
+        elif file_name == 'test.prefab':
+            yield file_name, PREFAB_BODY
+        elif file_name == 'material.mat':
+            yield file_name, MATERIAL_BODY
+        else:
+            yield file_name, OTHER_FILE_TEMPLATE.format(file_name)
+
+def create_test_files():
+    """创建测试文件"""
+    test_dir = tempfile.mkdtemp()
+    print(f"📁 创建测试目录: {test_dir}")
+    
+    for file_name, body in _iter_test_file_specs():
+        with open(os.path.join(test_dir, file_name), 'w') as f:
+            f.write(body)
     
     return test_dir
 
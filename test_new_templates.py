@@ -11,6 +11,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from art_resource_manager import ResourceChecker
 
+# 应被识别为有效的特效模板
+VALID_FX_TEMPLATES = (
+    "fx_basic_ADD.templatemat",
+    "fx_dissolve_ADD.templatemat",
+    "standard_particle_additive.templatemat",
+    "PolarDistortion.templatemat",
+)
+
 def test_new_templates():
     """测试新添加的特效模板是否正确工作"""
     
@@ -177,16 +185,9 @@ Material:
         
         # 检查特效模板是否被正确识别
         print(f"\n🔍 检查特效模板识别情况:")
-        valid_fx_templates = [
-            "fx_basic_ADD.templatemat",
-            "fx_dissolve_ADD.templatemat", 
-            "standard_particle_additive.templatemat",
-            "PolarDistortion.templatemat"
-        ]
-        
-        for template in valid_fx_templates:
-            found_issue = any(issue.get('template_name') == template for issue in issues)
-            if found_issue:
+        reported_templates = {issue.get('template_name') for issue in issues}
+        for template in VALID_FX_TEMPLATES:
+            if template in reported_templates:
                 print(f"   ❌ {template} 被错误地报告为问题")
             else:
                 print(f"   ✅ {template} 被正确识别为有效模板")
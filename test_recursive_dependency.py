@@ -3,12 +3,26 @@
 
 import os
 import sys
+import re
 
 # 添加当前目录到路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from art_resource_manager import ResourceDependencyAnalyzer
 
+# 贴图引用模式（模块加载时编译一次）
+_RAW_TEXTURE_PATTERNS = (
+    r'texture:\s*{.*?guid:\s*([a-f0-9]{32})',
+    r'texture:\s*{.*?m_GUID:\s*([a-f0-9]{32})',
+    r'm_Texture:\s*{.*?guid:\s*([a-f0-9]{32})',
+    r'm_Texture:\s*{.*?m_GUID:\s*([a-f0-9]{32})',
+    r'"texture":\s*{[^}]*"guid":\s*"([a-f0-9]{32})"',
+    r'"texture":\s*{[^}]*"m_GUID":\s*"([a-f0-9]{32})"',
+    r'"m_Texture":\s*{[^}]*"guid":\s*"([a-f0-9]{32})"',
+    r'"m_Texture":\s*{[^}]*"m_GUID":\s*"([a-f0-9]{32})"',
+)
+TEXTURE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in _RAW_TEXTURE_PATTERNS)
+
 def test_recursive_dependency():
     """测试递归依赖分析功能"""
     
@@ -51,7 +65,7 @@ def test_recursive_dependency():
         print("   ❌ 没有找到PNG文件")
     
     # 检查材质文件
-    mat_files = [f for f in result['dependency_files'] if f.lower().endswith('.mat')]
+    mat_files = [f for f in result['dependency_files'] if f[-4:].lower() == '.mat']
     print(f"\n🎨 找到的材质文件: {len(mat_files)}")
     
     if mat_files:
@@ -80,21 +94,9 @@ def test_recursive_dependency():
                     content = f.read()
                 
                 # 查找贴图引用
-                import re
-                texture_patterns = [
-                    r'texture:\s*{.*?guid:\s*([a-f0-9]{32})',
-                    r'texture:\s*{.*?m_GUID:\s*([a-f0-9]{32})',
-                    r'm_Texture:\s*{.*?guid:\s*([a-f0-9]{32})',
-                    r'm_Texture:\s*{.*?m_GUID:\s*([a-f0-9]{32})',
-                    r'"texture":\s*{[^}]*"guid":\s*"([a-f0-9]{32})"',
-                    r'"texture":\s*{[^}]*"m_GUID":\s*"([a-f0-9]{32})"',
-                    r'"m_Texture":\s*{[^}]*"guid":\s*"([a-f0-9]{32})"',
-                    r'"m_Texture":\s*{[^}]*"m_GUID":\s*"([a-f0-9]{32})"',
-                ]
-                
                 found_textures = []
-                for pattern in texture_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
+                for pattern in TEXTURE_PATTERNS:
+                    matches = pattern.findall(content)
                     for match in matches:
                         guid = match.lower()
                         if guid not in found_textures:
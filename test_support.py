@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试/调试脚本共用的辅助对象
+"""
+
+import os
+import sys
+
+# 添加当前目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from art_resource_manager import ResourceChecker
+
+
+class MockGitManager:
+    """ResourceChecker所需的最小Git管理器替身，只提供git_path和svn_path"""
+    __slots__ = ('git_path', 'svn_path')
+    
+    def __init__(self, git_path: str = "", svn_path: str = ""):
+        self.git_path = git_path
+        self.svn_path = svn_path
+
+
+def make_checker(files: list, target_directory: str = "CommonResource",
+                 git_path: str = "", svn_path: str = "") -> ResourceChecker:
+    """创建使用MockGitManager的ResourceChecker（每次返回新实例）"""
+    return ResourceChecker(list(files), MockGitManager(git_path, svn_path), target_directory)